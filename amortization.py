@@ -1,25 +1,32 @@
-def generate_schedule(
+from typing import Iterator
+
+from schedule import COLUMNS, Schedule
+
+
+def iter_periods(
     mortgage,
     extra_payment: float = 0.0,
     lump_sum: float = 0.0,
     lump_sum_month: int = 0,
-) -> list[dict]:
+    start: int = 1,
+    balance: float | None = None,
+    checkpoints=None,
+) -> Iterator[tuple]:
     """
-    Generate a full amortization schedule.
+    Yield (period, payment, principal, interest, balance) one period at a time.
 
-    Parameters
-    ----------
-    mortgage        : Mortgage dataclass instance
-    extra_payment   : additional amount added to every monthly payment
-    lump_sum        : one-time prepayment applied at lump_sum_month
-    lump_sum_month  : period number at which the lump sum is applied
+    This is the engine behind generate_schedule and iter_schedule; plain
+    tuples are the cheapest rows to hand to a writer or a Schedule.
+    start / balance resume the schedule at period `start` from the
+    unrounded balance left after the period before it.  If `checkpoints`
+    is given, the unrounded balance after every period is appended to it,
+    which is exactly what a later resume needs.
     """
-    balance  = mortgage.principal
+    balance  = mortgage.principal if balance is None else balance
     base_emi = mortgage.emi()
     r        = mortgage.periodic_rate()
-    schedule = []
 
-    for period in range(1, mortgage.total_payments() + 1):
+    for period in range(start, mortgage.total_payments() + 1):
         interest  = balance * r
         principal = base_emi - interest + extra_payment
 
@@ -36,15 +43,53 @@ def generate_schedule(
             actual_payment = base_emi + extra_payment
             balance       -= principal
 
-        schedule.append({
-            "period":    period,
-            "payment":   round(actual_payment, 2),
-            "principal": round(principal,      2),
-            "interest":  round(interest,       2),
-            "balance":   round(balance,        2),
-        })
+        if checkpoints is not None:
+            checkpoints.append(balance)
+
+        yield (
+            period,
+            round(actual_payment, 2),
+            round(principal,      2),
+            round(interest,       2),
+            round(balance,        2),
+        )
 
         if balance <= 0:
             break
 
-    return schedule
\ No newline at end of file
+
+def generate_schedule(
+    mortgage,
+    extra_payment: float = 0.0,
+    lump_sum: float = 0.0,
+    lump_sum_month: int = 0,
+) -> Schedule:
+    """
+    Generate a full amortization schedule.
+
+    Parameters
+    ----------
+    mortgage        : Mortgage dataclass instance
+    extra_payment   : additional amount added to every monthly payment
+    lump_sum        : one-time prepayment applied at lump_sum_month
+    lump_sum_month  : period number at which the lump sum is applied
+    """
+    schedule = Schedule()
+    schedule.extend(iter_periods(mortgage, extra_payment, lump_sum, lump_sum_month))
+    return schedule
+
+
+def iter_schedule(
+    mortgage,
+    extra_payment: float = 0.0,
+    lump_sum: float = 0.0,
+    lump_sum_month: int = 0,
+) -> Iterator[dict]:
+    """
+    Streaming variant of generate_schedule.
+
+    Yields the same row dicts one period at a time without holding the
+    schedule in memory, for feeding a CSV writer, socket or aggregator.
+    """
+    for values in iter_periods(mortgage, extra_payment, lump_sum, lump_sum_month):
+        yield dict(zip(COLUMNS, values))
@@ -0,0 +1,234 @@
+"""
+batch.py  –  Vectorized amortization engine for many loans at once.
+
+Computes the same period / payment / principal / interest / balance columns
+as amortization.generate_schedule, but steps every loan in the batch through
+each period together using NumPy arrays instead of one Python loop per loan.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from schedule import Schedule
+
+
+@dataclass
+class BatchSchedule:
+    """
+    Schedules for a batch of loans, stored as (loans × periods) arrays.
+
+    Row i holds loan i; column j holds period j + 1.  Periods after a loan
+    closes are left at zero, and `months[i]` is the number of rows that
+    generate_schedule would have returned for that loan.
+    """
+    months:    np.ndarray
+    payment:   np.ndarray
+    principal: np.ndarray
+    interest:  np.ndarray
+    balance:   np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.months)
+
+    def total_interest(self) -> np.ndarray:
+        return self.interest.sum(axis=1)
+
+    def yearly(self, payments_per_year: int = 12) -> tuple[np.ndarray, ...]:
+        """
+        Fold the period axis into years.
+
+        Returns (years, interest, principal, balance): `years[i]` is how many
+        (possibly partial) years loan i runs, and the other three are
+        (loans × years) arrays of interest paid, principal paid and ending
+        balance, zero past each loan's last year.
+        """
+        loans, width = self.interest.shape
+        n_years = -(-width // payments_per_year)
+        pad     = ((0, 0), (0, n_years * payments_per_year - width))
+        shape   = (loans, n_years, payments_per_year)
+
+        interest  = np.pad(self.interest,  pad).reshape(shape).sum(axis=2)
+        principal = np.pad(self.principal, pad).reshape(shape).sum(axis=2)
+        round2(interest)
+        round2(principal)
+
+        years = -(-self.months // payments_per_year)
+        last  = np.minimum(np.arange(1, n_years + 1) * payments_per_year,
+                           self.months[:, None]) - 1
+        balance = np.take_along_axis(self.balance, np.maximum(last, 0), axis=1)
+        balance[np.arange(n_years) >= years[:, None]] = 0.0
+
+        return years, interest, principal, balance
+
+    def schedule(self, i: int) -> Schedule:
+        """Return loan i as a Schedule whose columns are views into the batch."""
+        m = int(self.months[i])
+        return Schedule(
+            np.arange(1, m + 1),
+            self.payment[i, :m],
+            self.principal[i, :m],
+            self.interest[i, :m],
+            self.balance[i, :m],
+        )
+
+
+def _growth(rate: np.ndarray, periods: np.ndarray) -> np.ndarray:
+    """
+    (1 + r) ** n for every loan.
+
+    NumPy's vectorized pow can differ from Python's in the last bit, which is
+    enough to move a rounded paisa now and then.  Loan books contain only a
+    few hundred distinct (rate, tenure) pairs, so compute those with Python's
+    pow (bit-identical to mortgage.growth_factor) and scatter the results
+    back.  The shared growth_factor cache is left to quote traffic, which a
+    book with many distinct rates would otherwise flush.
+    """
+    rates, rate_code = np.unique(rate,    return_inverse=True)
+    terms, term_code = np.unique(periods, return_inverse=True)
+    span             = len(terms)
+    codes, inverse   = np.unique(rate_code.ravel() * span + term_code.ravel(),
+                                 return_inverse=True)
+    rates, terms     = rates.tolist(), terms.tolist()
+    unique = np.array([(1 + rates[c // span]) ** int(terms[c % span]) for c in codes.tolist()])
+    return unique[inverse.ravel()]
+
+
+def round2(values: np.ndarray) -> None:
+    """
+    Round to 2 decimals in place, exactly like Python's round(x, 2).
+
+    np.round scales by 100 first, so a value that sits just below a half
+    paisa can be pushed onto it and rounded the other way.  Those near-ties
+    are rare; re-round just them with Python's correctly rounded round().
+    """
+    scaled = values * 100
+    near   = np.nonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    exact  = [round(float(v), 2) for v in values[near]]
+    np.round(values, 2, out=values)
+    values[near] = exact
+
+
+def batch_emi(principal, annual_rate, years, payments_per_year=12) -> np.ndarray:
+    """EMI for every loan; matches Mortgage.emi() element by element."""
+    p, rate, yrs, ppy = np.broadcast_arrays(
+        np.asarray(principal, dtype=float), np.asarray(annual_rate, dtype=float),
+        np.asarray(years, dtype=int), np.asarray(payments_per_year, dtype=int),
+    )
+    r = rate / 100 / ppy
+    n = yrs * ppy
+    g = _growth(r.ravel(), n.ravel()).reshape(r.shape)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        emi = p * r * g / (g - 1)
+    return np.where(r == 0, p / n, emi)
+
+
+def batch_payoff(principal, annual_rate, years, payments_per_year=12) -> tuple[np.ndarray, ...]:
+    """
+    (emi, months, total interest) for every loan paid at its EMI, with no
+    prepayment; matches Mortgage.emi() and prepayment.solve_payoff() element
+    by element, including the smaller final instalment.
+    """
+    p, rate, yrs, ppy = (a.ravel() for a in np.broadcast_arrays(
+        np.asarray(principal, dtype=float), np.asarray(annual_rate, dtype=float),
+        np.asarray(years, dtype=int), np.asarray(payments_per_year, dtype=int),
+    ))
+    r   = rate / 100 / ppy
+    n   = yrs * ppy
+    emi = batch_emi(p, rate, yrs, ppy)
+
+    # Balance before the final instalment, then the interest on every payment
+    g = _growth(r, np.maximum(n - 1, 0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        before = np.where(r == 0, p - emi * (n - 1), p * g - emi * (g - 1) / r)
+    before   = np.where(n > 1, before, p)
+    interest = emi * (n - 1) - (p - before) + before * r
+    owed     = p > 0
+    return emi, np.where(owed, n, 0), np.where(owed, interest, 0.0)
+
+
+def loan_columns(loans: list[tuple]) -> list[list]:
+    """
+    Split (principal, rate, years[, extra, lump, lump_month]) tuples into
+    the six argument columns of generate_schedules.
+    """
+    defaults = (0.0, 0.0, 0.0, 0.0, 0.0, 0)
+    rows     = [tuple(loan) + defaults[len(loan):] for loan in loans]
+    if not rows:
+        return [[] for _ in defaults]
+    return [list(col) for col in zip(*rows)]
+
+
+def generate_schedules(
+    principal,
+    annual_rate,
+    years,
+    extra_payment=0.0,
+    lump_sum=0.0,
+    lump_sum_month=0,
+    payments_per_year=12,
+) -> BatchSchedule:
+    """
+    Generate amortization schedules for a whole batch of loans.
+
+    Every argument may be a scalar or a 1-D array; they are broadcast
+    against each other, so a single extra_payment can apply to the whole
+    book.  Results match generate_schedule() for each loan to the paisa.
+    """
+    p, rate, yrs, extra, lump, lump_month, ppy = (
+        a.ravel() for a in np.broadcast_arrays(
+            np.asarray(principal,         dtype=float),
+            np.asarray(annual_rate,       dtype=float),
+            np.asarray(years,             dtype=int),
+            np.asarray(extra_payment,     dtype=float),
+            np.asarray(lump_sum,          dtype=float),
+            np.asarray(lump_sum_month,    dtype=int),
+            np.asarray(payments_per_year, dtype=int),
+        )
+    )
+    r        = rate / 100 / ppy
+    n        = yrs * ppy
+    base_emi = batch_emi(p, rate, yrs, ppy)
+    regular  = base_emi + extra
+    width    = int(n.max()) if len(n) else 0
+
+    shape     = (len(p), width)
+    payment   = np.zeros(shape)
+    principal = np.zeros(shape)
+    interest  = np.zeros(shape)
+    balance   = np.zeros(shape)
+    months    = np.zeros(len(p), dtype=int)
+
+    bal    = p.copy()
+    active = n > 0
+
+    for j in range(width):
+        period = j + 1
+        idx    = np.flatnonzero(active)
+        if not len(idx):
+            break
+
+        b     = bal[idx]
+        i_amt = b * r[idx]
+        p_amt = base_emi[idx] - i_amt + extra[idx]
+        p_amt = np.where(lump_month[idx] == period, p_amt + lump[idx], p_amt)
+
+        # Cap principal so we never overpay on the final instalment
+        closed = p_amt >= b
+        p_amt  = np.where(closed, b, p_amt)
+        pay    = np.where(closed, p_amt + i_amt, regular[idx])
+        b      = np.where(closed, 0.0, b - p_amt)
+
+        payment[idx, j]   = pay
+        principal[idx, j] = p_amt
+        interest[idx, j]  = i_amt
+        balance[idx, j]   = b
+        bal[idx]          = b
+        months[idx]       = period
+
+        active[idx] = (b > 0) & (period < n[idx])
+
+    for col in (payment, principal, interest, balance):
+        round2(col)
+
+    return BatchSchedule(months, payment, principal, interest, balance)
@@ -0,0 +1,77 @@
+"""
+bench_columnar.py  –  Columnar .npz export vs the CSV portfolio export.
+
+Writes the same synthetic loan book with export.export_portfolio_csv and
+columnar.write_npz, then reads each back, and reports time and on-disk
+size for both.
+
+    python benchmarks/bench_columnar.py --loans 5000
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from columnar import read_npz, write_npz
+from export import export_portfolio_csv
+
+
+def make_book(n: int, seed: int = 42) -> list[tuple]:
+    rng = random.Random(seed)
+    return [
+        (round(rng.uniform(5e5, 2e7), 2),
+         rng.choice([6.5, 7.2, 7.5, 8.1, 9.5]),
+         rng.choice([15, 20, 25, 30]))
+        for _ in range(n)
+    ]
+
+
+def read_csv_files(paths: list[str]) -> int:
+    rows = 0
+    for path in paths:
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader)
+            for row in reader:
+                [float(x) for x in row]
+                rows += 1
+    return rows
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--loans", type=int, default=2000)
+    args = parser.parse_args()
+    book = make_book(args.loans)
+
+    with tempfile.TemporaryDirectory() as out:
+        stats, csv_write = timed(export_portfolio_csv, os.path.join(out, "csv"), book)
+        _, csv_read      = timed(read_csv_files, stats["files"])
+        csv_size         = sum(os.path.getsize(p) for p in stats["files"])
+
+        npz_path         = os.path.join(out, "book.npz")
+        _, npz_write     = timed(write_npz, npz_path, book)
+        _, npz_read      = timed(read_npz, npz_path)
+        npz_size         = os.path.getsize(npz_path)
+
+    print(f"{'Format':<8} {'Write s':>9} {'Read s':>9} {'Size MB':>9}")
+    print(f"{'CSV':<8} {csv_write:>9.2f} {csv_read:>9.2f} {csv_size / 1e6:>9.1f}")
+    print(f"{'NPZ':<8} {npz_write:>9.2f} {npz_read:>9.2f} {npz_size / 1e6:>9.1f}")
+    print(f"\n  {csv_size / npz_size:.1f}x smaller, "
+          f"{csv_read / npz_read:.0f}x faster to read, "
+          f"{csv_write / npz_write:.1f}x faster to write")
+
+
+if __name__ == "__main__":
+    main()
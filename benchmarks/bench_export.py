@@ -0,0 +1,73 @@
+"""
+bench_export.py  –  Throughput benchmark for export.export_portfolio_csv.
+
+Streams a synthetic loan book to CSV and reports MB/s and rows/s for
+plain, gzip and (if available) zstd output, then peak traced memory at
+two book sizes.  Peak memory should stay flat as --loans grows.
+
+    python benchmarks/bench_export.py --loans 2000 --shard-size 500
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from export import export_portfolio_csv
+
+
+def make_book(n: int, seed: int = 42):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield (round(rng.uniform(5e5, 2e7), 2),
+               rng.choice([6.5, 7.2, 7.5, 8.1, 9.5]),
+               rng.choice([15, 20, 25, 30]))
+
+
+def run(loans: int, compression: str | None, shard_size: int | None) -> None:
+    with tempfile.TemporaryDirectory() as out:
+        start = time.perf_counter()
+        try:
+            stats = export_portfolio_csv(out, make_book(loans), compression=compression,
+                                         shard_size=shard_size)
+        except ImportError as exc:
+            print(f"{str(compression):<8} skipped: {exc}")
+            return
+        elapsed = time.perf_counter() - start
+
+        on_disk = sum(os.path.getsize(p) for p in stats["files"])
+        print(f"{str(compression):<8} {elapsed:>8.2f} {stats['rows'] / elapsed:>12,.0f}"
+              f" {stats['chars'] / elapsed / 1e6:>10.1f} {on_disk / 1e6:>10.1f}")
+
+
+def peak_memory(loans: int) -> float:
+    """Peak traced memory in MB (tracing is slow, so this is a separate pass)."""
+    with tempfile.TemporaryDirectory() as out:
+        tracemalloc.start()
+        export_portfolio_csv(out, make_book(loans))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return peak / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--loans",      type=int, default=1000)
+    parser.add_argument("--shard-size", type=int, default=None)
+    args = parser.parse_args()
+
+    print(f"{'Codec':<8} {'Seconds':>8} {'Rows/s':>12} {'MB/s':>10} {'Disk MB':>10}")
+    for compression in (None, "gzip", "zstd"):
+        run(args.loans, compression, args.shard_size)
+
+    print(f"\n{'Loans':>8} {'Peak MB':>10}")
+    for loans in (max(1, args.loans // 2), args.loans):
+        print(f"{loans:>8} {peak_memory(loans):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+bench_floating.py  –  Closed-form floating-rate engine vs month-by-month stepping.
+
+Builds random rate paths with quarterly resets for a 20-year loan and
+reports rate paths per second for floating_payoff_paths, floating_payoff
+and a period-by-period run of the same paths, in both reset modes.
+tests/test_floating.py checks that the three agree.
+
+    python benchmarks/bench_floating.py --paths 100000 --every 3
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from floating import (_annuity, _periods_needed, floating_payoff, floating_payoff_paths,
+                      rate_segments)
+from mortgage import Mortgage
+
+
+def stepped(mortgage, resets, mode: str, max_years: int = 40) -> tuple[int, float]:
+    """(months, total interest) stepping every period with the engine's rules."""
+    ppy, end, limit = mortgage.payments_per_year, mortgage.total_payments(), max_years * 12
+    changes = dict(rate_segments(mortgage.annual_rate, resets))
+    balance, emi, r = mortgage.principal, None, 0.0
+    period, interest_paid = 0, 0.0
+    while balance > 0 and period < end:
+        period += 1
+        if period in changes:
+            r = changes[period] / 100 / ppy
+            if mode == "emi" or emi is None:
+                emi = _annuity(balance, r, end - period + 1)
+            elif period - 1 + _periods_needed(balance, r, emi) > limit:
+                end, emi = limit, _annuity(balance, r, limit - period + 1)
+            else:
+                end = period - 1 + _periods_needed(balance, r, emi)
+        interest = balance * r
+        interest_paid += interest
+        balance = 0.0 if emi - interest >= balance else balance - (emi - interest)
+    return period, interest_paid
+
+
+def random_paths(n: int, years: int, every: int = 3, seed: int = 42):
+    """(reset periods, (n, resets) rate matrix) for a random walk from 8.5%."""
+    rng     = np.random.default_rng(seed)
+    periods = np.arange(1 + every, years * 12, every)
+    steps   = rng.normal(0, 0.35, (n, len(periods)))
+    return periods, np.round(np.clip(8.5 + steps.cumsum(axis=1), 4.0, 18.0), 2)
+
+
+def rate(label: str, paths: int, elapsed: float) -> None:
+    print(f"{label:<28} {paths / elapsed:>12,.0f} paths/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--paths", type=int, default=100_000)
+    parser.add_argument("--every", type=int, default=3, help="months between resets")
+    parser.add_argument("--scalar", type=int, default=500,
+                        help="paths to time one at a time")
+    args = parser.parse_args()
+
+    loan           = Mortgage(5_000_000, 8.5, 20)
+    periods, rates = random_paths(args.paths, loan.years, args.every)
+    sample         = [list(zip(periods.tolist(), row)) for row in rates[:args.scalar].tolist()]
+    print(f"{len(periods) + 1} segments per path")
+
+    for mode in ("emi", "tenure"):
+        start = time.perf_counter()
+        floating_payoff_paths(loan, periods, rates, mode)
+        rate(f"{mode}: numpy, all paths", args.paths, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for path in sample:
+            floating_payoff(loan, path, mode, detail=False)
+        rate(f"{mode}: one path at a time", len(sample), time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for path in sample:
+            stepped(loan, path, mode)
+        rate(f"{mode}: month by month", len(sample), time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
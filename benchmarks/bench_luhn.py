@@ -0,0 +1,86 @@
+"""
+bench_luhn.py  –  Bulk Luhn check and masking vs the per-card functions.
+
+Generates a newline-separated file of random 16-digit PANs (plus a smaller
+set with spaces and mixed lengths), then times credit_bulk against
+credit_tool.luhn_check / mask_number and checks that both agree.
+
+    python benchmarks/bench_luhn.py --cards 10000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from credit_bulk import card_matrix, check_cards, luhn_valid, mask_numbers
+from credit_tool import luhn_check, mask_number
+
+
+def fixed_width(n: int, digits: int = 16, seed: int = 42) -> bytes:
+    rng   = np.random.default_rng(seed)
+    chars = rng.integers(ord("0"), ord("9") + 1, (n, digits + 1), dtype=np.uint8)
+    chars[:, -1] = ord("\n")
+    return chars.tobytes()
+
+
+def mixed(n: int, seed: int = 7) -> bytes:
+    rng  = np.random.default_rng(seed)
+    pans = []
+    for length in rng.choice([13, 15, 16, 19], n):
+        pan = "".join(map(str, rng.integers(0, 10, length)))
+        pans.append(" ".join(pan[i:i + 4] for i in range(0, len(pan), 4)))
+    return ("\n".join(pans) + "\n").encode()
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def report(label: str, cards: int, bulk: float, scalar: float) -> None:
+    print(f"{label:<22} {cards / bulk / 1e6:>10.2f} {cards / scalar / 1e6:>10.3f} "
+          f"{scalar / bulk:>9.0f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cards",  type=int, default=10_000_000)
+    parser.add_argument("--scalar", type=int, default=200_000,
+                        help="cards to time with the per-card functions")
+    args = parser.parse_args()
+
+    data = fixed_width(args.cards)
+    pans = data[: (args.scalar * 17)].decode().split()
+
+    (valid, masked), t_check = timed(check_cards, data)
+    chars                    = card_matrix(data)
+    _, t_luhn                = timed(luhn_valid, chars)
+    _, t_mask                = timed(mask_numbers, chars)
+    ref_valid, s_luhn        = timed(lambda: [luhn_check(p) for p in pans])
+    ref_mask,  s_mask        = timed(lambda: [mask_number(p) for p in pans])
+
+    n = len(pans)
+    assert valid[:n].tolist() == ref_valid
+    assert [m.decode() for m in masked[:n].tolist()] == ref_mask
+
+    print(f"{'Path (M cards/s)':<22} {'Bulk':>10} {'Per card':>10} {'Speedup':>10}")
+    report("luhn, 16 digits",  args.cards, t_luhn,  s_luhn / n * args.cards)
+    report("mask, 16 digits",  args.cards, t_mask,  s_mask / n * args.cards)
+    report("both, from buffer", args.cards, t_check,
+           (s_luhn + s_mask) / n * args.cards)
+
+    data = mixed(args.scalar)
+    pans = data.decode().splitlines()
+    (valid, masked), t_mixed = timed(check_cards, data)
+    _, s_mixed = timed(lambda: [(luhn_check(p), mask_number(p)) for p in pans])
+    assert valid.tolist() == [luhn_check(p) for p in pans]
+    report("both, mixed/spaced", len(pans), t_mixed, s_mixed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+bench_pdf.py  –  PDF rendering time for long schedules.
+
+Compares three ways of rendering a 30-year (360-row) loan report:
+  truncated  : export_pdf default (first 24 schedule rows)
+  paragraph  : every row through the Paragraph-per-cell _data_table
+  long-table : export_pdf(full_schedule=True) with the shared-style LongTable
+
+    python benchmarks/bench_pdf.py --repeat 5
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pdf
+from amortization import generate_schedule
+from mortgage import Mortgage
+from yearly_summary import generate_yearly_summary
+
+
+def make_payload(years: int) -> dict:
+    loan     = Mortgage(5_000_000, 8.5, years)
+    schedule = generate_schedule(loan)
+    return {
+        "loan": {
+            "principal":      loan.principal,
+            "rate":           loan.annual_rate,
+            "years":          loan.years,
+            "emi":            loan.emi(),
+            "total_interest": schedule.total_interest(),
+            "months":         len(schedule),
+        },
+        "schedule": schedule,
+        "yearly":   generate_yearly_summary(schedule),
+    }
+
+
+def paragraph_full(path: str, data: dict) -> None:
+    """The pre-existing table path, extended to every row."""
+    doc  = pdf._report_doc(path)
+    rows = [[str(r["period"]), f"${r['payment']:,.2f}", f"${r['principal']:,.2f}",
+             f"${r['interest']:,.2f}", f"${r['balance']:,.2f}"]
+            for r in data["schedule"]]
+    doc.build([pdf._data_table(["Month", "Payment", "Principal", "Interest", "Balance"],
+                               rows)])
+
+
+def best_of(repeat: int, fn, *args) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--years",  type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    data = make_payload(args.years)
+
+    with tempfile.TemporaryDirectory() as out:
+        path = os.path.join(out, "report.pdf")
+        runs = {
+            "truncated":  lambda: pdf.export_pdf(path, data),
+            "paragraph":  lambda: paragraph_full(path, data),
+            "long-table": lambda: pdf.export_pdf(path, data, full_schedule=True),
+        }
+        print(f"{'Path':<12} {'Best s':>8}   ({len(data['schedule'])} schedule rows)")
+        for name, fn in runs.items():
+            print(f"{name:<12} {best_of(args.repeat, fn):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
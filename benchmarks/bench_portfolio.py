@@ -0,0 +1,57 @@
+"""
+bench_portfolio.py  –  Scaling benchmark for portfolio.run_portfolio.
+
+Amortizes the same synthetic loan book with 1, 2, ... N workers and prints
+wall time, loans/s and speedup relative to a single worker.
+
+    python benchmarks/bench_portfolio.py --loans 100000 --max-workers 8
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from portfolio import run_portfolio
+
+
+def make_book(n: int, seed: int = 42) -> list[tuple]:
+    rng = random.Random(seed)
+    return [
+        (round(rng.uniform(5e5, 2e7), 2),
+         rng.choice([6.5, 7.2, 7.5, 8.1, 9.5]),
+         rng.choice([15, 20, 25, 30]))
+        for _ in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--loans",       type=int, default=20000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size",  type=int, default=2000)
+    args = parser.parse_args()
+
+    book = make_book(args.loans)
+    print(f"{'Workers':>8} {'Seconds':>10} {'Loans/s':>12} {'Speedup':>9}")
+
+    baseline = None
+    reference = None
+    for workers in range(1, args.max_workers + 1):
+        start   = time.perf_counter()
+        result  = run_portfolio(book, workers=workers, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - start
+
+        baseline  = baseline or elapsed
+        reference = reference or result
+        if result != reference:
+            sys.exit(f"Output with {workers} workers differs from 1 worker")
+
+        print(f"{workers:>8} {elapsed:>10.2f} {args.loans / elapsed:>12,.0f}"
+              f" {baseline / elapsed:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+bench_server.py  –  Open-loop load test for server.py.
+
+Starts the quote service (unless --port points at one already running),
+fires requests at a fixed rate over a pool of keep-alive connections and
+reports achieved throughput and p50 / p99 latency.  Latency is measured
+from each request's scheduled send time, so a stalled server shows up as
+queueing delay instead of silently lowering the offered rate.
+
+    python benchmarks/bench_server.py --rate 1000 --seconds 10 --endpoint mix
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOAN  = "principal=5000000&rate=8.5&years=20"
+CARDS = json.dumps({"cards": [
+    {"limit": 200000, "balance": 40000, "late": 1, "age": 6, "default": False},
+    {"limit": 100000, "balance": 5000,  "late": 0, "age": 3, "default": False},
+]})
+REQUESTS = {
+    "emi":      ("GET",  f"/emi?{LOAN}",      None),
+    "yearly":   ("GET",  f"/yearly?{LOAN}",   None),
+    "schedule": ("GET",  f"/schedule?{LOAN}", None),
+    "compare":  ("POST", "/compare",
+                 json.dumps({"loans": [[5e6, 8.5, 20], [5e6, 7.9, 25], [5e6, 9.1, 15]]})),
+    "credit":   ("POST", "/credit-score", CARDS),
+}
+# Weighted toward the cheap quote endpoints, like production traffic
+MIX = ["emi"] * 6 + ["credit"] * 2 + ["yearly", "compare"]
+
+
+async def _fetch(reader, writer, method: str, path: str, body: str | None) -> int:
+    data = (body or "").encode()
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: bench\r\n"
+                 f"Content-Length: {len(data)}\r\n\r\n".encode() + data)
+    head    = await reader.readuntil(b"\r\n\r\n")
+    lines   = head.decode("latin-1").split("\r\n")
+    status  = int(lines[0].split()[1])
+    headers = {k.strip().lower(): v.strip()
+               for k, v in (l.split(":", 1) for l in lines[1:] if ":" in l)}
+
+    if headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.readexactly(int(headers.get("content-length", 0)))
+    return status
+
+
+async def _run(host: str, port: int, rate: float, seconds: float,
+               names: list[str], connections: int) -> tuple[list[float], int, float]:
+    idle = asyncio.Queue()
+    for _ in range(connections):
+        idle.put_nowait(await asyncio.open_connection(host, port))
+
+    latencies, errors = [], 0
+
+    async def one(i: int, scheduled: float) -> None:
+        nonlocal errors
+        conn = await idle.get()
+        try:
+            status = await _fetch(*conn, *REQUESTS[names[i % len(names)]])
+            if status != 200:
+                errors += 1
+        except (ConnectionError, asyncio.IncompleteReadError):
+            errors += 1
+            conn = await asyncio.open_connection(host, port)
+        latencies.append(time.perf_counter() - scheduled)
+        idle.put_nowait(conn)
+
+    total = int(rate * seconds)
+    start = time.perf_counter()
+    tasks = []
+    for i in range(total):
+        scheduled = start + i / rate
+        delay     = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(i, scheduled)))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    while not idle.empty():
+        _, writer = idle.get_nowait()
+        writer.close()
+    return latencies, errors, elapsed
+
+
+def _pct(sorted_values: list[float], p: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(p / 100 * len(sorted_values)))]
+
+
+def _wait_for(host: str, port: int, timeout: float = 10.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host",        default="127.0.0.1")
+    parser.add_argument("--port",        type=int, default=None,
+                        help="use an already running server instead of starting one")
+    parser.add_argument("--rate",        type=float, default=1000, help="requests/s offered")
+    parser.add_argument("--seconds",     type=float, default=10)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--workers",     type=int, default=None)
+    parser.add_argument("--endpoint",    default="mix", choices=[*REQUESTS, "mix"])
+    args = parser.parse_args()
+
+    proc, port = None, args.port
+    if port is None:
+        port = 8765
+        cmd  = [sys.executable, os.path.join(ROOT, "server.py"), "--port", str(port)]
+        if args.workers:
+            cmd += ["--workers", str(args.workers)]
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL)
+    try:
+        _wait_for(args.host, port)
+        names = MIX if args.endpoint == "mix" else [args.endpoint]
+        latencies, errors, elapsed = asyncio.run(
+            _run(args.host, port, args.rate, args.seconds, names, args.connections))
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait()
+
+    latencies.sort()
+    print(f"endpoint : {args.endpoint}")
+    print(f"requests : {len(latencies):,} in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:,.0f} req/s, offered {args.rate:,.0f})")
+    print(f"errors   : {errors}")
+    print(f"p50      : {_pct(latencies, 50) * 1000:8.2f} ms")
+    print(f"p99      : {_pct(latencies, 99) * 1000:8.2f} ms")
+    print(f"max      : {latencies[-1] * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+suite.py  –  Regression benchmarks for the engine, exports and rendering.
+
+Times generate_schedule, compare_loans, generate_yearly_summary,
+export_csv, export_pdf and ui.amort_table on fixed, seeded fixtures from a
+single quote up to a 100k-loan book.  Each case reports ops/s, items/s
+(loans, rows or documents per second), latency percentiles and peak
+traced memory for one call.
+
+--save stores the results as a JSON baseline; later runs compare their
+median latency with it and exit with status 1 when any case is slower than
+--max-slowdown allows.  Everything runs offline and writes only to a
+temporary directory.
+
+    python benchmarks/suite.py --save                 # record a baseline
+    python benchmarks/suite.py --max-slowdown 0.2     # fail if >20% slower
+    python benchmarks/suite.py --only export --min-time 0.2
+"""
+import argparse
+import atexit
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ui
+from amortization import generate_schedule
+from comparison import compare_loans
+from export import export_csv
+from mortgage import Mortgage
+from yearly_summary import generate_yearly_summary
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Terminal-rendering cases print into this; one handle for the whole run
+_DEVNULL = open(os.devnull, "w", encoding="utf-8")
+atexit.register(_DEVNULL.close)
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+def make_book(n: int, seed: int = 42) -> list[tuple]:
+    """n (principal, rate, years) loans, the same for every run."""
+    rng = random.Random(seed)
+    return [(round(rng.uniform(5e5, 2e7), 2),
+             rng.choice([6.5, 7.2, 7.5, 8.1, 8.5, 9.5]),
+             rng.choice([5, 10, 15, 20, 25, 30]))
+            for _ in range(n)]
+
+
+def loan_dict(loan: Mortgage, schedule) -> dict:
+    return {
+        "principal":      loan.principal,
+        "rate":           loan.annual_rate,
+        "years":          loan.years,
+        "emi":            loan.emi(),
+        "total_interest": schedule.total_interest(),
+        "months":         len(schedule),
+    }
+
+
+def report_data(loan: Mortgage) -> dict:
+    schedule = generate_schedule(loan)
+    return {
+        "loan":     loan_dict(loan, schedule),
+        "schedule": schedule,
+        "yearly":   generate_yearly_summary(schedule),
+    }
+
+
+# ── Cases ─────────────────────────────────────────────────────────────────────
+# name → setup(tmp dir) returning (fn, items per call); setup cost is not timed
+
+def _schedule(loans: list[tuple], extra: float = 0.0, lump: float = 0.0, month: int = 0):
+    mortgages = [Mortgage(*loan) for loan in loans]
+    return lambda: [generate_schedule(m, extra, lump, month) for m in mortgages], len(loans)
+
+
+def _compare(n: int):
+    book = make_book(n)
+    return lambda: compare_loans(book), n
+
+
+def _yearly(source_of):
+    loans   = [Mortgage(*loan) for loan in make_book(1000)]
+    sources = [source_of(m) for m in loans]
+    return lambda: [generate_yearly_summary(s) for s in sources], len(sources)
+
+
+def _export_csv(tmp: str, years: int):
+    loan     = Mortgage(5_000_000, 8.5, years)
+    schedule = generate_schedule(loan)
+    yearly   = generate_yearly_summary(schedule)
+    path     = os.path.join(tmp, "report.csv")
+    return lambda: export_csv(path, schedule, yearly, loan_dict(loan, schedule)), len(schedule)
+
+
+def _export_pdf(tmp: str, full_schedule: bool):
+    from pdf import export_pdf
+
+    data = report_data(Mortgage(5_000_000, 8.5, 30))
+    path = os.path.join(tmp, "report.pdf")
+    return lambda: export_pdf(path, data, full_schedule=full_schedule), 1
+
+
+def _amort_table(years: int):
+    schedule = generate_schedule(Mortgage(5_000_000, 8.5, years))
+
+    def render():
+        with redirect_stdout(_DEVNULL):
+            ui.amort_table(schedule)
+    return render, len(schedule)
+
+
+CASES = {
+    "schedule/single-quote":    lambda tmp: _schedule([(5_000_000, 8.5, 20)]),
+    "schedule/prepay-30y":      lambda tmp: _schedule([(5_000_000, 8.5, 30)], 5000, 500_000, 36),
+    "schedule/book-1k":         lambda tmp: _schedule(make_book(1000)),
+    "compare/3-offers":         lambda tmp: _compare(3),
+    "compare/book-100k":        lambda tmp: _compare(100_000),
+    "yearly/schedule-book-1k":  lambda tmp: _yearly(generate_schedule),
+    "yearly/rows-book-1k":      lambda tmp: _yearly(lambda m: list(generate_schedule(m))),
+    "yearly/closed-form-1k":    lambda tmp: _yearly(lambda m: m),
+    "export_csv/20y":           lambda tmp: _export_csv(tmp, 20),
+    "export_csv/30y":           lambda tmp: _export_csv(tmp, 30),
+    "export_pdf/summary":       lambda tmp: _export_pdf(tmp, False),
+    "export_pdf/full-schedule": lambda tmp: _export_pdf(tmp, True),
+    "amort_table/20y":          lambda tmp: _amort_table(20),
+    "amort_table/30y":          lambda tmp: _amort_table(30),
+}
+
+
+# ── Measurement ───────────────────────────────────────────────────────────────
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    index = max(0, min(len(sorted_values) - 1, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(fn, items: int, min_time: float, min_runs: int, max_runs: int) -> dict:
+    """Run fn until both min_time and min_runs are reached; one traced extra run."""
+    fn()                                         # warm-up: imports, caches, fonts
+    times, spent = [], 0.0
+    while len(times) < max_runs and (len(times) < min_runs or spent < min_time):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+        spent += times[-1]
+
+    # Tracing slows everything down, so peak memory gets a separate call
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    times.sort()
+    return {
+        "runs":      len(times),
+        "ops_s":     len(times) / spent,
+        "items_s":   items * len(times) / spent,
+        "p50_ms":    percentile(times, 50) * 1e3,
+        "p95_ms":    percentile(times, 95) * 1e3,
+        "p99_ms":    percentile(times, 99) * 1e3,
+        "peak_mb":   peak / 1e6,
+    }
+
+
+def run_suite(names: list[str], min_time: float, min_runs: int, max_runs: int) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in names:
+            fn, items = CASES[name](tmp)
+            results[name] = measure(fn, items, min_time, min_runs, max_runs)
+            print_row(name, results[name])
+    return results
+
+
+# ── Baselines ─────────────────────────────────────────────────────────────────
+
+def save_baseline(path: str, results: dict) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python":  platform.python_version(),
+            "machine": platform.platform(),
+            "cases":   results,
+        }, f, indent=2)
+
+
+def regressions(results: dict, baseline: dict, max_slowdown: float) -> list[str]:
+    """Cases whose median latency grew by more than max_slowdown (0.25 = 25%)."""
+    slow = []
+    for name, res in results.items():
+        base = baseline["cases"].get(name)
+        if base is None:
+            continue
+        change = res["p50_ms"] / base["p50_ms"] - 1
+        res["vs_baseline"] = change
+        if change > max_slowdown:
+            slow.append(f"{name}: p50 {base['p50_ms']:.3f} → {res['p50_ms']:.3f} ms "
+                        f"({change:+.0%})")
+    return slow
+
+
+def print_row(name: str, res: dict) -> None:
+    print(f"{name:<26}{res['ops_s']:>11,.1f}{res['items_s']:>13,.0f}"
+          f"{res['p50_ms']:>10.3f}{res['p95_ms']:>10.3f}{res['p99_ms']:>10.3f}"
+          f"{res['peak_mb']:>9.2f}", flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only",     action="append", default=[],
+                        help="run cases whose name contains this text (repeatable)")
+    parser.add_argument("--min-time", type=float, default=1.0,
+                        help="seconds to spend timing each case")
+    parser.add_argument("--min-runs", type=int,   default=5)
+    parser.add_argument("--max-runs", type=int,   default=10_000)
+    parser.add_argument("--baseline", default=BASELINE, help="baseline JSON file")
+    parser.add_argument("--save",     action="store_true",
+                        help="write the results as the new baseline")
+    parser.add_argument("--max-slowdown", type=float, default=0.25,
+                        help="allowed p50 slowdown vs baseline before failing (0.25 = 25%%)")
+    parser.add_argument("--json",     help="also write this run's results to a file")
+    args = parser.parse_args()
+
+    names = [n for n in CASES if not args.only or any(part in n for part in args.only)]
+    if not names:
+        parser.error("no case matches --only")
+
+    print(f"{'Case':<26}{'ops/s':>11}{'items/s':>13}{'p50 ms':>10}{'p95 ms':>10}"
+          f"{'p99 ms':>10}{'peak MB':>9}")
+    results = run_suite(names, args.min_time, args.min_runs, args.max_runs)
+
+    if args.json:
+        save_baseline(args.json, results)
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save to create one.")
+        return
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    slow = regressions(results, baseline, args.max_slowdown)
+
+    print(f"\nAgainst baseline from {baseline['created']} "
+          f"(limit {args.max_slowdown:+.0%} on p50):")
+    for name, res in results.items():
+        if "vs_baseline" in res:
+            print(f"  {name:<26}{res['vs_baseline']:>+8.1%}")
+    if slow:
+        print("\nREGRESSIONS:\n  " + "\n  ".join(slow))
+        sys.exit(1)
+    print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+bulk_pdf.py  –  Render many loan statements in parallel.
+
+Takes a stream of loan/borrower payloads, renders one PDF per payload
+across a process pool and records every outcome in a manifest.  Each
+worker builds the ReportLab styles once at start-up.  A document that
+fails (bad payload, rendering error or a crashed worker) is logged in the
+manifest as failed and does not stop the run.
+
+Payload keys:
+  id                                   : used in the file name, which is
+                                         "<position>_<id>.pdf" (or just the
+                                         position) so names never clash
+  principal, rate, years               : loan terms
+  extra, lump, lump_month              : optional prepayments
+  borrower, credit                     : optional dicts shown in the report
+"""
+import csv
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Iterable
+
+from amortization import generate_schedule
+from mortgage import Mortgage
+from prepayment import prepayment_savings
+from progress import stage
+from yearly_summary import generate_yearly_summary
+
+MANIFEST_FIELDS = ("id", "status", "path", "seconds", "error")
+
+
+def _init_worker() -> None:
+    """Build fonts and styles once per worker process."""
+    import pdf
+    pdf._styles()
+
+
+def _report_data(payload: dict) -> dict:
+    loan  = Mortgage(payload["principal"], payload["rate"], payload["years"])
+    extra = payload.get("extra", 0.0)
+    lump  = payload.get("lump", 0.0)
+    month = payload.get("lump_month", 0)
+
+    schedule = generate_schedule(loan, extra, lump, month)
+    savings  = prepayment_savings(loan, extra, lump, month)
+    return {
+        "loan": {
+            "principal":      loan.principal,
+            "rate":           loan.annual_rate,
+            "years":          loan.years,
+            "emi":            loan.emi(),
+            "total_interest": schedule.total_interest(),
+            "months":         len(schedule),
+        },
+        "schedule":   schedule,
+        "yearly":     generate_yearly_summary(schedule),
+        "prepayment": {
+            "extra": extra, "lump": lump, "lump_month": month,
+            "months_saved":   savings["months_saved"],
+            "interest_saved": savings["interest_saved"],
+        },
+        "credit":   payload.get("credit")   or {},
+        "borrower": payload.get("borrower") or {},
+    }
+
+
+def _file_name(doc_id: str, seq: int) -> str:
+    """
+    Safe PDF name for a document: its 1-based position, then its sanitized
+    id.  The position alone makes names unique (on case-insensitive
+    filesystems too) without remembering the names already handed out.
+    """
+    base = re.sub(r"[^\w.-]", "_", doc_id)
+    return f"{seq:06d}_{base}.pdf" if base else f"{seq:06d}.pdf"
+
+
+def _failed(doc_id: str, error: str) -> dict:
+    return {"id": doc_id, "status": "failed", "path": "", "seconds": 0.0, "error": error}
+
+
+def _render(job: tuple[dict, str, bool]) -> dict:
+    """Render one payload; never raises, so one bad document can't sink the run."""
+    from pdf import export_pdf
+
+    payload, path, full_schedule = job
+    doc_id = str(payload.get("id", ""))
+    start  = time.perf_counter()
+    try:
+        export_pdf(path, _report_data(payload), full_schedule=full_schedule)
+        status, error = "ok", ""
+    except Exception as exc:
+        status, error, path = "failed", f"{type(exc).__name__}: {exc}", ""
+    return {
+        "id":      doc_id,
+        "status":  status,
+        "path":    path,
+        "seconds": round(time.perf_counter() - start, 4),
+        "error":   error,
+    }
+
+
+def generate_reports(
+    payloads: Iterable[dict],
+    out_dir: str,
+    workers: int | None = None,
+    full_schedule: bool = False,
+    progress: Callable[[int, dict], None] | None = None,
+    max_pending: int = 256,
+) -> dict:
+    """
+    Render a PDF for every payload into out_dir and write out_dir/manifest.csv.
+
+    At most max_pending documents are in flight at once, so payloads can
+    come from a generator of any length.  progress(done, result) is called
+    after each document.  workers=1 renders in this process.
+
+    Returns keys: ok, failed, manifest.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = os.path.join(out_dir, "manifest.csv")
+    counts   = {"ok": 0, "failed": 0}
+    total    = len(payloads) if hasattr(payloads, "__len__") else None
+
+    with (open(manifest, "w", newline="", encoding="utf-8") as f,
+          stage("Rendering PDF reports", total, "documents") as st):
+        w = csv.DictWriter(f, fieldnames=MANIFEST_FIELDS)
+        w.writeheader()
+
+        def _record(result: dict) -> None:
+            counts[result["status"]] += 1
+            w.writerow(result)
+            st.advance()
+            if progress:
+                progress(counts["ok"] + counts["failed"], result)
+
+        def _jobs():
+            """(doc id, job) per payload; payloads that aren't dicts fail here."""
+            for seq, payload in enumerate(payloads, start=1):
+                if not isinstance(payload, dict):
+                    _record(_failed("", f"TypeError: payload {seq} is a "
+                                        f"{type(payload).__name__}, not a dict"))
+                    continue
+                doc_id = str(payload.get("id", ""))
+                path   = os.path.join(out_dir, _file_name(doc_id, seq))
+                yield doc_id, (payload, path, full_schedule)
+
+        def _collect(fut, doc_id: str) -> None:
+            try:
+                _record(fut.result())
+            except Exception as exc:        # the worker died, e.g. BrokenProcessPool
+                _record(_failed(doc_id, f"{type(exc).__name__}: {exc}"))
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            _init_worker()
+            for _, job in _jobs():
+                _record(_render(job))
+        else:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_worker) as pool:
+                pending = {}
+                for doc_id, job in _jobs():
+                    try:
+                        pending[pool.submit(_render, job)] = doc_id
+                    except Exception as exc:    # pool already broken
+                        _record(_failed(doc_id, f"{type(exc).__name__}: {exc}"))
+                        continue
+                    if len(pending) >= max_pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for fut in done:
+                            _collect(fut, pending.pop(fut))
+                for fut in wait(pending).done:
+                    _collect(fut, pending[fut])
+
+    return {**counts, "manifest": manifest}
@@ -1,12 +1,14 @@
+from schedule import Schedule
+
 BAR_WIDTH = 40
 
 
-def plot_balance(schedule: list[dict]) -> None:
+def plot_balance(schedule: Schedule | list[dict]) -> None:
     """Print a horizontal bar chart of the loan balance over time."""
     print("\n=== LOAN BALANCE TIMELINE ===")
 
     step    = max(1, len(schedule) // 8)
-    sampled = schedule[::step]
+    sampled = list(schedule[::step])
 
     # Make sure the final row is always included
     if schedule[-1] not in sampled:
@@ -24,7 +26,7 @@ def plot_balance(schedule: list[dict]) -> None:
         )
 
 
-def plot_payment_breakdown(schedule: list[dict]) -> None:
+def plot_payment_breakdown(schedule: Schedule | list[dict]) -> None:
     """Print a horizontal bar showing the principal vs interest split."""
     print("\n=== PAYMENT BREAKDOWN ===")
 
@@ -44,4 +46,24 @@ def plot_payment_breakdown(schedule: list[dict]) -> None:
 
     print(f"Principal  {'█' * p_bar:<{BAR_WIDTH}}  {p_ratio * 100:>5.1f}%  ({total_principal:>14,.2f})")
     print(f"Interest   {'█' * i_bar:<{BAR_WIDTH}}  {i_ratio * 100:>5.1f}%  ({total_interest:>14,.2f})")
-    print(f"\n  Total Paid : {total:>,.2f}")
\ No newline at end of file
+    print(f"\n  Total Paid : {total:>,.2f}")
+
+
+def plot_histogram(histogram: dict, title: str = "DISTRIBUTION") -> None:
+    """
+    Print a horizontal histogram from {"counts": [...], "edges": [...]}
+    (the shape montecarlo.simulate and numpy.histogram produce).
+    """
+    print(f"\n=== {title} ===")
+
+    counts, edges = histogram["counts"], histogram["edges"]
+    max_count     = max(counts, default=0) or 1  # avoid div-by-zero
+    total         = sum(counts) or 1
+
+    for count, lo, hi in zip(counts, edges, edges[1:]):
+        bars = int(count / max_count * BAR_WIDTH)
+        print(
+            f"{lo:>14,.0f} – {hi:<14,.0f} | "
+            f"{'█' * bars:<{BAR_WIDTH}} "
+            f"{count / total * 100:>5.1f}%"
+        )
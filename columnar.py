@@ -0,0 +1,176 @@
+"""
+columnar.py  –  Binary columnar export for portfolio schedules (.npz).
+
+A compact, typed alternative to the CSV exporters: every column is stored
+as its own NumPy array inside one .npz archive, with a loan_id column and
+per-loan row offsets.
+
+Money is kept as int64 paise, which is exact for the 2-decimal amounts
+the engine produces.  Within each loan the columns are encoded so that
+most stored values are tiny and compress well:
+  payment   : change from the previous period (almost always 0)
+  principal : second difference (principal grows almost geometrically)
+  interest  : payment - principal - interest (rounding residue)
+  balance   : rounding drift from (previous balance - principal), as a change
+read_npz undoes all of this and hands back plain rupee columns.
+"""
+from itertools import islice
+from typing import Iterable
+
+import numpy as np
+
+from batch import generate_schedules, loan_columns
+from schedule import Schedule
+
+MONEY  = ("payment", "principal", "interest", "balance")
+YEARLY = ("interest", "principal", "balance")
+
+
+def _paise(values: np.ndarray) -> np.ndarray:
+    return np.rint(values * 100).astype(np.int64)
+
+
+def _segment_cumsum(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Running sum of `values` that restarts at every loan boundary."""
+    total  = np.cumsum(values)
+    before = np.concatenate([[0], total])[offsets[:-1]]
+    return total - np.repeat(before, np.diff(offsets))
+
+
+def _segment_diff(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Difference from the previous row of the same loan (first row kept as-is)."""
+    out    = np.diff(values, prepend=0)
+    starts = offsets[:-1][np.diff(offsets) > 0]
+    out[starts] = values[starts]
+    return out
+
+
+def _encode(cols: dict[str, np.ndarray], loan_principal: np.ndarray,
+            offsets: np.ndarray) -> dict[str, np.ndarray]:
+    lengths  = np.diff(offsets)
+    expected = np.repeat(loan_principal, lengths) - _segment_cumsum(cols["principal"], offsets)
+    residual = cols["balance"] - expected
+    return {
+        # Principal grows almost geometrically: second differences are tiny
+        "principal": _segment_diff(_segment_diff(cols["principal"], offsets), offsets),
+        "payment":   _segment_diff(cols["payment"], offsets),
+        "interest":  cols["payment"] - cols["principal"] - cols["interest"],
+        "balance":   _segment_diff(residual, offsets),
+    }
+
+
+def _decode(enc: dict[str, np.ndarray], loan_principal: np.ndarray,
+            offsets: np.ndarray) -> dict[str, np.ndarray]:
+    lengths   = np.diff(offsets)
+    principal = _segment_cumsum(_segment_cumsum(enc["principal"], offsets), offsets)
+    payment   = _segment_cumsum(enc["payment"], offsets)
+    residual  = _segment_cumsum(enc["balance"], offsets)
+    balance   = (np.repeat(loan_principal, lengths)
+                 - _segment_cumsum(principal, offsets) + residual)
+    return {
+        "payment":   payment,
+        "principal": principal,
+        "interest":  payment - principal - enc["interest"],
+        "balance":   balance,
+    }
+
+
+def write_npz(
+    filepath: str,
+    loans: Iterable[tuple],
+    compressed: bool = True,
+    chunk_size: int = 5000,
+    payments_per_year: int = 12,
+) -> dict:
+    """
+    Amortize `loans` with the batch engine and save schedules and yearly
+    summaries to one .npz file.
+
+    Each loan is a (principal, rate, years[, extra, lump, lump_month]) tuple;
+    loan ids are 1-based positions in `loans`.
+
+    Returns keys: loans, rows, yearly_rows.
+    """
+    sched  = {k: [] for k in ("loan_id", "period") + MONEY}
+    yearly = {k: [] for k in ("loan_id", "year") + YEARLY}
+    months, principals = [], []
+    first  = 1
+
+    it = iter(loans)
+    while chunk := list(islice(it, chunk_size)):
+        cols  = loan_columns(chunk)
+        batch = generate_schedules(*cols, payments_per_year)
+        ids   = np.arange(first, first + len(chunk), dtype=np.int32)
+        first += len(chunk)
+
+        # Keep only the live (loan, period) cells, in loan-major order
+        width = batch.payment.shape[1]
+        live  = np.arange(width) < batch.months[:, None]
+        sched["loan_id"].append(np.broadcast_to(ids[:, None], live.shape)[live])
+        sched["period"].append(
+            np.broadcast_to(np.arange(1, width + 1, dtype=np.int16), live.shape)[live])
+        for col in MONEY:
+            sched[col].append(_paise(getattr(batch, col)[live]))
+        months.append(batch.months)
+        principals.append(_paise(np.asarray(cols[0], dtype=float)))
+
+        years, *values = batch.yearly(payments_per_year)
+        y_live = np.arange(values[0].shape[1]) < years[:, None]
+        yearly["loan_id"].append(np.broadcast_to(ids[:, None], y_live.shape)[y_live])
+        yearly["year"].append(
+            np.broadcast_to(np.arange(1, y_live.shape[1] + 1, dtype=np.int16),
+                            y_live.shape)[y_live])
+        for col, arr in zip(YEARLY, values):
+            yearly[col].append(_paise(arr[y_live]))
+
+    def _cat(parts: list, dtype=np.int64) -> np.ndarray:
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=dtype)
+
+    offsets        = np.concatenate([[0], np.cumsum(_cat(months))])
+    loan_principal = _cat(principals)
+    money          = _encode({c: _cat(sched[c]) for c in MONEY}, loan_principal, offsets)
+
+    arrays = {
+        "offsets":          offsets,
+        "loan_principal":   loan_principal,
+        "schedule_loan_id": _cat(sched["loan_id"], np.int32),
+        "schedule_period":  _cat(sched["period"],  np.int16),
+        "yearly_loan_id":   _cat(yearly["loan_id"], np.int32),
+        "yearly_year":      _cat(yearly["year"],    np.int16),
+    }
+    arrays.update({f"schedule_{c}": money[c] for c in MONEY})
+    arrays.update({f"yearly_{c}": _cat(yearly[c]) for c in YEARLY})
+
+    (np.savez_compressed if compressed else np.savez)(filepath, **arrays)
+    return {
+        "loans":       len(offsets) - 1,
+        "rows":        len(arrays["schedule_period"]),
+        "yearly_rows": len(arrays["yearly_year"]),
+    }
+
+
+def read_npz(filepath: str) -> dict[str, np.ndarray]:
+    """
+    Load a write_npz file.
+
+    Returns the same array names as the archive, with schedule and yearly
+    money columns decoded back to rupees (float64).
+    """
+    with np.load(filepath) as data:
+        out = {key: data[key] for key in data.files}
+
+    money = _decode({c: out[f"schedule_{c}"] for c in MONEY},
+                    out["loan_principal"], out["offsets"])
+    for c in MONEY:
+        out[f"schedule_{c}"] = money[c] / 100
+    for c in YEARLY:
+        out[f"yearly_{c}"] = out[f"yearly_{c}"] / 100
+    out["loan_principal"] = out["loan_principal"] / 100
+    return out
+
+
+def loan_schedule(data: dict[str, np.ndarray], loan_id: int) -> Schedule:
+    """Schedule for one loan (1-based id) from read_npz output, as views."""
+    start, stop = data["offsets"][loan_id - 1], data["offsets"][loan_id]
+    return Schedule(*(data[f"schedule_{c}"][start:stop]
+                      for c in ("period",) + MONEY))
@@ -1,5 +1,65 @@
+import heapq
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 from mortgage import Mortgage
-from amortization import generate_schedule
+from prepayment import solve_payoff
+
+# Ranking keys for rank_offers; lower is better for every criterion
+CRITERIA = {
+    "interest": lambda r: r["interest"],
+    "ratio":    lambda r: r["interest"] / r["principal"] if r["principal"] else math.inf,
+    "emi":      lambda r: r["emi"],
+    "tenure":   lambda r: r["months"],
+}
+
+def _result(i: int, principal: float, rate: float, years: int,
+            emi: float, interest: float, months: int) -> dict:
+    total_interest = round(interest, 2)
+    return {
+        "id":        i,
+        "principal": principal,
+        "rate":      rate,
+        "years":     years,
+        "emi":       round(emi, 2),
+        "interest":  total_interest,
+        "total":     round(principal + total_interest, 2),
+        "months":    months,
+    }
+
+
+def _rank_chunk(args: tuple[int, list[tuple]], top_k: int,
+                criteria: tuple[str, ...]) -> dict[str, list[dict]]:
+    """
+    Top top_k offers of one chunk per criterion, in one NumPy pass.
+
+    Figures are rounded exactly as compare_loans() rounds them, so a stable
+    sort on each key picks the same offers, ties included, and result dicts
+    are built only for the winners.
+    """
+    import numpy as np
+    from batch import batch_payoff, round2
+
+    start, chunk = args
+    if not chunk or top_k <= 0:
+        return {name: [] for name in criteria}
+    principal, rate, years = (np.asarray(c, dtype=float) for c in zip(*chunk))
+    emi, months, interest  = batch_payoff(principal, rate, years)
+    emi_r, interest_r      = emi.copy(), interest.copy()
+    round2(emi_r)
+    round2(interest_r)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(principal != 0, interest_r / principal, np.inf)
+    keys = {"interest": interest_r, "ratio": ratio, "emi": emi_r, "tenure": months}
+
+    return {
+        name: [_result(start + i, *chunk[i], float(emi[i]), float(interest[i]), int(months[i]))
+               for i in np.argsort(keys[name], kind="stable")[:top_k].tolist()]
+        for name in criteria
+    }
 
 
 def compare_loans(loan_data: list[tuple]) -> list[dict]:
@@ -7,27 +67,58 @@ def compare_loans(loan_data: list[tuple]) -> list[dict]:
     Build a comparison result list from a list of (principal, rate, years) tuples.
     """
     results = []
-
     for i, (principal, rate, years) in enumerate(loan_data, start=1):
-        loan     = Mortgage(principal, rate, years)
-        schedule = generate_schedule(loan)
-
-        total_interest = round(sum(r["interest"] for r in schedule), 2)
-
-        results.append({
-            "id":        i,
-            "principal": principal,
-            "rate":      rate,
-            "years":     years,
-            "emi":       round(loan.emi(), 2),
-            "interest":  total_interest,
-            "total":     round(principal + total_interest, 2),
-            "months":    len(schedule),
-        })
-
+        loan   = Mortgage(principal, rate, years)
+        payoff = solve_payoff(loan)
+        results.append(_result(i, principal, rate, years, loan.emi(),
+                               payoff["total_interest"], payoff["months"]))
     return results
 
 
+def rank_offers(
+    offers: list[tuple],
+    top_k: int = 10,
+    criteria: tuple[str, ...] = tuple(CRITERIA),
+    workers: int | None = None,
+    parallel_threshold: int = 50_000,
+    chunk_size: int = 10_000,
+) -> dict[str, list[dict]]:
+    """
+    Rank a large set of (principal, rate, years) offers.
+
+    Offers are evaluated in closed form with batch.batch_payoff, a chunk
+    per NumPy pass, and the best top_k are picked for each criterion:
+    "interest", "ratio" (interest-to-principal; zero-principal offers rank
+    last), "emi" and "tenure".  Offer sets larger than parallel_threshold
+    are ranked chunk by chunk across a process pool.  Requires NumPy; the
+    result is what ranking every compare_loans() row would give.
+
+    Returns {criterion: [result dict, ...]} with results shaped like
+    compare_loans() output.
+    """
+    unknown = set(criteria) - set(CRITERIA)
+    if unknown:
+        raise ValueError(f"Unknown ranking criteria: {', '.join(sorted(unknown))}")
+
+    criteria = tuple(criteria)
+    rank     = partial(_rank_chunk, top_k=top_k, criteria=criteria)
+    workers  = workers or os.cpu_count() or 1
+    if workers > 1 and len(offers) > parallel_threshold:
+        chunks = [(start + 1, offers[start : start + chunk_size])
+                  for start in range(0, len(offers), chunk_size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(rank, chunks))
+    else:
+        parts = [rank((1, list(offers)))]
+
+    # Chunks are in offer order, so ties still go to the earlier offer
+    return {
+        name: heapq.nsmallest(top_k, (r for part in parts for r in part[name]),
+                              key=CRITERIA[name])
+        for name in criteria
+    }
+
+
 def print_comparison(results: list[dict]) -> None:
     print("\n=== LOAN COMPARISON ===")
     print("-" * 90)
@@ -57,5 +148,5 @@ def print_comparison(results: list[dict]) -> None:
 
     print("-" * 90)
 
-    best = min(results, key=lambda x: x["interest"] / x["principal"])
+    best = min(results, key=CRITERIA["ratio"])
     print(f"\n  Best option: Loan {best['id']} (lowest interest-to-principal ratio)")
\ No newline at end of file
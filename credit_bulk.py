@@ -0,0 +1,328 @@
+"""
+credit_bulk.py  –  Vectorized credit scoring for bureau-style card files.
+
+Scores millions of card records grouped by customer in a handful of
+NumPy passes instead of one combine_cards / calculate_credit_score call
+per customer.  Results are identical to the per-customer functions:
+card totals are accumulated in the same order and the weighting formula
+is applied with the same float operations.
+
+    res = score_customers(customer, limit, balance, late, age, default)
+    res["score"], res["india"], res["us"]
+
+Card-number checks work the same way: PANs are held as a (cards × width)
+byte matrix and luhn_check / mask_number are applied with digit
+arithmetic across the whole matrix.
+
+    valid, masked = check_cards(open("pans.txt", "rb").read())
+"""
+import csv
+
+import numpy as np
+
+from credit_tool import INDIA_BANDS, MIX_WEIGHT, US_BANDS
+
+CARD_COLUMNS = ("customer", "limit", "balance", "late", "age", "default")
+MIX          = np.array([MIX_WEIGHT.get(str(k), 0.4) for k in range(4)])   # by min(cards, 3)
+
+# Luhn: value of a digit after doubling (and subtracting 9 when > 9)
+LUHN_DOUBLE = np.array([0, 2, 4, 6, 8, 1, 3, 5, 7, 9], dtype=np.uint8)
+ZERO, STAR  = ord("0"), ord("*")
+BYTES       = 0x0101010101010101   # 1 in every byte of a uint64
+
+
+def _group(customer: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    Sort cards by customer (stable, so each customer keeps file order).
+
+    Returns (order, customer ids, start of each customer in sorted order,
+    group index per sorted card, rank of each sorted card within its
+    customer).
+    """
+    ids, inverse = np.unique(customer, return_inverse=True)
+    order   = np.argsort(inverse, kind="stable")    # integer sort, cheaper than keys
+    group   = inverse[order]
+    starts  = np.concatenate([[0], np.cumsum(np.bincount(group))[:-1]])
+    rank    = np.arange(len(order)) - starts[group]
+    return order, ids, starts, group, rank
+
+
+def _ordered_sum(values: np.ndarray, group: np.ndarray, rank: np.ndarray,
+                 groups: int) -> np.ndarray:
+    """
+    Per-customer sum adding cards one at a time in file order, exactly as
+    Python's sum() does, vectorized across customers (one pass per rank).
+    """
+    total = np.zeros(groups)
+    for k in range(int(rank.max()) + 1 if len(rank) else 0):
+        at = rank == k
+        total[group[at]] += values[at]
+    return total
+
+
+def _classify(score: np.ndarray, bands: tuple) -> np.ndarray:
+    return np.select([score >= cut for cut, _ in bands],
+                     [label for _, label in bands], default="POOR")
+
+
+def score_customers(customer, limit, balance, late, age, default) -> dict:
+    """
+    Score every customer in a set of card records (valid cards only).
+
+    All arguments are equal-length sequences, one entry per card.  Returns
+    per-customer arrays, ordered by customer id:
+      customer, cards, on_time, utilization, history, score, india, us
+    """
+    customer = np.asarray(customer)
+    order, ids, starts, group, rank = _group(customer)
+    n = len(ids)
+
+    limit   = np.asarray(limit,   dtype=float)[order]
+    balance = np.asarray(balance, dtype=float)[order]
+    late    = np.asarray(late,    dtype=np.int64)[order]
+    age     = np.asarray(age)[order]
+    default = np.asarray(default, dtype=bool)[order]
+
+    # ── combine_cards ─────────────────────────────────────────────────────
+    total_limit   = _ordered_sum(limit,   group, rank, n)
+    total_balance = _ordered_sum(balance, group, rank, n)
+    total_late    = np.bincount(group, weights=late, minlength=n).astype(np.int64)
+    cards         = np.bincount(group, minlength=n)
+
+    history       = np.maximum.reduceat(age, starts) if n else age
+    any_default   = np.logical_or.reduceat(default, starts) if n else default
+
+    on_time = np.maximum(0, 100 - total_late * 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        utilization = np.where(total_limit != 0,
+                               total_balance / total_limit * 100, 0.0)
+
+    # ── calculate_credit_score ────────────────────────────────────────────
+    repayment = (on_time / 100) * np.where(any_default, 0.5, 1.0)
+    score = np.full(n, 300.0)
+    score += repayment                                 * 0.35 * 600
+    score += np.maximum(0.0, 1 - utilization / 100)   * 0.30 * 600
+    score += np.minimum(history / 20, 1.0)            * 0.15 * 600
+    score += MIX[np.minimum(cards, 3)]                * 0.10 * 600
+    score += 0.10 * 600
+    score  = np.rint(np.minimum(score, 900)).astype(np.int64)
+
+    return {
+        "customer":    ids,
+        "cards":       cards,
+        "on_time":     on_time,
+        "utilization": utilization,
+        "history":     history,
+        "score":       score,
+        "india":       _classify(score, INDIA_BANDS),
+        "us":          _classify(score, US_BANDS),
+    }
+
+
+def read_cards(filepath: str) -> dict[str, np.ndarray]:
+    """Load a card CSV with CARD_COLUMNS headers into column arrays."""
+    with open(filepath, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        cols   = [list(c) for c in zip(*reader)] or [[] for _ in header]
+    data = dict(zip(header, cols))
+    return {
+        "customer": np.asarray(data["customer"]),
+        "limit":    np.asarray(data["limit"],   dtype=float),
+        "balance":  np.asarray(data["balance"], dtype=float),
+        "late":     np.asarray(data["late"],    dtype=np.int64),
+        "age":      np.asarray(data["age"],     dtype=np.int64),
+        "default":  np.isin(np.char.lower(np.asarray(data["default"])),
+                            ["1", "true", "yes", "y"]),
+    }
+
+
+def score_csv(in_path: str, out_path: str) -> int:
+    """Score a card CSV and write customer, score, india, us rows.  Returns customers."""
+    res = score_customers(**read_cards(in_path))
+    with open(out_path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["customer", "score", "india", "us"])
+        w.writerows(zip(res["customer"].tolist(), res["score"].tolist(),
+                        res["india"].tolist(), res["us"].tolist()))
+    return len(res["customer"])
+
+
+# ── Card numbers ─────────────────────────────────────────────────────────────
+
+def _ascii(number: str | bytes) -> bytes:
+    """
+    One PAN as ASCII bytes.  Non-ASCII decimal digits become their ASCII
+    digit (str.isdigit, and so luhn_check, counts them); any other
+    non-ASCII character becomes '?', a separator.
+    """
+    if not isinstance(number, str):
+        return bytes(number)
+    return "".join(str(int(ch)) if ch.isdecimal() else ch
+                   for ch in number).encode("ascii", "replace")
+
+
+def card_matrix(data) -> np.ndarray:
+    """
+    Card numbers as a (cards × width) uint8 matrix of characters, padded
+    with zero bytes.
+
+    `data` is a newline-separated byte buffer (one PAN per line), a
+    sequence of str/bytes, or an existing 2-D uint8 matrix.  Separators
+    such as spaces or dashes may be left in; they are ignored just as
+    luhn_check and mask_number ignore them.  Non-ASCII str entries are
+    converted with _ascii.  A buffer whose lines all
+    have the same length is reshaped in place without copying.
+    """
+    if isinstance(data, np.ndarray) and data.ndim == 2:
+        return data.astype(np.uint8, copy=False)
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        try:
+            arr = np.asarray(data, dtype="S")
+        except UnicodeEncodeError:
+            arr = np.asarray([_ascii(s) for s in data], dtype="S")
+        return arr.view(np.uint8).reshape(len(arr), arr.itemsize)
+
+    buf = np.frombuffer(data, dtype=np.uint8)
+    if len(buf) and buf[-1] != 10:
+        buf = np.append(buf, np.uint8(10))
+
+    # Fixed-width file: every line is `line` bytes long
+    line = int(np.argmax(buf == 10)) + 1 if len(buf) else 0
+    if line and len(buf) % line == 0 and (buf[line - 1::line] == 10).all():
+        return buf.reshape(-1, line)[:, :line - 1]
+
+    ends   = np.flatnonzero(buf == 10)
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    width  = int((ends - starts).max()) if len(ends) else 0
+
+    out  = np.zeros((len(ends), width), dtype=np.uint8)
+    row  = np.repeat(np.arange(len(ends)), ends - starts)
+    keep = buf != 10
+    out[row, np.arange(len(buf))[keep] - starts[row]] = buf[keep]
+    return out
+
+
+def _words(chars: np.ndarray) -> np.ndarray:
+    """
+    Rows as uint64 words, eight characters each, left-padded with '0' to a
+    multiple of 8 (which leaves the Luhn checksum unchanged).
+    """
+    n, width = chars.shape
+    words = -(-width // 8)
+    if width % 8 or not chars.flags.c_contiguous:
+        padded = np.full((n, words * 8), ZERO, dtype=np.uint8)
+        padded[:, words * 8 - width:] = chars
+        chars = padded
+    return chars.view(np.uint64)
+
+
+def _plain(words: np.ndarray) -> bool:
+    """True when every character is a digit (fixed-width PANs, no separators)."""
+    chars = words.view(np.uint8)
+    return chars.size == 0 or (chars.min() >= ZERO and chars.max() <= ZERO + 9)
+
+
+def _digit_rank(chars: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Digit mask, 0-based position of each digit counted from the right
+    (ignoring non-digits), and digit count per card.
+    """
+    is_digit = (chars - ZERO) < 10
+    rank     = np.cumsum(is_digit[:, ::-1], axis=1, dtype=np.int16)[:, ::-1] - 1
+    count    = rank[:, 0] + 1 if chars.shape[1] else np.zeros(len(chars), np.int16)
+    return is_digit, rank, count
+
+
+def _luhn_plain(words: np.ndarray) -> np.ndarray:
+    """
+    Luhn over all-digit rows, eight digits per uint64 word (SWAR).
+
+    In every byte lane: lanes at odd positions from the right are added a
+    second time (doubling) and 9 is taken off those above 4; the lanes of
+    words are accumulated and summed with a single multiply, folding
+    every three words so no lane sum reaches 256.
+    """
+    odd = np.zeros(words.shape[1] * 8, dtype=np.uint8)
+    odd[-2::-2] = 0xFF
+    odd = odd.view(np.uint64)
+
+    acc   = np.zeros(len(words), dtype=np.uint64)
+    total = np.zeros(len(words), dtype=np.uint16)
+    last  = words.shape[1] - 1
+    for w in range(words.shape[1]):         # one column at a time keeps loops long
+        digit = words[:, w] - np.uint64(ZERO * BYTES)
+        twice = digit & odd[w]
+        nine  = twice + np.uint64(0x7B * BYTES)      # bit 7 set where the lane > 4
+        nine &= np.uint64(0x80 * BYTES)
+        nine >>= np.uint64(7)
+        nine *= np.uint64(9)
+        acc += digit
+        acc += twice
+        acc -= nine
+        if w % 3 == 2 or w == last:         # fold lanes before they can overflow
+            acc *= np.uint64(BYTES)
+            acc >>= np.uint64(56)
+            total += acc.astype(np.uint16)
+            acc[:] = 0
+    return total % 10 == 0
+
+
+def _luhn_general(chars: np.ndarray, rank: tuple) -> np.ndarray:
+    is_digit, pos, _ = rank
+    digit   = np.where(is_digit, chars - ZERO, 0).astype(np.uint8)
+    doubled = is_digit & (pos % 2 == 1)
+    total   = np.where(doubled, LUHN_DOUBLE[digit], digit).sum(axis=1, dtype=np.int32)
+    return total % 10 == 0
+
+
+def _mask_plain(chars: np.ndarray) -> np.ndarray:
+    n, width = chars.shape
+    if width < 4:
+        return np.full(n, b"****", dtype="S4")
+    out = np.empty((n, width), dtype=np.uint8)
+    out[:, :width - 4] = STAR
+    out[:, width - 4:] = chars[:, width - 4:]
+    return out.view(f"S{width}").ravel()
+
+
+def _mask_general(chars: np.ndarray, rank: tuple) -> np.ndarray:
+    is_digit, pos, count = rank
+    n, width = chars.shape
+    out = np.zeros((n, max(width, 4)), dtype=np.uint8)
+
+    row, col = np.nonzero(is_digit)
+    r        = pos[row, col]
+    out[row, count[row] - 1 - r] = np.where(r < 4, chars[row, col], STAR)
+    out[count < 4, :4] = STAR
+    out[count < 4, 4:] = 0
+    return out.view(f"S{out.shape[1]}").ravel()
+
+
+def luhn_valid(chars: np.ndarray) -> np.ndarray:
+    """Bulk luhn_check over a card_matrix(): one bool per card."""
+    words = _words(chars)
+    if _plain(words):
+        return _luhn_plain(words)
+    return _luhn_general(chars, _digit_rank(chars))
+
+
+def mask_numbers(chars: np.ndarray) -> np.ndarray:
+    """
+    Bulk mask_number over a card_matrix(): a bytes array ("S" dtype) with
+    '*' for every digit but the last four, separators dropped, and
+    "****" for cards with fewer than four digits.
+    """
+    if _plain(_words(chars)):
+        return _mask_plain(chars)
+    return _mask_general(chars, _digit_rank(chars))
+
+
+def check_cards(data) -> tuple[np.ndarray, np.ndarray]:
+    """Luhn validity and masked numbers for every card in `data` (see card_matrix)."""
+    chars = card_matrix(data)
+    words = _words(chars)
+    if _plain(words):
+        return _luhn_plain(words), _mask_plain(chars)
+    rank = _digit_rank(chars)
+    return _luhn_general(chars, rank), _mask_general(chars, rank)
@@ -1,8 +1,10 @@
 from datetime import date, timedelta
+
+from progress import stage
 from ui import (
     section, subsection, alert, notice,
     ask, ask_yn, ask_int, ask_float, ask_choice, ask_percent,
-    card_ledger, score_meter, processing_bar, pause,
+    card_ledger, score_meter, pause,
     result_block, dti_bar,
     get_int, get_float,
     _fmt_inr, _fmt_inr_plain,
@@ -86,6 +88,13 @@ def get_credit_profile() -> list[dict]:
 
 # ── Credit Score Calculation ──────────────────────────────────────────────────
 
+# Score bands (lowest score for each class, best first) and credit-mix
+# weights by min(card count, 3); credit_bulk scores with the same tables.
+INDIA_BANDS = ((750, "EXCELLENT"), (650, "GOOD"), (550, "FAIR"))
+US_BANDS    = ((800, "EXCEPTIONAL"), (670, "GOOD"), (580, "FAIR"))
+MIX_WEIGHT  = {"1": 0.4, "2": 0.8, "3": 1.0}
+
+
 def combine_cards(cards: list[dict]) -> dict:
     total_limit   = sum(c["limit"]   for c in cards)
     total_balance = sum(c["balance"] for c in cards)
@@ -105,18 +114,17 @@ def calculate_credit_score(profile: dict) -> int:
     score += repayment                                        * 0.35 * 600
     score += max(0.0, 1 - profile["utilization"] / 100)     * 0.30 * 600
     score += min(profile["history"] / 20, 1.0)              * 0.15 * 600
-    score += {"1": 0.4, "2": 0.8, "3": 1.0}.get(
-                 profile["mix"], 0.4)                        * 0.10 * 600
+    score += MIX_WEIGHT.get(profile["mix"], 0.4)            * 0.10 * 600
     score += 0.10 * 600
     return round(min(score, 900))
 
 
+def _band(score: int, bands: tuple) -> str:
+    return next((label for cut, label in bands if score >= cut), "POOR")
+
+
 def classify_score(score: int) -> tuple[str, str]:
-    india = ("EXCELLENT" if score >= 750 else "GOOD" if score >= 650
-             else "FAIR" if score >= 550 else "POOR")
-    us    = ("EXCEPTIONAL" if score >= 800 else "GOOD" if score >= 670
-             else "FAIR" if score >= 580 else "POOR")
-    return india, us
+    return _band(score, INDIA_BANDS), _band(score, US_BANDS)
 
 
 # ── Alternative Credit Scoring ────────────────────────────────────────────────
@@ -136,12 +144,11 @@ def run_alternative_credit(return_score: bool = False) -> int | None:
     any_late     = ask_yn("Any late bills (last 12m)")
     late_penalty = 0.5 if any_late else 1.0
 
-    weighted    = employment_score * 0.40 + savings_score * 0.30 + late_penalty * 0.30
-    proxy_score = round(300 + weighted * 600)
-    rating      = ("Excellent" if proxy_score >= 750 else "Good" if proxy_score >= 650
-                   else "Fair" if proxy_score >= 550 else "Poor")
-
-    processing_bar("Computing Alternative Credit Score")
+    with stage("Computing Alternative Credit Score"):
+        weighted    = employment_score * 0.40 + savings_score * 0.30 + late_penalty * 0.30
+        proxy_score = round(300 + weighted * 600)
+        rating      = ("Excellent" if proxy_score >= 750 else "Good" if proxy_score >= 650
+                       else "Fair" if proxy_score >= 550 else "Poor")
     notice("📊", f"Calculated Proxy Credit Score : {proxy_score} ({rating})")
 
     if   proxy_score >= 750: suggested_rate = 6.5
@@ -177,8 +184,8 @@ def get_final_credit_score() -> float:
             alt = run_alternative_credit(return_score=True)
             return float(alt) if alt is not None else 0.0
 
-        processing_bar("Calculating Credit Score")
-        score = calculate_credit_score(combine_cards(valid_cards))
+        with stage("Calculating Credit Score"):
+            score = calculate_credit_score(combine_cards(valid_cards))
         score_meter(score)
         return float(score)
 
@@ -218,7 +225,7 @@ def analyze_debt_burden(total_emi: float, remaining_months: int,
 
     dti    = total_emi / income * 100
     status = ("Healthy"    if dti < 20 else
-              "Moderate"   if dti < 36 else
+              "Moderate"   if dti < DTI_LIMIT else
               "Risky"      if dti < 50 else
               "Dangerous")
     completion = date.today() + timedelta(days=remaining_months * 30)
@@ -228,7 +235,7 @@ def analyze_debt_burden(total_emi: float, remaining_months: int,
     print(f"  Status             : {status}")
     print(f"  Loans clear by     : {completion.strftime('%b %Y').upper()}")
 
-    if dti >= 36:
+    if dti >= DTI_LIMIT:
         alert("Recommendation: Consider applying after current loans are cleared.")
     else:
         notice("✅", "Debt ratio is manageable. You may proceed.")
@@ -236,6 +243,17 @@ def analyze_debt_burden(total_emi: float, remaining_months: int,
 
 # ── Tier & rate ───────────────────────────────────────────────────────────────
 
+DTI_LIMIT = 36   # % of income; a new loan above this is flagged CAUTION
+
+
+def dti_label(dti_pct: float) -> str:
+    if   dti_pct < 10:        return "Excellent"
+    elif dti_pct < 20:        return "Healthy"
+    elif dti_pct < DTI_LIMIT: return "Moderate"
+    elif dti_pct < 50:        return "Risky"
+    else:                     return "Dangerous"
+
+
 def determine_tier(score: float) -> tuple[str, float | None]:
     if   score >= 750: return "TIER 1 (PRIME)",     6.5
     elif score >= 650: return "TIER 2 (STANDARD)",  7.5
@@ -276,21 +294,20 @@ def run_loan_application(score: float) -> None:
     principal = ask_float("Enter Requested Amount", min_val=1.0, prefix="₹")
     years     = ask_int(  "Enter Desired Tenure",   min_val=1)
 
-    processing_bar("Processing Amortization Engine")
+    with stage("Processing Amortization Engine"):
+        # FIX: handle zero interest rate edge case to avoid ZeroDivisionError
+        months        = years * 12
+        monthly_rate  = rate / 100 / 12
+        if monthly_rate == 0:
+            emi = principal / months
+        else:
+            emi = (principal * monthly_rate * (1 + monthly_rate) ** months
+                   / ((1 + monthly_rate) ** months - 1))
+
+        total_payment  = emi * months
+        total_interest = total_payment - principal
     pause("PRESS ENTER TO VIEW RESULTS")
 
-    # FIX: handle zero interest rate edge case to avoid ZeroDivisionError
-    months        = years * 12
-    monthly_rate  = rate / 100 / 12
-    if monthly_rate == 0:
-        emi = principal / months
-    else:
-        emi = (principal * monthly_rate * (1 + monthly_rate) ** months
-               / ((1 + monthly_rate) ** months - 1))
-
-    total_payment  = emi * months
-    total_interest = total_payment - principal
-
     section("", "Loan Offer Summary")
     # FIX: all currency values now use Indian ₹ formatting
     print(f"\n  > Purpose          : {purpose}")
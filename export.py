@@ -1,19 +1,41 @@
 """
 export.py  –  CSV export for amortization schedule and yearly summary.
+
+export_csv writes the single-loan report; export_portfolio_csv streams
+many loans to per-section (optionally sharded / compressed) files.
 """
 import csv
+import gzip
 import os
 from datetime import datetime
+from typing import Iterable
+
+from amortization import iter_periods
+from mortgage import Mortgage
+from progress import stage
+from schedule import Schedule
+from yearly_summary import YearlyAccumulator
+
+SECTION_HEADERS = {
+    "summary":  "loan_id,principal,rate,years,emi,months,total_interest,total_payment",
+    "schedule": "loan_id,month,payment,principal,interest,balance",
+    "yearly":   "loan_id,year,interest_paid,principal_paid,ending_balance",
+}
 
 
-def export_csv(filepath: str, schedule: list[dict], yearly: list[dict],
-               loan: dict) -> None:
+def export_csv(filepath: str, schedule: Schedule | Iterable[dict],
+               yearly: list[dict] | None, loan: dict) -> None:
     """
     Writes two sheets to one CSV:
       - Loan summary header
       - Full amortization schedule
       - Yearly summary
+
+    `schedule` may be a stream from iter_schedule.  Pass yearly=None to
+    build the yearly summary in the same pass instead of a second one.
     """
+    acc = YearlyAccumulator() if yearly is None else None
+
     with open(filepath, "w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
 
@@ -34,6 +56,8 @@ def export_csv(filepath: str, schedule: list[dict], yearly: list[dict],
         w.writerow(["AMORTIZATION SCHEDULE"])
         w.writerow(["Month", "Payment", "Principal", "Interest", "Balance"])
         for row in schedule:
+            if acc is not None:
+                acc.add(row)
             w.writerow([
                 row["period"],
                 f"{row['payment']:.2f}",
@@ -46,10 +70,174 @@ def export_csv(filepath: str, schedule: list[dict], yearly: list[dict],
         # Yearly summary
         w.writerow(["YEARLY SUMMARY"])
         w.writerow(["Year", "Interest Paid", "Principal Paid", "Ending Balance"])
-        for row in yearly:
+        for row in (yearly if acc is None else acc.finish()):
             w.writerow([
                 row["year"],
                 f"{row['interest']:.2f}",
                 f"{row['principal']:.2f}",
                 f"{row['balance']:.2f}",
-            ])
\ No newline at end of file
+            ])
+
+
+def export_grid_csv(filepath: str, grid, metric: str = "emi") -> None:
+    """
+    Writes a rate × tenure sensitivity grid (sensitivity.SensitivityGrid)
+    as a plain matrix: one row per rate, one column per tenure.
+    """
+    values = grid.matrix(metric)
+    with open(filepath, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow([f"{metric.upper()} for principal {grid.principal:.2f}"])
+        w.writerow(["Rate %"] + [f"{int(y)} Years" for y in grid.years])
+        for rate, row in zip(grid.rates, values):
+            w.writerow([f"{rate:.2f}"] + [f"{v:.2f}" for v in row])
+
+
+# ── Portfolio (streaming) export ──────────────────────────────────────────────
+
+def _open_text(path: str, compression: str | None):
+    if compression is None:
+        return open(path, "w", newline="", encoding="utf-8")
+    if compression == "gzip":
+        return gzip.open(path, "wt", newline="", encoding="utf-8", compresslevel=6)
+    if compression == "zstd":
+        try:
+            from compression import zstd          # Python 3.14+
+        except ImportError:
+            try:
+                import zstandard as zstd
+            except ImportError:
+                raise ImportError("zstd output needs Python 3.14+ or "
+                                  "'pip install zstandard'") from None
+        return zstd.open(path, "wt", newline="", encoding="utf-8")
+    raise ValueError(f"Unknown compression: {compression!r}")
+
+
+class _SectionWriter:
+    """
+    Buffers one CSV section and writes it out in large chunks.
+
+    When shard_size is set, output rolls over to a new numbered file every
+    shard_size loans.
+    """
+    EXT = {None: ".csv", "gzip": ".csv.gz", "zstd": ".csv.zst"}
+
+    def __init__(self, directory: str, section: str, compression: str | None,
+                 shard_size: int | None, buffer_rows: int) -> None:
+        self.directory   = directory
+        self.section     = section
+        self.compression = compression
+        self.shard_size  = shard_size
+        self.buffer_rows = buffer_rows
+        self.buffer: list[str] = []
+        self.file   = None
+        self.shard  = -1
+        self.paths: list[str] = []
+        self.rows   = 0
+        self.chars  = 0
+
+    def start_loan(self, loan_id: int) -> None:
+        shard = (loan_id - 1) // self.shard_size if self.shard_size else 0
+        if shard != self.shard:
+            self._roll(shard)
+
+    def write(self, line: str) -> None:
+        self.buffer.append(line)
+        if len(self.buffer) >= self.buffer_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.buffer:
+            chunk = "\n".join(self.buffer) + "\n"
+            self.file.write(chunk)
+            self.rows  += len(self.buffer)
+            self.chars += len(chunk)
+            self.buffer.clear()
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.flush()
+            self.file.close()
+            self.file = None
+
+    def _roll(self, shard: int) -> None:
+        self.close()
+        self.shard = shard
+        suffix = f"-{shard:05d}" if self.shard_size else ""
+        path   = os.path.join(self.directory,
+                              f"{self.section}{suffix}{self.EXT[self.compression]}")
+        self.file = _open_text(path, self.compression)
+        self.file.write(SECTION_HEADERS[self.section] + "\n")
+        self.paths.append(path)
+
+
+def export_portfolio_csv(
+    directory: str,
+    loans: Iterable[tuple],
+    compression: str | None = None,
+    shard_size: int | None = None,
+    buffer_rows: int = 10_000,
+    payments_per_year: int = 12,
+) -> dict:
+    """
+    Stream schedules for many loans to CSV, one file per section.
+
+    Each loan is a (principal, rate, years[, extra, lump, lump_month])
+    tuple.  Loans are amortized one at a time and rows are written in
+    buffered chunks, so memory stays flat however many loans are exported.
+
+    Writes summary, schedule and yearly sections to separate files in
+    `directory`; with shard_size, each section is split into numbered files
+    of shard_size loans.  compression may be None, "gzip" or "zstd".
+
+    Returns keys: loans, rows, chars, files.
+    """
+    if compression not in _SectionWriter.EXT:
+        raise ValueError(f"Unknown compression: {compression!r}")
+    os.makedirs(directory, exist_ok=True)
+    writers = {
+        name: _SectionWriter(directory, name, compression, shard_size, buffer_rows)
+        for name in SECTION_HEADERS
+    }
+    summary, schedule, yearly = writers["summary"], writers["schedule"], writers["yearly"]
+    total = len(loans) if hasattr(loans, "__len__") else None
+    count = 0
+
+    try:
+        with stage("Exporting portfolio CSV", total, "loans") as st:
+            for loan_id, loan_args in enumerate(loans, start=1):
+                principal, rate, years, *prepay = loan_args
+                extra, lump, lump_month = prepay + [0.0, 0.0, 0][len(prepay):]
+                mortgage = Mortgage(principal, rate, years, payments_per_year)
+                acc      = YearlyAccumulator(payments_per_year)
+                interest = 0.0
+                months   = 0
+
+                for w in writers.values():
+                    w.start_loan(loan_id)
+
+                for period, pay, prin, intr, bal in iter_periods(mortgage, extra, lump, lump_month):
+                    schedule.write(f"{loan_id},{period},{pay:.2f},{prin:.2f},{intr:.2f},{bal:.2f}")
+                    acc.add({"interest": intr, "principal": prin, "balance": bal})
+                    interest += intr
+                    months    = period
+
+                for row in acc.finish():
+                    yearly.write(f"{loan_id},{row['year']},{row['interest']:.2f},"
+                                 f"{row['principal']:.2f},{row['balance']:.2f}")
+
+                summary.write(f"{loan_id},{principal:.2f},{rate},{years},"
+                              f"{mortgage.emi():.2f},{months},{interest:.2f},"
+                              f"{principal + interest:.2f}")
+                count = loan_id
+                st.advance()
+    finally:
+        for w in writers.values():
+            w.close()
+
+    return {
+        "loans": count,
+        "rows":  sum(w.rows  for w in writers.values()),
+        "chars": sum(w.chars for w in writers.values()),
+        "files": [p for w in writers.values() for p in w.paths],
+    }
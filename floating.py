@@ -0,0 +1,258 @@
+"""
+floating.py  –  Closed-form engine for floating-rate loans with rate resets.
+
+A rate path is a list of (effective period, annual rate %) events; each
+new rate applies from that period on.  Between resets the rate is
+constant, so every segment is evaluated with the annuity formulas in one
+step instead of month by month.
+
+At each reset the lender either
+  "emi"     recomputes the EMI so the loan still ends on its original term, or
+  "tenure"  keeps the EMI and lets the term run shorter or longer.
+
+In "tenure" mode the term is capped at `max_years`; when the kept EMI can
+no longer clear the balance within it (or no longer covers the interest)
+the EMI is raised to what finishes exactly at the cap.
+
+    floating_payoff(Mortgage(5_000_000, 8.5, 20), [(13, 9.0), (25, 9.25)])
+
+floating_payoff_paths runs the same segment arithmetic over many rate paths
+that share a reset schedule at once, one numpy step per segment.  That is
+the path for simulation-sized workloads (well over 100k paths/s at
+quarterly resets): floating_payoff pays Python overhead per segment, so
+with frequent resets it is no faster than stepping month by month and
+only pulls ahead when resets are sparse.
+"""
+import math
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:      # numpy is optional; only floating_payoff_paths needs it
+    np = None
+
+MODES = ("emi", "tenure")
+
+
+def _annuity(balance: float, r: float, n: int) -> float:
+    """Level payment that clears `balance` in n periods at periodic rate r."""
+    if r == 0:
+        return balance / n
+    g = (1 + r) ** n
+    return balance * r * g / (g - 1)
+
+
+def _balance_after(balance: float, r: float, payment: float, k: int) -> float:
+    """Balance left after k payments of `payment` at periodic rate r."""
+    if k <= 0:
+        return balance
+    if r == 0:
+        return balance - payment * k
+    g = (1 + r) ** k
+    return balance * g - payment * (g - 1) / r
+
+
+def _periods_needed(balance: float, r: float, payment: float) -> float:
+    """Payments of `payment` needed to clear `balance`; inf if it never clears."""
+    if r == 0:
+        return math.ceil(balance / payment - 1e-9)
+    if payment <= balance * r:
+        return math.inf
+    return math.ceil(-math.log1p(-balance * r / payment) / math.log1p(r) - 1e-9)
+
+
+def rate_segments(annual_rate: float, resets) -> list[tuple[int, float]]:
+    """
+    (first period, annual rate) for every constant-rate segment.
+
+    Events are sorted by period; events at or before period 1 replace the
+    opening rate, and of several events on one period the last one wins.
+    """
+    segments = [(1, annual_rate)]
+    for period, rate in sorted(resets, key=itemgetter(0)):
+        period = max(1, int(period))
+        if period == segments[-1][0]:
+            segments[-1] = (period, rate)
+        else:
+            segments.append((period, rate))
+    return segments
+
+
+def floating_payoff(
+    mortgage,
+    resets,
+    mode: str = "emi",
+    max_years: int = 40,
+    detail: bool = True,
+) -> dict:
+    """
+    Amortize a loan along a rate path, one closed-form step per segment.
+
+    `mortgage.annual_rate` is the opening rate and `resets` the
+    (period, annual rate %) events.  Figures are unrounded and follow the
+    engine's final-instalment rule, so they match a month-by-month run of
+    the same path.
+
+    Returns keys: months, total_interest, emi (the last instalment level),
+    max_emi, and with `detail` a "segments" list of dicts with keys start,
+    rate, emi, periods, interest, balance.
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of: {', '.join(MODES)}")
+
+    ppy     = mortgage.payments_per_year
+    end     = mortgage.total_payments()       # last period of the current term
+    limit   = max_years * ppy
+    balance = mortgage.principal
+    emi     = None
+    max_emi = 0.0
+
+    months, total_interest, rows = 0, 0.0, []
+    points = rate_segments(mortgage.annual_rate, resets)
+
+    for i, (start, annual) in enumerate(points):
+        if balance <= 0 or start > end:
+            break
+        r = annual / 100 / ppy
+
+        # n: payments left from `start` under this segment's EMI
+        if mode == "emi" or emi is None:
+            n   = end - start + 1
+            emi = _annuity(balance, r, n)
+        else:
+            n = _periods_needed(balance, r, emi)
+            if start - 1 + n > limit:
+                n   = max(limit - start + 1, 1)
+                emi = _annuity(balance, r, n)
+            end = start - 1 + n
+
+        # Payments at this rate: up to the next reset or the end of the term
+        span = (points[i + 1][0] if i + 1 < len(points) else end + 1) - start
+
+        # Interest on k payments = k EMIs less the principal they retire,
+        # with the last one covering only what is left plus its interest
+        k        = min(span, n)
+        before   = _balance_after(balance, r, emi, k - 1)
+        interest = emi * (k - 1) - (balance - before) + before * r
+        balance  = 0.0 if span >= n else before * (1 + r) - emi
+
+        months         += k
+        total_interest += interest
+        if emi > max_emi:
+            max_emi = emi
+
+        if detail:
+            rows.append({
+                "start":    start,
+                "rate":     annual,
+                "emi":      emi,
+                "periods":  k,
+                "interest": interest,
+                "balance":  balance,
+            })
+
+    result = {
+        "months":         months,
+        "total_interest": total_interest,
+        "emi":            emi,
+        "max_emi":        max_emi,
+    }
+    if detail:
+        result["segments"] = rows
+    return result
+
+
+# ── Many paths at once (numpy) ───────────────────────────────────────────────
+
+def _annuity_v(balance, r, n):
+    g = np.power(1 + r, n)
+    return np.where(r == 0, balance / n, balance * r * g / np.where(r == 0, 1, g - 1))
+
+
+def _balance_after_v(balance, r, payment, k):
+    g = np.power(1 + r, k)
+    return np.where(r == 0, balance - payment * k,
+                    balance * g - payment * (g - 1) / np.where(r == 0, 1, r))
+
+
+def floating_payoff_paths(
+    mortgage,
+    periods,
+    rates,
+    mode: str = "emi",
+    max_years: int = 40,
+) -> dict:
+    """
+    floating_payoff for every row of `rates` at once.
+
+    `periods` are the reset periods shared by all paths (ascending) and
+    `rates` a (paths, len(periods)) array of the annual rate % each path
+    moves to at those periods; `mortgage.annual_rate` is the opening rate.
+    Figures agree with floating_payoff path by path.
+
+    Returns keys months, total_interest, emi, max_emi, each an array with
+    one value per path.  Requires numpy.
+    """
+    if np is None:
+        raise ImportError("floating_payoff_paths requires numpy")
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of: {', '.join(MODES)}")
+
+    rates   = np.asarray(rates, dtype=float)
+    periods = np.maximum(np.asarray(periods, dtype=np.int64), 1)
+    if rates.ndim != 2 or rates.shape[1] != len(periods):
+        raise ValueError("rates must be a (paths, len(periods)) array")
+    if len(periods) and periods[0] == 1:
+        starts, columns = periods, rates
+    else:
+        starts  = np.concatenate(([1], periods))
+        columns = np.column_stack((np.full(len(rates), float(mortgage.annual_rate)), rates))
+
+    ppy     = mortgage.payments_per_year
+    limit   = max_years * ppy
+    paths   = len(rates)
+    end     = np.full(paths, float(mortgage.total_payments()))
+    balance = np.full(paths, float(mortgage.principal))
+    emi     = np.zeros(paths)
+    max_emi = np.zeros(paths)
+    months  = np.zeros(paths)
+    total   = np.zeros(paths)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for j, start in enumerate(starts.tolist()):
+            active = (balance > 0) & (start <= end)
+            if not active.any():
+                break
+            r = columns[:, j] / 100 / ppy
+
+            if mode == "emi" or j == 0:
+                n       = end - start + 1
+                new_emi = _annuity_v(balance, r, n)
+            else:
+                needed = np.where(r == 0, np.ceil(balance / emi - 1e-9),
+                                  np.ceil(-np.log1p(-balance * r / emi) / np.log1p(r) - 1e-9))
+                needed = np.where((r != 0) & (emi <= balance * r), np.inf, needed)
+                capped  = start - 1 + needed > limit
+                n       = np.where(capped, max(limit - start + 1, 1), needed)
+                new_emi = np.where(capped, _annuity_v(balance, r, n), emi)
+                end     = np.where(active, start - 1 + n, end)
+
+            nxt      = starts[j + 1] if j + 1 < len(starts) else end + 1
+            span     = nxt - start
+            k        = np.minimum(span, n)
+            before   = _balance_after_v(balance, r, new_emi, k - 1)
+            interest = new_emi * (k - 1) - (balance - before) + before * r
+            after    = np.where(span >= n, 0.0, before * (1 + r) - new_emi)
+
+            months  += np.where(active, k, 0)
+            total   += np.where(active, interest, 0.0)
+            balance  = np.where(active, after, balance)
+            emi      = np.where(active, new_emi, emi)
+            max_emi  = np.maximum(max_emi, emi)
+
+    return {
+        "months":         months.astype(np.int64),
+        "total_interest": total,
+        "emi":            emi,
+        "max_emi":        max_emi,
+    }
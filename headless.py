@@ -0,0 +1,181 @@
+"""
+headless.py  –  Non-interactive batch mode for loan files.
+
+    python main.py batch loans.csv [-o results.csv]
+
+Streams applicant rows from CSV or JSONL, runs the same credit tiering,
+amortization and DTI checks as the single-loan flow, and writes one
+result row per input row.  Nothing is drawn on the terminal and nothing
+sleeps; only a one-line summary with rows/s is printed at the end.
+Rows are read and written one at a time, so memory stays flat however
+long the file is.
+
+Input columns (missing optional ones default to 0):
+  id, score, principal, years, income        : required (years 1–MAX_YEARS)
+  existing_emi, cc_min_pay                   : for DTI
+  extra, lump, lump_month                    : prepayment
+
+A row that cannot be decoded or evaluated becomes an ERROR result row;
+the rest of the file is still processed.
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+from typing import Iterable, Iterator
+
+from credit_tool import DTI_LIMIT, determine_tier, dti_label
+from mortgage import Mortgage, validate_terms
+from prepayment import prepayment_savings, validate_prepayment
+from progress import configure, stage, timings
+
+OUTPUT_FIELDS = (
+    "id", "score", "tier", "rate", "emi", "months", "total_interest",
+    "months_saved", "interest_saved", "current_dti", "new_dti",
+    "dti_label", "status", "error",
+)
+
+
+def _is_jsonl(path: str) -> bool:
+    return path.lower().endswith((".jsonl", ".ndjson"))
+
+
+def _records(path: str) -> Iterator[dict | str]:
+    """Yield raw records: dicts for CSV, undecoded lines for JSONL."""
+    with open(path, newline="", encoding="utf-8") as f:
+        if _is_jsonl(path):
+            for line in f:
+                if line.strip():
+                    yield line
+        else:
+            yield from csv.DictReader(f)
+
+
+def _as_row(record: dict | str) -> dict:
+    row = json.loads(record) if isinstance(record, str) else record
+    if not isinstance(row, dict):
+        raise ValueError(f"expected an object, got {type(row).__name__}")
+    return row
+
+
+def _num(row: dict, key: str, cast=float, default=0):
+    value = row.get(key)
+    return cast(value) if value not in (None, "") else default
+
+
+def evaluate(row: dict) -> dict:
+    """Tier, EMI, payoff and DTI for one applicant row (same rules as main)."""
+    score      = _num(row, "score", float, None)
+    principal  = _num(row, "principal")
+    years      = _num(row, "years", int)
+    income     = _num(row, "income")
+    obligation = _num(row, "existing_emi") + _num(row, "cc_min_pay")
+    extra      = _num(row, "extra")
+    lump       = _num(row, "lump")
+    lump_month = _num(row, "lump_month", int)
+    if score is None:
+        raise ValueError("score is required")
+    principal, _, years = validate_terms(principal, 0, years)   # rate comes from the tier
+    if not (math.isfinite(income) and income > 0):
+        raise ValueError("income is required and must be positive")
+    extra, lump, lump_month = validate_prepayment(extra, lump, lump_month)
+
+    tier, rate = determine_tier(score)
+    out = {"id": row.get("id", ""), "score": score, "tier": tier, "rate": rate}
+    if rate is None:
+        return {**out, "status": "DENIED"}
+
+    loan    = Mortgage(principal, rate, years)
+    savings = prepayment_savings(loan, extra, lump, lump_month)
+    emi     = loan.emi()
+
+    current_dti = obligation / income * 100
+    new_dti     = (obligation + emi + extra) / income * 100
+
+    return {
+        **out,
+        "emi":            round(emi, 2),
+        "months":         savings["months"],
+        "total_interest": round(savings["total_interest"], 2),
+        "months_saved":   savings["months_saved"],
+        "interest_saved": round(savings["interest_saved"], 2),
+        "current_dti":    round(current_dti, 2),
+        "new_dti":        round(new_dti, 2),
+        "dti_label":      dti_label(new_dti),
+        "status":         "APPROVED" if new_dti < DTI_LIMIT else "CAUTION",
+    }
+
+
+def _results(records: Iterable[dict | str]) -> Iterator[dict]:
+    for n, record in enumerate(records, start=1):
+        row = {}
+        try:
+            row = _as_row(record)
+            yield evaluate(row)
+        except (ArithmeticError, KeyError, TypeError, ValueError) as exc:   # incl. JSONDecodeError
+            yield {"id": row.get("id", f"row {n}"), "status": "ERROR",
+                   "error": f"{type(exc).__name__}: {exc}"}
+
+
+def run_batch(input_path: str, output_path: str) -> dict:
+    """
+    Evaluate every row of input_path and write results to output_path
+    (JSONL if it ends in .jsonl/.ndjson, CSV otherwise).
+
+    Returns keys: rows, approved, caution, denied, errors, seconds, rows_per_sec.
+    """
+    counts = {"APPROVED": 0, "CAUTION": 0, "DENIED": 0, "ERROR": 0}
+    start  = time.perf_counter()
+
+    with open(output_path, "w", newline="", encoding="utf-8") as f:
+        if _is_jsonl(output_path):
+            write = lambda res: f.write(json.dumps(res) + "\n")
+        else:
+            w = csv.DictWriter(f, fieldnames=OUTPUT_FIELDS)
+            w.writeheader()
+            write = w.writerow
+        with stage("Evaluating loan file", unit="rows") as st:
+            for res in _results(_records(input_path)):
+                counts[res["status"]] += 1
+                write(res)
+                st.advance()
+
+    seconds = time.perf_counter() - start
+    rows    = sum(counts.values())
+    return {
+        "rows":         rows,
+        "approved":     counts["APPROVED"],
+        "caution":      counts["CAUTION"],
+        "denied":       counts["DENIED"],
+        "errors":       counts["ERROR"],
+        "seconds":      round(seconds, 3),
+        "rows_per_sec": round(rows / seconds) if seconds else 0,
+    }
+
+
+def cli(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(prog="main.py batch",
+                                     description="Evaluate a loan file without prompts.")
+    parser.add_argument("input", help="loan file (.csv or .jsonl)")
+    parser.add_argument("-o", "--output",
+                        help="result file (default: <input>_results.csv)")
+    parser.add_argument("--timings", action="store_true",
+                        help="print wall / CPU time per stage to stderr")
+    args = parser.parse_args(argv)
+
+    output = args.output or f"{os.path.splitext(args.input)[0]}_results.csv"
+    if args.timings:
+        configure(record=True)
+    stats  = run_batch(args.input, output)
+    print(f"{stats['rows']:,} rows in {stats['seconds']:.2f}s "
+          f"({stats['rows_per_sec']:,} rows/s) → {output}  "
+          f"[approved {stats['approved']}, caution {stats['caution']}, "
+          f"denied {stats['denied']}, errors {stats['errors']}]",
+          file=sys.stderr)
+    if args.timings:
+        for t in timings():
+            print(f"  {t['stage']:<28} {t['units']:>10,} {t['unit']:<10} "
+                  f"wall {t['wall']:.3f}s  cpu {t['cpu']:.3f}s", file=sys.stderr)
@@ -0,0 +1,82 @@
+"""
+incremental.py  –  What-if recalculation that reuses the unchanged prefix.
+
+Changing only the lump sum (amount or month) leaves every period before
+the first affected one untouched.  IncrementalSchedule keeps recent
+schedules for one loan together with their unrounded balance after every
+period (the checkpoints), copies the longest shared prefix and runs the
+engine only for the remaining periods.  Results are identical to
+generate_schedule.
+
+    engine = IncrementalSchedule(loan)
+    engine.schedule(extra, lump, lump_month)     # full run
+    engine.schedule(extra, lump, lump_month + 6) # only months >= lump_month
+"""
+from array import array
+from collections import OrderedDict
+
+from amortization import iter_periods
+from schedule import COLUMNS, Schedule
+
+NEVER = float("inf")
+
+
+def first_change(old: tuple, new: tuple) -> float:
+    """First period whose row can differ between two (extra, lump, month) keys."""
+    if old == new:
+        return NEVER
+    if old[0] != new[0]:
+        return 1                    # extra payment changes every period
+    return min(month for _, lump, month in (old, new) if lump)
+
+
+class IncrementalSchedule:
+    """
+    Schedules for one Mortgage under changing prepayment settings.
+
+    The `keep` most recently used schedules are retained as checkpoints.
+    Returned Schedules are shared with the cache; treat them as read-only.
+    """
+    def __init__(self, mortgage, keep: int = 8) -> None:
+        self.mortgage = mortgage
+        self.keep     = keep
+        self._cache: OrderedDict[tuple, tuple[Schedule, array]] = OrderedDict()
+        self.reused   = 0       # rows copied from checkpoints, for diagnostics
+
+    def schedule(self, extra_payment: float = 0.0, lump_sum: float = 0.0,
+                 lump_sum_month: int = 0) -> Schedule:
+        # A lump sum that is zero or falls outside the term is never applied
+        applied = lump_sum and 1 <= lump_sum_month <= self.mortgage.total_payments()
+        key     = ((extra_payment, lump_sum, lump_sum_month) if applied
+                   else (extra_payment, 0.0, 0))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key][0]
+
+        # Longest prefix any cached schedule shares with the new settings
+        prefix, base = 0, None
+        for old_key, entry in self._cache.items():
+            shared = min(first_change(old_key, key) - 1, len(entry[0]))
+            if shared > prefix:
+                prefix, base = int(shared), entry
+
+        if base is not None and prefix == len(base[0]):
+            # The old schedule ended before any difference: same schedule
+            sched, balances = base
+        else:
+            sched    = Schedule()
+            balances = array("d")
+            opening  = None
+            if base is not None:
+                for column in COLUMNS:
+                    getattr(sched, column).extend(getattr(base[0], column)[:prefix])
+                balances.extend(base[1][:prefix])
+                opening = balances[-1]
+            sched.extend(iter_periods(self.mortgage, *key, start=prefix + 1,
+                                      balance=opening, checkpoints=balances))
+        self.reused += prefix
+
+        self._cache[key] = (sched, balances)
+        if len(self._cache) > self.keep:
+            self._cache.popitem(last=False)
+        return sched
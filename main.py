@@ -2,15 +2,20 @@
 main.py  –  FIN-TECH ANALYTICS ENGINE v2.0
 Entry point.  All input → clear → results → action menu.
 """
+import sys
 from datetime import date, timedelta
 
+import progress
+from progress import stage
 from mortgage import Mortgage
-from amortization import generate_schedule
+from incremental import IncrementalSchedule
+from schedule import Schedule
 from yearly_summary import generate_yearly_summary
-from credit_tool import get_final_credit_score, run_loan_application
+from prepayment import prepayment_savings
+from credit_tool import DTI_LIMIT, dti_label, get_final_credit_score, run_loan_application
 from ui import (
     banner, section, bullet, subsection, clear, pause, alert, notice,
-    processing_bar, action_menu,
+    action_menu,
     stat_boxes, dti_bar, payment_breakdown_bar, amort_table,
     score_meter, prepayment_impact, debt_free_date,
     ask, ask_int, ask_float, ask_percent, ask_choice, ask_yn,
@@ -46,17 +51,9 @@ def _debt_free(months: int) -> str:
     return debt_free_date(months)
 
 
-def _dti_label(dti_pct: float) -> str:
-    if   dti_pct < 10:  return "Excellent"
-    elif dti_pct < 20:  return "Healthy"
-    elif dti_pct < 36:  return "Moderate"
-    elif dti_pct < 50:  return "Risky"
-    else:               return "Dangerous"
-
-
 # ── Action menu handler ───────────────────────────────────────────────────────
 
-def _handle_actions(loan: Mortgage, schedule: list[dict],
+def _handle_actions(loan: Mortgage, schedule: Schedule,
                     yearly: list[dict], prep: dict,
                     credit: dict | None, borrower: dict | None) -> bool:
     """
@@ -83,14 +80,13 @@ def _handle_actions(loan: Mortgage, schedule: list[dict],
 def _do_pdf(loan, schedule, yearly, prep, credit, borrower):
     from pdf import export_pdf
     path = f"loan_report_{date.today().isoformat()}.pdf"
-    processing_bar("Generating PDF Report")
-    export_pdf(path, {
+    data = {
         "loan": {
             "principal":      loan.principal,
             "rate":           loan.annual_rate,
             "years":          loan.years,
             "emi":            loan.emi(),
-            "total_interest": sum(r["interest"] for r in schedule),
+            "total_interest": schedule.total_interest(),
             "months":         len(schedule),
         },
         "schedule": schedule,
@@ -98,27 +94,31 @@ def _do_pdf(loan, schedule, yearly, prep, credit, borrower):
         "prepayment": prep,
         "credit":   credit   or {},
         "borrower": borrower or {},
-    })
+    }
+    with stage("Generating PDF Report"):
+        export_pdf(path, data)
     print(f"  ✅  PDF saved → {path}")
 
 
 def _do_csv(loan, schedule, yearly):
     from export import export_csv
     path = f"loan_report_{date.today().isoformat()}.csv"
-    processing_bar("Exporting CSV")
-    export_csv(path, schedule, yearly, {
-        "principal":      loan.principal,
-        "rate":           loan.annual_rate,
-        "years":          loan.years,
-        "emi":            loan.emi(),
-        "total_interest": sum(r["interest"] for r in schedule),
-    })
+    with stage("Exporting CSV"):
+        export_csv(path, schedule, yearly, {
+            "principal":      loan.principal,
+            "rate":           loan.annual_rate,
+            "years":          loan.years,
+            "emi":            loan.emi(),
+            "total_interest": schedule.total_interest(),
+        })
     print(f"  ✅  CSV saved → {path}")
 
 
 # ── Single Loan Flow ──────────────────────────────────────────────────────────
 
 def run_single_loan() -> None:
+    engine = None   # reused across Recalculate while the loan terms stay the same
+
     while True:   # outer loop for Recalculate
 
         # ── STEP 1: FINANCIAL PROFILE ─────────────────────────────────────
@@ -200,18 +200,18 @@ def run_single_loan() -> None:
             lump_month = ask_int("Lump Sum Month", min_val=1)
 
         # ── COMPUTE ───────────────────────────────────────────────────────
-        processing_bar("Running Amortization Engine")
-
-        loan         = Mortgage(principal, base_rate, years)
-        normal_sched = generate_schedule(loan)
-        schedule     = generate_schedule(loan, extra_payment=extra,
-                                         lump_sum=lump, lump_sum_month=lump_month)
-        yearly       = generate_yearly_summary(schedule)
-
-        total_interest = sum(r["interest"] for r in schedule)
+        with stage("Running Amortization Engine"):
+            loan = Mortgage(principal, base_rate, years)
+            if engine is None or engine.mortgage != loan:
+                engine = IncrementalSchedule(loan)
+            schedule = engine.schedule(extra, lump, lump_month)
+            yearly   = generate_yearly_summary(schedule)
+            savings  = prepayment_savings(loan, extra, lump, lump_month)
+
+        total_interest = schedule.total_interest()
         total_paid     = principal + total_interest
-        months_saved   = len(normal_sched) - len(schedule)
-        interest_saved = (sum(r["interest"] for r in normal_sched) - total_interest)
+        months_saved   = savings["months_saved"]
+        interest_saved = savings["interest_saved"]
 
         current_dti = (exist_emi + cc_min_pay) / income * 100 if income else 0
         new_emi_val = loan.emi() + extra
@@ -269,16 +269,16 @@ def run_single_loan() -> None:
         dti_bar("Current DTI", current_dti)
         dti_bar("New DTI",     new_dti)
 
-        dti_ok = new_dti < 36
+        dti_ok = new_dti < DTI_LIMIT
         dot    = "🟢" if dti_ok else "🔴"
-        status = ("APPROVED (DTI below 36% threshold)"
+        status = (f"APPROVED (DTI below {DTI_LIMIT}% threshold)"
                   if dti_ok else "CAUTION – DTI exceeds safe threshold")
         print(f"  Status: {dot} {status}")
 
         # ── System Calculation Summary ────────────────────────────────────
         bullet("SYSTEM CALCULATION")
-        print(f"  > Current DTI:   {current_dti:.1f}% ({_dti_label(current_dti)})")
-        print(f"  > Projected DTI: {new_dti:.1f}% ({_dti_label(new_dti)})")
+        print(f"  > Current DTI:   {current_dti:.1f}% ({dti_label(current_dti)})")
+        print(f"  > Projected DTI: {new_dti:.1f}% ({dti_label(new_dti)})")
         print(f"  > Interest Rate: {base_rate}% (based on credit score)")
         print(f"  > Monthly EMI:   {inr(loan.emi())}")
 
@@ -313,8 +313,8 @@ def run_comparison() -> None:
         income    = ask_float("Monthly Income",    min_val=0.01, prefix="₹")
         exist_emi = ask_float("Existing Monthly EMI", min_val=0.0, prefix="₹")
 
-        processing_bar("Comparing Loans")
-        results = compare_loans(loans)
+        with stage("Comparing Loans"):
+            results = compare_loans(loans)
 
         rec_idx = min(range(len(results)), key=lambda i: results[i]["interest"])
 
@@ -329,10 +329,10 @@ def run_comparison() -> None:
         new_dti  = (exist_emi + rec_emi) / income * 100 if income else 0
         dti_bar("Current DTI", curr_dti)
         dti_bar("New DTI",     new_dti)
-        dti_ok = new_dti < 36
+        dti_ok = new_dti < DTI_LIMIT
         dot    = "🟢" if dti_ok else "🔴"
         print(f"  Status: {dot} {'APPROVED' if dti_ok else 'CAUTION'}"
-              f" (DTI {'below' if dti_ok else 'above'} 36% threshold)")
+              f" (DTI {'below' if dti_ok else 'above'} {DTI_LIMIT}% threshold)")
 
         # Comparison table
         opts = [{"rate": r["rate"], "years": r["years"], "emi": r["emi"],
@@ -369,6 +369,12 @@ def run_credit_only() -> None:
 # ── Main Menu ─────────────────────────────────────────────────────────────────
 
 def main() -> None:
+    if sys.argv[1:2] == ["batch"]:
+        from headless import cli
+        cli(sys.argv[2:])
+        return
+
+    progress.configure(display=True)
     clear()
     banner()
 
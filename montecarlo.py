@@ -0,0 +1,200 @@
+"""
+montecarlo.py  –  Monte Carlo interest-rate scenarios for one loan.
+
+Rate paths follow a mean-reverting (Vasicek / Ornstein-Uhlenbeck) model
+sampled at each reset, are generated as arrays and amortized all at once
+with floating.floating_payoff_paths.  Paths are split into fixed-size
+chunks spread over a process pool; every chunk draws from its own child
+of one SeedSequence, so a given seed gives the same result for any worker
+count.
+
+    python montecarlo.py 5000000 8.5 20 --paths 100000 --mode tenure
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from floating import MODES, floating_payoff_paths
+from mortgage import Mortgage
+
+METRICS     = ("total_interest", "months", "emi")
+PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def rate_paths(
+    rng: np.random.Generator,
+    paths: int,
+    steps: int,
+    start: float,
+    mean: float,
+    speed: float,
+    vol: float,
+    dt: float,
+    floor: float = 0.0,
+) -> np.ndarray:
+    """
+    (paths, steps) annual rates % on a mean-reverting path from `start`.
+
+    Uses the exact Ornstein-Uhlenbeck transition over each step of `dt`
+    years: the gap to `mean` decays at `speed` per year and `vol` is the
+    instantaneous volatility in percentage points per sqrt(year).  Rates
+    are floored at `floor`.
+    """
+    decay = np.exp(-speed * dt)
+    sd    = vol * np.sqrt((1 - decay ** 2) / (2 * speed)) if speed else vol * np.sqrt(dt)
+    shocks = rng.standard_normal((paths, steps)) * sd
+
+    rates = np.empty((paths, steps))
+    level = np.full(paths, float(start))
+    for t in range(steps):
+        level = mean + (level - mean) * decay + shocks[:, t]
+        rates[:, t] = level
+    return np.maximum(rates, floor)
+
+
+def _run_chunk(args: tuple) -> dict:
+    mortgage, periods, paths, seed, model, mode, max_years = args
+    rng   = np.random.default_rng(seed)
+    rates = rate_paths(rng, paths, len(periods), mortgage.annual_rate, **model)
+    out   = floating_payoff_paths(mortgage, periods, rates, mode, max_years)
+    return {
+        "total_interest": out["total_interest"],
+        "months":         out["months"],
+        "emi":            out["max_emi"],
+    }
+
+
+def _summarize(samples: dict, percentiles, bins: int) -> dict:
+    stats = {}
+    for metric in METRICS:
+        values = samples[metric]
+        counts, edges = np.histogram(values, bins=bins)
+        stats[metric] = {
+            "mean":        float(values.mean()),
+            "percentiles": {p: float(v) for p, v in
+                            zip(percentiles, np.percentile(values, percentiles))},
+            "histogram":   {"counts": counts.tolist(), "edges": edges.tolist()},
+        }
+    return stats
+
+
+def simulate(
+    mortgage: Mortgage,
+    paths: int = 10_000,
+    mode: str = "emi",
+    resets_per_year: int = 4,
+    mean: float | None = None,
+    speed: float = 0.3,
+    vol: float = 1.0,
+    floor: float = 0.0,
+    max_years: int = 40,
+    seed: int = 0,
+    workers: int | None = None,
+    chunk_size: int = 10_000,
+    percentiles=PERCENTILES,
+    bins: int = 20,
+    keep_samples: bool = False,
+) -> dict:
+    """
+    Distribution of total interest, tenure (months) and peak EMI across
+    `paths` simulated rate paths for `mortgage`.
+
+    Rates start at mortgage.annual_rate and revert towards `mean` (default:
+    the same rate) and reset every ppy // resets_per_year payments.
+    `mode` is the reset rule of floating.floating_payoff.
+    workers=None uses every core; workers=1 runs in this process.
+
+    Returns keys: paths, mode, and per metric ("total_interest", "months",
+    "emi") a dict of mean, percentiles {p: value} and histogram
+    {counts, edges}.  With keep_samples the raw per-path arrays are added
+    under "samples".
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of: {', '.join(MODES)}")
+    if paths < 1:
+        raise ValueError("paths must be at least 1")
+    ppy = mortgage.payments_per_year
+    if not 1 <= resets_per_year <= ppy:
+        raise ValueError(f"resets_per_year must be between 1 and {ppy} "
+                         "(the loan's payments per year)")
+
+    every = ppy // resets_per_year      # payments between resets
+    # Tenure mode may run past the original term, so rates cover the cap
+    horizon = max_years * ppy if mode == "tenure" else mortgage.total_payments()
+    periods = np.arange(1 + every, horizon + 1, every)
+    model   = {
+        "mean":  mortgage.annual_rate if mean is None else mean,
+        "speed": speed,
+        "vol":   vol,
+        "dt":    every / ppy,
+        "floor": floor,
+    }
+
+    sizes = [min(chunk_size, paths - start) for start in range(0, paths, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs  = [(mortgage, periods, size, child, model, mode, max_years)
+             for size, child in zip(sizes, seeds)]
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers == 1:
+        chunks = list(map(_run_chunk, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_run_chunk, jobs))
+
+    samples = {metric: np.concatenate([c[metric] for c in chunks]) for metric in METRICS}
+    result  = {"paths": paths, "mode": mode, **_summarize(samples, percentiles, bins)}
+    if keep_samples:
+        result["samples"] = samples
+    return result
+
+
+# ── Command line ─────────────────────────────────────────────────────────────
+
+def print_report(result: dict) -> None:
+    from charts import plot_histogram
+
+    print(f"\n=== RATE SCENARIOS: {result['paths']:,} paths, reset mode '{result['mode']}' ===")
+    pcts = list(result["total_interest"]["percentiles"])
+    print(f"{'Metric':<16}{'Mean':>16}" + "".join(f"{f'P{p}':>16}" for p in pcts))
+    for metric in METRICS:
+        stats = result[metric]
+        print(f"{metric:<16}{stats['mean']:>16,.2f}"
+              + "".join(f"{v:>16,.2f}" for v in stats["percentiles"].values()))
+
+    plot_histogram(result["total_interest"]["histogram"], "TOTAL INTEREST")
+    plot_histogram(result["months"]["histogram"],         "TENURE (MONTHS)")
+    plot_histogram(result["emi"]["histogram"],            "PEAK EMI")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Monte Carlo rate scenarios for one loan.")
+    parser.add_argument("principal", type=float)
+    parser.add_argument("rate",      type=float, help="opening annual rate %%")
+    parser.add_argument("years",     type=int)
+    parser.add_argument("--paths",   type=int,   default=10_000)
+    parser.add_argument("--mode",    choices=MODES, default="emi")
+    parser.add_argument("--resets",  type=int,   default=4, help="rate resets per year")
+    parser.add_argument("--mean",    type=float, default=None,
+                        help="long-run rate %% (default: opening rate)")
+    parser.add_argument("--speed",   type=float, default=0.3, help="mean reversion per year")
+    parser.add_argument("--vol",     type=float, default=1.0,
+                        help="rate volatility, %% points per sqrt(year)")
+    parser.add_argument("--seed",    type=int,   default=0)
+    parser.add_argument("--workers", type=int,   default=None,
+                        help="process pool size (default: every core)")
+    args = parser.parse_args()
+
+    result = simulate(
+        Mortgage(args.principal, args.rate, args.years),
+        paths=args.paths, mode=args.mode, resets_per_year=args.resets,
+        mean=args.mean, speed=args.speed, vol=args.vol, seed=args.seed,
+        workers=args.workers,
+    )
+    print_report(result)
+
+
+if __name__ == "__main__":
+    main()
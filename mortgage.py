@@ -1,4 +1,35 @@
+import math
 from dataclasses import dataclass
+from functools import lru_cache
+
+MAX_YEARS = 50   # longest tenure accepted from loan files and quote requests
+
+
+@lru_cache(maxsize=4096)
+def growth_factor(r: float, n: int) -> float:
+    """
+    (1 + r) ** n, the compounding term every annuity formula is built on.
+
+    Quote traffic reuses a few hundred (rate, tenure) pairs, so results are
+    kept in a bounded LRU cache.  lru_cache is thread-safe, and
+    growth_factor.cache_info() reports hits, misses and current size.
+    """
+    return (1 + r) ** n
+
+
+def validate_terms(principal, rate, years) -> tuple[float, float, int]:
+    """
+    Parse and range-check loan terms from outside input (files, requests);
+    raises ValueError for anything the engine cannot amortize sensibly.
+    """
+    principal, rate, years = float(principal), float(rate), int(years)
+    if not (math.isfinite(principal) and principal > 0):
+        raise ValueError("principal must be a positive number")
+    if not (math.isfinite(rate) and rate >= 0):
+        raise ValueError("rate must be zero or a positive number")
+    if not 1 <= years <= MAX_YEARS:
+        raise ValueError(f"years must be between 1 and {MAX_YEARS}")
+    return principal, rate, years
 
 
 @dataclass
@@ -22,4 +53,41 @@ class Mortgage:
         if r == 0:
             return p / n
 
-        return p * r * (1 + r) ** n / ((1 + r) ** n - 1)
\ No newline at end of file
+        g = growth_factor(r, n)
+        return p * r * g / (g - 1)
+
+    # ── Closed-form schedule queries (no prepayments) ────────────────────────
+
+    def balance_at(self, k: int) -> float:
+        """Outstanding balance after payment k, without building a schedule."""
+        n = self.total_payments()
+        k = max(0, min(k, n))
+        if k == n:
+            return 0.0
+
+        r = self.periodic_rate()
+        p = self.principal
+
+        if r == 0:
+            return p - self.emi() * k
+
+        # Partial-term exponents are one-off: keep them out of the annuity cache
+        g = (1 + r) ** k
+        return p * g - self.emi() * (g - 1) / r
+
+    def principal_paid(self, k: int) -> float:
+        """Cumulative principal repaid through payment k."""
+        return self.principal - self.balance_at(k)
+
+    def interest_paid(self, k: int) -> float:
+        """Cumulative interest paid through payment k."""
+        k = max(0, min(k, self.total_payments()))
+        return self.emi() * k - self.principal_paid(k)
+
+    def payment_split(self, k: int) -> tuple[float, float]:
+        """(principal, interest) portions of payment k; zeros outside the term."""
+        if not 1 <= k <= self.total_payments():
+            return 0.0, 0.0
+
+        interest = self.balance_at(k - 1) * self.periodic_rate()
+        return self.emi() - interest, interest
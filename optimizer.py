@@ -0,0 +1,97 @@
+"""
+optimizer.py  –  Search prepayment strategies for the best interest / liquidity trade-off.
+
+Given cash available now and a monthly budget for prepayments, tries every
+split between a lump sum and an extra monthly payment, at every possible
+lump-sum month, and keeps the Pareto set of interest saved versus cash
+kept on hand.  Each strategy is scored with the closed-form solver, so a
+full 30-year search takes well under a second.
+"""
+from prepayment import solve_payoff
+
+IMPACT_KEYS = ("months_saved", "interest_saved", "extra", "lump", "lump_month")
+
+
+def _liquidity(cash_now: float, monthly_budget: float, lump: float,
+               extra: float, lump_month: int, n: int) -> float:
+    """
+    Average cash on hand over the original term (in rupees).
+
+    Cash not used for the lump sum is kept throughout, the lump itself is
+    kept until it is paid in, and unused monthly budget builds up month by
+    month.
+    """
+    held_lump = lump * (lump_month - 1) / n if lump else 0.0
+    saved     = (monthly_budget - extra) * (n + 1) / 2
+    return cash_now - lump + held_lump + saved
+
+
+def _pareto(candidates: list[dict]) -> list[dict]:
+    """Strategies no other strategy beats on both interest saved and liquidity."""
+    front = []
+    best_liquidity = float("-inf")
+    for c in sorted(candidates,
+                    key=lambda c: (-c["interest_saved"], -c["liquidity_kept"])):
+        if c["liquidity_kept"] > best_liquidity:
+            front.append(c)
+            best_liquidity = c["liquidity_kept"]
+    return front
+
+
+def optimize_prepayment(
+    mortgage,
+    cash_now: float,
+    monthly_budget: float,
+    steps: int = 10,
+) -> dict:
+    """
+    Search lump-sum / extra-payment splits and lump-sum months.
+
+    Lump sums are tried at 0, 1/steps, ... 100% of cash_now and extra
+    payments at the same fractions of monthly_budget.  Every lump sum is
+    tried at every month up to the one in which the extra payment alone
+    would close the loan; a lump due after that would never be paid.
+
+    Returns keys:
+      baseline : months / total_interest with no prepayment
+      best     : strategy with the largest interest saving
+      pareto   : strategies trading interest saved against liquidity kept,
+                 ordered from most interest saved to most liquidity kept
+
+    Each strategy dict has extra, lump, lump_month, months, total_interest,
+    months_saved, interest_saved and liquidity_kept.
+    """
+    if steps < 1:
+        raise ValueError("steps must be at least 1")
+
+    n        = mortgage.total_payments()
+    baseline = solve_payoff(mortgage)
+
+    candidates = []
+    for i in range(steps + 1):
+        extra  = monthly_budget * i / steps
+        payoff = solve_payoff(mortgage, extra)["months"]
+        for j in range(steps + 1):
+            lump   = cash_now * j / steps
+            months = range(1, payoff + 1) if lump else (0,)
+            for lump_month in months:
+                res = solve_payoff(mortgage, extra, lump, lump_month)
+                candidates.append({
+                    "extra":          extra,
+                    "lump":           lump,
+                    "lump_month":     lump_month,
+                    "months":         res["months"],
+                    "total_interest": res["total_interest"],
+                    "months_saved":   baseline["months"] - res["months"],
+                    "interest_saved": baseline["total_interest"] - res["total_interest"],
+                    "liquidity_kept": _liquidity(cash_now, monthly_budget,
+                                                 lump, extra, lump_month, n),
+                })
+
+    front = _pareto(candidates)
+    return {"baseline": baseline, "best": front[0], "pareto": front}
+
+
+def impact_args(strategy: dict) -> tuple:
+    """Positional arguments for ui.prepayment_impact(*impact_args(strategy))."""
+    return tuple(strategy[k] for k in IMPACT_KEYS)
@@ -2,12 +2,14 @@
 pdf_export.py  –  Generate a professional PDF report using reportlab.
 """
 from datetime import date
+from functools import lru_cache
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.units import mm
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable
+    BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, Table, LongTable,
+    TableStyle, HRFlowable
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
@@ -25,6 +27,7 @@ C_WHITE  = colors.white
 C_BLACK  = colors.black
 
 
+@lru_cache(maxsize=None)
 def _styles():
     base = getSampleStyleSheet()
     custom = {
@@ -81,6 +84,39 @@ def _stat_table(boxes: list[tuple[str, str, str]]) -> Table:
     return t
 
 
+# Table styles are built once and shared by every table that uses them
+DATA_TABLE_STYLE = TableStyle([
+    ("BACKGROUND",    (0, 0), (-1, 0),  C_DARK),
+    ("TEXTCOLOR",     (0, 0), (-1, 0),  C_WHITE),
+    ("FONTNAME",      (0, 0), (-1, 0),  "Helvetica-Bold"),
+    ("FONTSIZE",      (0, 0), (-1, -1), 8),
+    ("ROWBACKGROUNDS",(0, 1), (-1, -1), [C_WHITE, C_LIGHT]),
+    ("GRID",          (0, 0), (-1, -1), 0.4, C_BORDER),
+    ("VALIGN",        (0, 0), (-1, -1), "MIDDLE"),
+    ("TOPPADDING",    (0, 0), (-1, -1), 4),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ("LEFTPADDING",   (0, 0), (-1, -1), 6),
+])
+
+LONG_TABLE_STYLE = TableStyle([
+    ("BACKGROUND",    (0, 0), (-1, 0),  C_DARK),
+    ("TEXTCOLOR",     (0, 0), (-1, 0),  C_WHITE),
+    ("FONTNAME",      (0, 0), (-1, 0),  "Helvetica-Bold"),
+    ("TEXTCOLOR",     (0, 1), (-1, -1), C_DARK),
+    ("FONTNAME",      (0, 1), (-1, -1), "Helvetica"),
+    ("FONTSIZE",      (0, 0), (-1, -1), 8),
+    ("ALIGN",         (1, 1), (-1, -1), "RIGHT"),
+    ("ROWBACKGROUNDS",(0, 1), (-1, -1), [C_WHITE, C_LIGHT]),
+    ("GRID",          (0, 0), (-1, -1), 0.4, C_BORDER),
+    ("TOPPADDING",    (0, 0), (-1, -1), 2),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+    ("LEFTPADDING",   (0, 0), (-1, -1), 6),
+    ("RIGHTPADDING",  (0, 0), (-1, -1), 6),
+])
+
+HIGHLIGHT = colors.HexColor("#e8f5e9")
+
+
 def _data_table(headers: list[str], rows: list[list[str]],
                 highlight_col: int | None = None) -> Table:
     styles = _styles()
@@ -94,24 +130,23 @@ def _data_table(headers: list[str], rows: list[list[str]],
 
     t = Table([head_row] + data_rows, colWidths=[col_w] * len(headers),
               repeatRows=1)
-    style_cmds = [
-        ("BACKGROUND",    (0, 0), (-1, 0),  C_DARK),
-        ("TEXTCOLOR",     (0, 0), (-1, 0),  C_WHITE),
-        ("FONTNAME",      (0, 0), (-1, 0),  "Helvetica-Bold"),
-        ("FONTSIZE",      (0, 0), (-1, -1), 8),
-        ("ROWBACKGROUNDS",(0, 1), (-1, -1), [C_WHITE, C_LIGHT]),
-        ("GRID",          (0, 0), (-1, -1), 0.4, C_BORDER),
-        ("VALIGN",        (0, 0), (-1, -1), "MIDDLE"),
-        ("TOPPADDING",    (0, 0), (-1, -1), 4),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 6),
-    ]
+    t.setStyle(DATA_TABLE_STYLE)
     if highlight_col is not None:
-        style_cmds.append(
-            ("BACKGROUND", (highlight_col, 1), (highlight_col, -1),
-             colors.HexColor("#e8f5e9"))
-        )
-    t.setStyle(TableStyle(style_cmds))
+        t.setStyle(TableStyle([
+            ("BACKGROUND", (highlight_col, 1), (highlight_col, -1), HIGHLIGHT)
+        ]))
+    return t
+
+
+def _long_table(headers: list[str], rows: list[list[str]]) -> LongTable:
+    """
+    Table for hundreds of rows: plain-string cells (no Paragraph per cell)
+    with the header row repeated on every page.
+    """
+    col_w = (PAGE_W - 2 * MARGIN) / len(headers)
+    t = LongTable([headers] + rows, colWidths=[col_w] * len(headers),
+                  repeatRows=1)
+    t.setStyle(LONG_TABLE_STYLE)
     return t
 
 
@@ -122,23 +157,50 @@ def _section_heading(title: str, story: list, styles: dict) -> None:
     story.append(Spacer(1, 3 * mm))
 
 
+# ── Page template ─────────────────────────────────────────────────────────────
+
+def _draw_page(canvas, doc) -> None:
+    """Running header and page-number footer on every page."""
+    canvas.saveState()
+    canvas.setFont("Helvetica", 7)
+    canvas.setFillColor(colors.HexColor("#666666"))
+    canvas.drawString(MARGIN, PAGE_H - MARGIN / 2, "Mortgage & Loan Analysis Report")
+    canvas.drawRightString(PAGE_W - MARGIN, MARGIN / 2, f"Page {doc.page}")
+    canvas.restoreState()
+
+
+def _report_doc(filepath: str) -> BaseDocTemplate:
+    doc = BaseDocTemplate(
+        filepath, pagesize=A4,
+        leftMargin=MARGIN, rightMargin=MARGIN,
+        topMargin=MARGIN, bottomMargin=MARGIN,
+    )
+    frame = Frame(MARGIN, MARGIN, PAGE_W - 2 * MARGIN, PAGE_H - 2 * MARGIN, id="body")
+    doc.addPageTemplates([PageTemplate(id="report", frames=[frame], onPage=_draw_page)])
+    return doc
+
+
+def _money_row(cells) -> list[str]:
+    first, *amounts = cells
+    return [str(first)] + [f"${a:,.2f}" for a in amounts]
+
+
 # ── Main export function ──────────────────────────────────────────────────────
 
-def export_pdf(filepath: str, data: dict) -> None:
+def export_pdf(filepath: str, data: dict, full_schedule: bool = False) -> None:
     """
     data keys expected:
       loan        : dict  (principal, rate, years, emi, total_interest, months)
-      schedule    : list[dict]
+      schedule    : Schedule (or list[dict])
       yearly      : list[dict]
       prepayment  : dict  (extra, lump, lump_month, months_saved, interest_saved)
       credit      : dict  (score, tier, rate)  – optional
       borrower    : dict  (name, income, employment) – optional
+
+    full_schedule=True prints every month of the schedule (paginated, with
+    the header row repeated) instead of the first 24.
     """
-    doc     = SimpleDocTemplate(
-        filepath, pagesize=A4,
-        leftMargin=MARGIN, rightMargin=MARGIN,
-        topMargin=MARGIN, bottomMargin=MARGIN,
-    )
+    doc     = _report_doc(filepath)
     styles  = _styles()
     story   = []
     today   = date.today()
@@ -205,31 +267,46 @@ def export_pdf(filepath: str, data: dict) -> None:
     ]
     story.append(_data_table(breakdown_data[0], breakdown_data[1:]))
 
-    # ── Amortization Schedule (first 24 rows) ─────────────────────────────────
-    _section_heading(f"AMORTIZATION SCHEDULE (First {min(24, len(sched))} Months)", story, styles)
+    # ── Amortization Schedule (first 24 rows, or all) ─────────────────────────
     amort_headers = ["Month", "Payment", "Principal", "Interest", "Balance"]
-    amort_rows    = [
-        [r["period"],
-         f"${r['payment']:,.2f}",
-         f"${r['principal']:,.2f}",
-         f"${r['interest']:,.2f}",
-         f"${r['balance']:,.2f}"]
-        for r in sched[:24]
-    ]
-    story.append(_data_table(amort_headers, [list(map(str, r)) for r in amort_rows]))
+    if full_schedule:
+        _section_heading(f"AMORTIZATION SCHEDULE (All {len(sched)} Months)", story, styles)
+        story.append(_long_table(amort_headers, [
+            _money_row((r["period"], r["payment"], r["principal"],
+                        r["interest"], r["balance"]))
+            for r in sched
+        ]))
+    else:
+        _section_heading(f"AMORTIZATION SCHEDULE (First {min(24, len(sched))} Months)",
+                         story, styles)
+        amort_rows    = [
+            [r["period"],
+             f"${r['payment']:,.2f}",
+             f"${r['principal']:,.2f}",
+             f"${r['interest']:,.2f}",
+             f"${r['balance']:,.2f}"]
+            for r in sched[:24]
+        ]
+        story.append(_data_table(amort_headers, [list(map(str, r)) for r in amort_rows]))
 
     # ── Yearly Summary ────────────────────────────────────────────────────────
     if yearly:
         _section_heading("YEARLY SUMMARY", story, styles)
         y_headers = ["Year", "Interest Paid", "Principal Paid", "Ending Balance"]
-        y_rows    = [
-            [r["year"],
-             f"${r['interest']:,.2f}",
-             f"${r['principal']:,.2f}",
-             f"${r['balance']:,.2f}"]
-            for r in yearly
-        ]
-        story.append(_data_table(y_headers, [list(map(str, r)) for r in y_rows]))
+        if full_schedule:
+            story.append(_long_table(y_headers, [
+                _money_row((r["year"], r["interest"], r["principal"], r["balance"]))
+                for r in yearly
+            ]))
+        else:
+            y_rows    = [
+                [r["year"],
+                 f"${r['interest']:,.2f}",
+                 f"${r['principal']:,.2f}",
+                 f"${r['balance']:,.2f}"]
+                for r in yearly
+            ]
+            story.append(_data_table(y_headers, [list(map(str, r)) for r in y_rows]))
 
     # ── Prepayment Impact ─────────────────────────────────────────────────────
     if prep and (prep.get("extra", 0) > 0 or prep.get("lump", 0) > 0):
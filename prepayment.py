@@ -0,0 +1,120 @@
+"""
+prepayment.py  –  Closed-form payoff and interest solver for prepayments.
+
+Answers "how many months, how much interest, how much saved" for a loan
+with a constant extra monthly payment (and optionally one lump sum)
+without stepping through the schedule period by period.
+"""
+import math
+
+
+def _payoff(balance: float, r: float, payment: float, limit: int) -> tuple[int, float]:
+    """
+    Periods needed to clear `balance` at a constant `payment`, and the
+    interest paid doing so, capped at `limit` periods.
+
+    Mirrors the engine's final-instalment rule: the last payment only
+    covers what is left plus that period's interest.
+    """
+    if balance <= 0 or limit <= 0:
+        return 0, 0.0
+
+    if r == 0:
+        k = math.ceil(balance / payment - 1e-9)
+    elif payment <= balance * r:
+        k = limit    # payment never gets ahead of the interest
+    else:
+        k = math.ceil(-math.log1p(-balance * r / payment) / math.log1p(r) - 1e-9)
+    k = max(1, min(k, limit))
+
+    # Interest on the k - 1 full payments, then on the final one
+    remaining = _balance_after(balance, r, payment, k - 1)
+    interest  = payment * (k - 1) - (balance - remaining)
+    return k, interest + remaining * r
+
+
+def _balance_after(balance: float, r: float, payment: float, k: int) -> float:
+    if k <= 0:
+        return balance
+    if r == 0:
+        return balance - payment * k
+    g = (1 + r) ** k
+    return balance * g - payment * (g - 1) / r
+
+
+def validate_prepayment(extra_payment, lump_sum, lump_sum_month) -> tuple[float, float, int]:
+    """Parse prepayment inputs from outside input; amounts must be finite and non-negative."""
+    extra_payment, lump_sum = float(extra_payment), float(lump_sum)
+    if not (math.isfinite(extra_payment) and extra_payment >= 0):
+        raise ValueError("extra payment must be zero or a positive number")
+    if not (math.isfinite(lump_sum) and lump_sum >= 0):
+        raise ValueError("lump sum must be zero or a positive number")
+    return extra_payment, lump_sum, int(lump_sum_month)
+
+
+def solve_payoff(
+    mortgage,
+    extra_payment: float = 0.0,
+    lump_sum: float = 0.0,
+    lump_sum_month: int = 0,
+) -> dict:
+    """
+    Months to payoff and total interest for a prepayment plan, computed in
+    closed form.  Takes the same arguments as generate_schedule.
+
+    With a lump sum the loan is evaluated in two constant-payment segments:
+    before the lump month and after it.
+
+    Returns keys: months, total_interest.
+    """
+    n       = mortgage.total_payments()
+    r       = mortgage.periodic_rate()
+    balance = mortgage.principal
+    payment = mortgage.emi() + extra_payment
+
+    if not lump_sum or not 1 <= lump_sum_month <= n:
+        months, interest = _payoff(balance, r, payment, n)
+        return {"months": months, "total_interest": interest}
+
+    # Segment 1: regular payments up to (not including) the lump month
+    months, interest = _payoff(balance, r, payment, lump_sum_month - 1)
+    remaining = _balance_after(balance, r, payment, lump_sum_month - 1)
+    if months < lump_sum_month - 1 or remaining <= 0:
+        return {"months": months, "total_interest": interest}
+
+    # Lump month: regular payment plus the lump sum
+    interest += remaining * r
+    remaining = remaining * (1 + r) - payment - lump_sum
+    if remaining <= 0:
+        return {"months": lump_sum_month, "total_interest": interest}
+
+    # Segment 2: regular payments on what is left
+    more, more_interest = _payoff(remaining, r, payment, n - lump_sum_month)
+    return {
+        "months":         lump_sum_month + more,
+        "total_interest": interest + more_interest,
+    }
+
+
+def prepayment_savings(
+    mortgage,
+    extra_payment: float = 0.0,
+    lump_sum: float = 0.0,
+    lump_sum_month: int = 0,
+) -> dict:
+    """
+    Compare the plan against the plain loan without building either schedule.
+
+    Returns keys: months, total_interest, normal_months, normal_interest,
+    months_saved, interest_saved.
+    """
+    normal = solve_payoff(mortgage)
+    plan   = solve_payoff(mortgage, extra_payment, lump_sum, lump_sum_month)
+    return {
+        "months":          plan["months"],
+        "total_interest":  plan["total_interest"],
+        "normal_months":   normal["months"],
+        "normal_interest": normal["total_interest"],
+        "months_saved":    normal["months"] - plan["months"],
+        "interest_saved":  normal["total_interest"] - plan["total_interest"],
+    }
@@ -0,0 +1,161 @@
+"""
+progress.py  –  Real progress reporting and per-stage timing.
+
+Work is wrapped in a stage; the code doing it reports completed units and
+the stage records wall-clock and CPU time when it ends:
+
+    with stage("Rendering PDFs", total=len(jobs), unit="documents") as st:
+        for job in jobs:
+            render(job)
+            st.advance()
+
+Stages print nothing unless display is on and record timings (see
+timings()) only when recording is on; the interactive CLI turns display
+on and `main.py batch --timings` turns recording on, so library callers
+and benchmarks stay silent and keep no history.  With display on, each stage
+prints its name, redraws a bar from the units actually completed (at most
+every REDRAW_EVERY seconds, so quick stages never draw a partial bar) and
+finishes with the unit count and timings.  Single-step work reports no
+units and shows only its elapsed time.
+
+With display and recording both off (the default) stages are disabled
+entirely: stage() hands back one shared no-op object, so instrumented code
+does no clock reads, drawing or bookkeeping.
+"""
+import time
+from collections import deque
+
+BAR_WIDTH    = 20
+REDRAW_EVERY = 0.1      # seconds between live redraws
+HISTORY      = 1000     # finished stages kept for timings()
+
+_display = False
+_record  = False
+_history: deque[dict] = deque(maxlen=HISTORY)
+
+
+def configure(display: bool | None = None, record: bool | None = None) -> None:
+    """Switch stage output and/or timing records on or off; None keeps the setting."""
+    global _display, _record
+    if display is not None:
+        _display = display
+    if record is not None:
+        _record = record
+
+
+def timings() -> list[dict]:
+    """Recorded stages, oldest first: dicts with stage, units, unit, wall, cpu."""
+    return list(_history)
+
+
+def clear_timings() -> None:
+    _history.clear()
+
+
+def _duration(seconds: float) -> str:
+    return f"{seconds * 1e3:.1f} ms" if seconds < 1 else f"{seconds:.2f} s"
+
+
+class _NullStage:
+    """Stand-in returned by stage() when stages are off; every call is a no-op."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+    def advance(self, n: int = 1) -> None:
+        pass
+
+
+NULL_STAGE = _NullStage()
+
+
+class Stage:
+    """One timed unit of work; use through stage()."""
+    __slots__ = ("name", "total", "unit", "done", "wall", "cpu",
+                 "_display", "_record", "_wall0", "_cpu0", "_next_draw", "_width")
+
+    def __init__(self, name: str, total: int | None, unit: str,
+                 display: bool, record: bool) -> None:
+        self.name  = name
+        self.total = total
+        self.unit  = unit
+        self.done  = 0
+        self.wall  = 0.0
+        self.cpu   = 0.0
+        self._display   = display
+        self._record    = record
+        self._wall0     = 0.0
+        self._cpu0      = 0.0
+        self._next_draw = 0.0
+        self._width     = 0
+
+    def __enter__(self) -> "Stage":
+        if self._display:
+            print(f"\n  [!] {self.name}...", flush=True)
+        self._wall0     = time.perf_counter()
+        self._cpu0      = time.process_time()
+        self._next_draw = self._wall0 + REDRAW_EVERY
+        return self
+
+    def advance(self, n: int = 1) -> None:
+        """Count n more completed units."""
+        self.done += n
+        if self._display:
+            now = time.perf_counter()
+            if now >= self._next_draw:
+                self._next_draw = now + REDRAW_EVERY
+                self._draw(self._bar(), self._count())
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.wall = time.perf_counter() - self._wall0
+        self.cpu  = time.process_time() - self._cpu0
+        if self._record:
+            _history.append({
+                "stage": self.name,
+                "units": self.done,
+                "unit":  self.unit,
+                "wall":  self.wall,
+                "cpu":   self.cpu,
+            })
+        if self._display:
+            timing = f"in {_duration(self.wall)} (CPU {_duration(self.cpu)})"
+            if not (self.done or self.total):
+                # Single step: no units to show, only how long it took
+                status = "Done" if exc_type is None else "Failed"
+                print(f"\r{f'  {status} {timing}':<{self._width}}")
+                return False
+            status = "100% Complete." if exc_type is None else "Failed."
+            bar    = "█" * BAR_WIDTH if exc_type is None else self._bar()
+            self._draw(bar, f"{status}  {self.done:,} {self.unit} {timing}")
+            print()
+        return False
+
+    def _bar(self) -> str:
+        if not self.total:
+            return "·" * BAR_WIDTH
+        return "█" * int(min(self.done / self.total, 1) * BAR_WIDTH)
+
+    def _count(self) -> str:
+        if not self.total:
+            return f"{self.done:,} {self.unit}"
+        return (f"{min(self.done / self.total, 1) * 100:>3.0f}%  "
+                f"{self.done:,}/{self.total:,} {self.unit}")
+
+    def _draw(self, bar: str, text: str) -> None:
+        line = f"  [{bar:<{BAR_WIDTH}}] {text}"
+        print(f"\r{line:<{self._width}}", end="", flush=True)
+        self._width = len(line)
+
+
+def stage(name: str, total: int | None = None, unit: str = "items"):
+    """
+    Context manager timing one stage of work; call .advance(n) as units
+    complete.  `total` (if known) lets the bar show a percentage.
+    """
+    if not (_display or _record):
+        return NULL_STAGE
+    return Stage(name, total, unit, _display, _record)
@@ -0,0 +1,106 @@
+"""
+schedule.py  –  Compact columnar amortization schedule.
+
+A Schedule keeps one typed array per column instead of one dict per row.
+Iterating, indexing and slicing still hand out the familiar row dicts
+(period, payment, principal, interest, balance), so code written against
+list[dict] keeps working unchanged.
+"""
+from array import array
+
+COLUMNS = ("period", "payment", "principal", "interest", "balance")
+
+
+class Schedule:
+    """
+    Amortization schedule stored column-wise.
+
+    Columns default to array('l') for period and array('d') for the money
+    columns, but any indexable sequence works (e.g. NumPy views), which lets
+    batch results be wrapped without copying.
+    """
+    __slots__ = COLUMNS
+
+    def __init__(self, period=None, payment=None, principal=None,
+                 interest=None, balance=None) -> None:
+        self.period    = array("l") if period    is None else period
+        self.payment   = array("d") if payment   is None else payment
+        self.principal = array("d") if principal is None else principal
+        self.interest  = array("d") if interest  is None else interest
+        self.balance   = array("d") if balance   is None else balance
+
+    @classmethod
+    def from_rows(cls, rows) -> "Schedule":
+        """Build a Schedule from an iterable of row dicts."""
+        sched = cls()
+        for row in rows:
+            sched.append(row["period"], row["payment"], row["principal"],
+                         row["interest"], row["balance"])
+        return sched
+
+    def append(self, period: int, payment: float, principal: float,
+               interest: float, balance: float) -> None:
+        self.period.append(period)
+        self.payment.append(payment)
+        self.principal.append(principal)
+        self.interest.append(interest)
+        self.balance.append(balance)
+
+    def extend(self, rows) -> None:
+        """
+        Append many (period, payment, principal, interest, balance) tuples.
+
+        Rows are consumed one at a time straight into the columns, so a
+        generator is never materialized alongside the schedule.
+        """
+        add_period, add_payment, add_principal, add_interest, add_balance = (
+            getattr(self, column).append for column in COLUMNS)
+        for period, payment, principal, interest, balance in rows:
+            add_period(period)
+            add_payment(payment)
+            add_principal(principal)
+            add_interest(interest)
+            add_balance(balance)
+
+    def row(self, i: int) -> dict:
+        return {
+            "period":    self.period[i],
+            "payment":   self.payment[i],
+            "principal": self.principal[i],
+            "interest":  self.interest[i],
+            "balance":   self.balance[i],
+        }
+
+    def total_interest(self) -> float:
+        return sum(self.interest)
+
+    def total_principal(self) -> float:
+        return sum(self.principal)
+
+    # ── Sequence protocol ────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.period)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return Schedule(*(getattr(self, c)[key] for c in COLUMNS))
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("schedule index out of range")
+        return self.row(key)
+
+    def __iter__(self):
+        for values in zip(self.period, self.payment, self.principal,
+                          self.interest, self.balance):
+            yield dict(zip(COLUMNS, values))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Schedule, list)):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Schedule({len(self)} periods)"
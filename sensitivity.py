@@ -0,0 +1,69 @@
+"""
+sensitivity.py  –  Rate × tenure sensitivity grid for a single principal.
+
+Computes EMI and total interest for every (rate, tenure) combination in one
+broadcast NumPy pass, instead of one Mortgage and one schedule per cell.
+"""
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from batch import batch_emi
+
+METRICS = ("emi", "interest", "total")
+
+
+@dataclass
+class SensitivityGrid:
+    """
+    EMI / interest surface.  Matrices are shaped (len(rates), len(years)):
+    row i is rates[i], column j is years[j].
+    """
+    principal: float
+    rates:     np.ndarray
+    years:     np.ndarray
+    emi:       np.ndarray
+    interest:  np.ndarray
+
+    @property
+    def total(self) -> np.ndarray:
+        return self.principal + self.interest
+
+    def matrix(self, metric: str = "emi") -> np.ndarray:
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {', '.join(METRICS)}")
+        return getattr(self, metric)
+
+    def table(
+        self,
+        metric: str = "emi",
+        fmt: Callable[[float], str] = "{:,.2f}".format,
+    ) -> tuple[list[str], list[list[str]]]:
+        """(headers, rows) ready for ui.bordered_table; fmt renders each cell."""
+        values  = self.matrix(metric)
+        headers = ["Rate %"] + [f"{int(y)} Yrs" for y in self.years]
+        rows    = [
+            [f"{rate:.2f}%"] + [fmt(float(v)) for v in values[i]]
+            for i, rate in enumerate(self.rates)
+        ]
+        return headers, rows
+
+
+def rate_tenure_grid(
+    principal: float,
+    rates,
+    years,
+    payments_per_year: int = 12,
+) -> SensitivityGrid:
+    """
+    Build the EMI and total-interest surface for `principal` across every
+    annual rate in `rates` and every tenure (in years) in `years`.
+    """
+    rates = np.asarray(rates, dtype=float)
+    years = np.asarray(years, dtype=int)
+
+    emi      = batch_emi(principal, rates[:, None], years[None, :], payments_per_year)
+    interest = emi * (years[None, :] * payments_per_year) - principal
+
+    return SensitivityGrid(principal, rates, years, emi.round(2), interest.round(2))
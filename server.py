@@ -0,0 +1,235 @@
+"""
+server.py  –  Lightweight asyncio HTTP/JSON quote service.
+
+    python server.py --port 8080 --workers 4
+
+Endpoints (GET with query parameters, or POST with a JSON body):
+  /emi           principal, rate, years                 → {"emi": ...}
+  /schedule      principal, rate, years[, extra, lump, lump_month]
+                                                        → NDJSON, one row per line
+  /yearly        as /schedule, plus bucket=year|quarter|month
+                                                        → [bucket row, ...]
+  /compare       {"loans": [[principal, rate, years], ...]}   (≤ MAX_LOANS)
+                                                        → compare_loans() output
+  /credit-score  {"cards": [card, ...]} (≤ MAX_CARDS) or {"profile": {...}}
+                                                        → score, classes, tier, rate
+
+Cheap endpoints (/emi, /credit-score) answer on the event loop, which the
+card and body limits keep cheap; schedule, yearly and comparison work runs
+in a process pool so the loop never blocks.  Loan terms must be finite,
+with 1–50 year tenures; anything malformed is answered with a 400.
+Connections are kept alive; /schedule is streamed with chunked transfer
+encoding.  Standard library only.
+"""
+import argparse
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+
+from amortization import generate_schedule
+from comparison import compare_loans
+from credit_tool import calculate_credit_score, classify_score, combine_cards, determine_tier
+from mortgage import Mortgage, validate_terms
+from prepayment import validate_prepayment
+from schedule import Schedule
+from yearly_summary import generate_summary
+
+STREAM_ROWS = 120           # schedule rows per chunk
+MAX_LOANS   = 100           # loans per /compare request
+MAX_CARDS   = 50            # cards per /credit-score request
+MAX_BODY    = 1 << 20       # request body bytes
+REASONS     = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+
+
+# ── Handlers (plain functions, safe to run in a worker process) ──────────────
+
+def _loan(params: dict) -> tuple[Mortgage, float, float, int]:
+    """Validated loan and prepayment plan; bad input becomes a 400."""
+    loan = Mortgage(*validate_terms(params["principal"], params["rate"], params["years"]))
+    return (loan, *validate_prepayment(params.get("extra", 0), params.get("lump", 0),
+                                       params.get("lump_month", 0)))
+
+
+def _limited(items, limit: int, name: str) -> list:
+    if not isinstance(items, list):
+        raise TypeError(f"{name} must be a list")
+    if len(items) > limit:
+        raise ValueError(f"at most {limit} {name} per request")
+    return items
+
+
+def emi(params: dict) -> dict:
+    loan, *_ = _loan(params)
+    return {"emi": round(loan.emi(), 2), "months": loan.total_payments()}
+
+
+def schedule(params: dict) -> Schedule:
+    loan, extra, lump, lump_month = _loan(params)
+    return generate_schedule(loan, extra, lump, lump_month)
+
+
+def yearly(params: dict) -> list[dict]:
+    # Always from the engine schedule, so figures match /schedule with or without a plan
+    loan, extra, lump, lump_month = _loan(params)
+    return generate_summary(generate_schedule(loan, extra, lump, lump_month),
+                            loan.payments_per_year, params.get("bucket", "year"))
+
+
+def compare(params: dict) -> list[dict]:
+    loans = _limited(params["loans"], MAX_LOANS, "loans")
+    return compare_loans([validate_terms(p, r, y) for p, r, y in loans])
+
+
+def credit_score(params: dict) -> dict:
+    profile = (combine_cards(_limited(params["cards"], MAX_CARDS, "cards"))
+               if "cards" in params else params["profile"])
+    score        = calculate_credit_score(profile)
+    india, us    = classify_score(score)
+    tier, rate   = determine_tier(score)
+    return {"score": score, "india": india, "us": us, "tier": tier, "rate": rate}
+
+
+# path → (handler, runs in the pool)
+ROUTES = {
+    "/emi":          (emi,          False),
+    "/schedule":     (schedule,     True),
+    "/yearly":       (yearly,       True),
+    "/compare":      (compare,      True),
+    "/credit-score": (credit_score, False),
+}
+
+
+# ── HTTP plumbing ─────────────────────────────────────────────────────────────
+
+def _head(status: int, headers: dict) -> bytes:
+    lines = [f"HTTP/1.1 {status} {REASONS[status]}"]
+    lines += [f"{k}: {v}" for k, v in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode()
+
+
+def _json_response(status: int, payload, keep_alive: bool) -> bytes:
+    body = json.dumps(payload).encode()
+    return _head(status, {
+        "Content-Type":   "application/json",
+        "Content-Length": len(body),
+        "Connection":     "keep-alive" if keep_alive else "close",
+    }) + body
+
+
+async def _stream_schedule(writer: asyncio.StreamWriter, sched: Schedule,
+                           keep_alive: bool) -> None:
+    writer.write(_head(200, {
+        "Content-Type":      "application/x-ndjson",
+        "Transfer-Encoding": "chunked",
+        "Connection":        "keep-alive" if keep_alive else "close",
+    }))
+    for start in range(0, len(sched), STREAM_ROWS):
+        chunk = "".join(json.dumps(row) + "\n"
+                        for row in sched[start:start + STREAM_ROWS]).encode()
+        writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        await writer.drain()
+    writer.write(b"0\r\n\r\n")
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, dict, bytes]:
+    head = await reader.readuntil(b"\r\n\r\n")
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    method, target, _ = request_line.split(" ", 2)
+    headers = {}
+    for line in header_lines:
+        if ":" in line:
+            key, value = line.split(":", 1)
+            headers[key.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    if not 0 <= length <= MAX_BODY:
+        raise ValueError(f"Content-Length must be between 0 and {MAX_BODY}")
+    body = await reader.readexactly(length)
+    return method, target, headers, body
+
+
+class QuoteServer:
+    """Routes requests, offloading CPU-heavy handlers to a process pool."""
+
+    def __init__(self, workers: int | None = None) -> None:
+        self.pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+
+    async def handle(self, reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    method, target, headers, body = await _read_request(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except (asyncio.LimitOverrunError, ValueError) as exc:
+                    # Malformed request line, oversized head or bad Content-Length
+                    writer.write(_json_response(400, {"error": f"bad request: {exc}"}, False))
+                    await writer.drain()
+                    break
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._respond(writer, method, target, body, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, method: str, target: str, body: bytes,
+                       keep_alive: bool) -> None:
+        url   = urlsplit(target)
+        route = ROUTES.get(url.path)
+        if route is None:
+            writer.write(_json_response(404, {"error": f"unknown path {url.path}"}, keep_alive))
+            return
+
+        handler, offload = route
+        try:
+            params = dict(parse_qsl(url.query))
+            if method == "POST" and body:
+                params.update(json.loads(body))
+            if offload:
+                loop   = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self.pool, handler, params)
+            else:
+                result = handler(params)
+        except (KeyError, TypeError, ValueError) as exc:
+            writer.write(_json_response(400, {"error": f"{type(exc).__name__}: {exc}"},
+                                        keep_alive))
+            return
+        except Exception as exc:
+            writer.write(_json_response(500, {"error": str(exc)}, keep_alive))
+            return
+
+        if isinstance(result, Schedule):
+            await _stream_schedule(writer, result, keep_alive)
+        else:
+            writer.write(_json_response(200, result, keep_alive))
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        server = await asyncio.start_server(self.handle, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mortgage quote HTTP/JSON service.")
+    parser.add_argument("--host",    default="127.0.0.1")
+    parser.add_argument("--port",    type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="process pool size (default: every core)")
+    args = parser.parse_args()
+
+    print(f"Serving on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(QuoteServer(args.workers).serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
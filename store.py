@@ -0,0 +1,128 @@
+"""
+store.py  –  Memory-mapped on-disk store for very large sets of schedules.
+
+Each column lives in its own fixed-width binary file (period as int16,
+money columns as float64), rows for all loans back to back, plus an
+offsets file giving where each loan starts.  The batch engine appends
+into it chunk by chunk, and reads hand back Schedule objects whose
+columns are slices of the memory maps, so nothing is copied and any
+loan can be fetched in microseconds.
+
+    build_store("book.store", loans)
+    store = ScheduleStore("book.store")
+    generate_yearly_summary(store.schedule(123_456))
+"""
+import os
+from itertools import islice
+from typing import Iterable
+
+import numpy as np
+
+from batch import BatchSchedule, generate_schedules, loan_columns
+from schedule import COLUMNS, Schedule
+
+DTYPES = {
+    "period":    np.int16,
+    "payment":   np.float64,
+    "principal": np.float64,
+    "interest":  np.float64,
+    "balance":   np.float64,
+}
+OFFSETS = "offsets"
+
+
+class ScheduleStore:
+    """
+    Append-only columnar schedule store backed by memory-mapped files.
+
+    Loans are addressed by 0-based position, in the order they were
+    appended.
+    """
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        if not os.path.exists(self._path(OFFSETS)):
+            np.zeros(1, dtype=np.int64).tofile(self._path(OFFSETS))
+            for name in COLUMNS:
+                open(self._path(name), "wb").close()
+        self._maps: dict[str, np.ndarray] | None = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.bin")
+
+    def _map(self, name: str, dtype) -> np.ndarray:
+        if os.path.getsize(self._path(name)) == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(self._path(name), dtype=dtype, mode="r")
+
+    @property
+    def maps(self) -> dict[str, np.ndarray]:
+        if self._maps is None:
+            self._maps = {name: self._map(name, dtype) for name, dtype in DTYPES.items()}
+            self._maps[OFFSETS] = self._map(OFFSETS, np.int64)
+        return self._maps
+
+    # ── Writing ──────────────────────────────────────────────────────────────
+
+    def append(self, batch: BatchSchedule) -> None:
+        """Append every loan in a batch engine result, in order."""
+        width = batch.payment.shape[1]
+        live  = np.arange(width) < batch.months[:, None]
+
+        period = np.broadcast_to(np.arange(1, width + 1, dtype=DTYPES["period"]),
+                                 live.shape)[live]
+        with open(self._path("period"), "ab") as f:
+            period.tofile(f)
+        for name in COLUMNS[1:]:
+            with open(self._path(name), "ab") as f:
+                getattr(batch, name)[live].astype(DTYPES[name]).tofile(f)
+
+        end = int(self.maps[OFFSETS][-1])
+        with open(self._path(OFFSETS), "ab") as f:
+            (end + np.cumsum(batch.months, dtype=np.int64)).tofile(f)
+
+        self._maps = None   # files grew; remap on next read
+
+    # ── Reading ──────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.maps[OFFSETS]) - 1
+
+    @property
+    def rows(self) -> int:
+        return int(self.maps[OFFSETS][-1])
+
+    def schedule(self, i: int) -> Schedule:
+        """Schedule for loan i whose columns are views into the memory maps."""
+        maps = self.maps
+        if not 0 <= i < len(self):
+            raise IndexError("loan index out of range")
+        start, stop = maps[OFFSETS][i], maps[OFFSETS][i + 1]
+        return Schedule(*(maps[name][start:stop] for name in COLUMNS))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.schedule(i)
+
+    def column(self, name: str) -> np.ndarray:
+        """Whole column across every loan (memory-mapped, read-only)."""
+        return self.maps[name]
+
+
+def build_store(
+    directory: str,
+    loans: Iterable[tuple],
+    chunk_size: int = 5000,
+    payments_per_year: int = 12,
+) -> ScheduleStore:
+    """
+    Amortize `loans` chunk by chunk with the batch engine, appending each
+    chunk to a ScheduleStore so only one chunk is in memory at a time.
+
+    Each loan is a (principal, rate, years[, extra, lump, lump_month]) tuple.
+    """
+    store = ScheduleStore(directory)
+    it    = iter(loans)
+    while chunk := list(islice(it, chunk_size)):
+        store.append(generate_schedules(*loan_columns(chunk), payments_per_year))
+    return store
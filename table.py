@@ -1,4 +1,7 @@
-def print_schedule(schedule: list[dict], limit: int | None = None) -> None:
+from schedule import Schedule
+
+
+def print_schedule(schedule: Schedule | list[dict], limit: int | None = None) -> None:
     total = len(schedule)
 
     if limit is None or limit > total:
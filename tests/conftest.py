@@ -0,0 +1,49 @@
+"""
+conftest.py  –  Shared pytest setup: the flat modules live one level up.
+
+Fast paths are tested against their scalar references on seeded random
+inputs; random_loan and random_plan build those inputs from a Random.
+
+    python -m pytest -q tests
+"""
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mortgage import Mortgage
+
+SEEDS = range(5)
+
+
+def _random_loan(rng: random.Random) -> Mortgage:
+    """Random terms, including zero rates and one-year loans."""
+    return Mortgage(round(rng.uniform(1e5, 3e7), 2),
+                    rng.choice([0, 6.5, 8.5, round(rng.uniform(1, 15), 2)]),
+                    rng.randint(1, 30))
+
+
+def _random_plan(rng: random.Random, loan: Mortgage) -> tuple[float, float, int]:
+    """(extra, lump, lump_month), including no-ops and months past the term."""
+    extra = rng.choice([0.0, 0.0, 1000.0, round(rng.uniform(0, 5e4), 2)])
+    lump  = rng.choice([0.0, 0.0, round(rng.uniform(0, loan.principal), 2)])
+    return extra, lump, rng.randint(0, loan.total_payments() + 5)
+
+
+@pytest.fixture(params=SEEDS)
+def rng(request) -> random.Random:
+    """A seeded Random; tests using it run once per seed."""
+    return random.Random(request.param)
+
+
+@pytest.fixture
+def random_loan():
+    return _random_loan
+
+
+@pytest.fixture
+def random_plan():
+    return _random_plan
@@ -0,0 +1,27 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from amortization import generate_schedule
+from batch import batch_emi, generate_schedules, loan_columns
+
+
+def test_schedules_match_engine(rng, random_loan, random_plan):
+    loans = [random_loan(rng) for _ in range(100)]
+    plans = [random_plan(rng, loan) for loan in loans]
+    batch = generate_schedules(*loan_columns(
+        [(m.principal, m.annual_rate, m.years, *plan) for m, plan in zip(loans, plans)]))
+    for i, (loan, plan) in enumerate(zip(loans, plans)):
+        assert list(batch.schedule(i)) == list(generate_schedule(loan, *plan)), (loan, plan)
+
+
+def test_emi_matches_mortgage(rng, random_loan):
+    loans = [random_loan(rng) for _ in range(200)]
+    emis  = batch_emi([m.principal for m in loans], [m.annual_rate for m in loans],
+                      [m.years for m in loans])
+    assert emis.tolist() == [m.emi() for m in loans]
+
+
+def test_empty_batch():
+    batch = generate_schedules([], [], [])
+    assert len(batch) == 0
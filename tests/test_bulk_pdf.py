@@ -0,0 +1,52 @@
+import csv
+import os
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+import bulk_pdf
+
+LOAN   = {"principal": 500_000, "rate": 8.5, "years": 1}
+RENDER = bulk_pdf._render
+
+
+def _manifest(out: dict) -> list[dict]:
+    with open(out["manifest"], newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _crash_on_boom(job):
+    if job[0].get("id") == "boom":
+        os._exit(1)
+    return RENDER(job)
+
+
+def test_names_are_unique_and_bad_payloads_are_recorded(tmp_path):
+    payloads = [{**LOAN, "id": "A"}, {**LOAN, "id": "a"}, dict(LOAN),
+                {**LOAN, "id": "../etc"}, ["not", "a", "dict"], {"id": "no-terms"}]
+    out  = bulk_pdf.generate_reports(payloads, str(tmp_path), workers=1)
+    rows = _manifest(out)
+
+    assert (out["ok"], out["failed"]) == (4, 2)
+    paths = [r["path"] for r in rows if r["status"] == "ok"]
+    assert len({p.lower() for p in paths}) == 4
+    assert all(os.path.dirname(p) == str(tmp_path) and os.path.exists(p) for p in paths)
+    assert os.path.basename(paths[2]) == "000003.pdf"
+    assert any(r["error"].startswith("TypeError: payload 5") for r in rows)
+    assert any(r["id"] == "no-terms" and r["error"].startswith("KeyError") for r in rows)
+
+
+def test_dead_worker_fails_its_documents_only(tmp_path, monkeypatch):
+    # Workers are forked, so they see the patched _render
+    monkeypatch.setattr(bulk_pdf, "_render", _crash_on_boom)
+    payloads = [{**LOAN, "id": "boom"}] + [{**LOAN, "id": f"ok{i}"} for i in range(3)]
+    out  = bulk_pdf.generate_reports(payloads, str(tmp_path), workers=2)
+    rows = _manifest(out)
+
+    assert len(rows) == len(payloads)
+    assert out["ok"] + out["failed"] == len(payloads)
+    # The crash breaks the pool, so documents still in flight fail with it
+    for r in rows:
+        assert r["status"] == "ok" or "BrokenProcessPool" in r["error"], r
+    assert next(r for r in rows if r["id"] == "boom")["status"] == "failed"
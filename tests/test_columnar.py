@@ -0,0 +1,35 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from amortization import generate_schedule
+from columnar import loan_schedule, read_npz, write_npz
+from yearly_summary import generate_yearly_summary
+
+
+@pytest.mark.parametrize("compressed", [True, False])
+def test_npz_round_trip(tmp_path, rng, random_loan, random_plan, compressed):
+    loans = [random_loan(rng) for _ in range(12)]
+    plans = [random_plan(rng, m) for m in loans]
+    path  = str(tmp_path / "book.npz")
+    info  = write_npz(path, [(m.principal, m.annual_rate, m.years, *p)
+                             for m, p in zip(loans, plans)],
+                      compressed=compressed, chunk_size=5)
+    data  = read_npz(path)
+    assert info["loans"] == len(loans)
+
+    for loan_id, (loan, plan) in enumerate(zip(loans, plans), start=1):
+        schedule = generate_schedule(loan, *plan)
+        assert list(loan_schedule(data, loan_id)) == list(schedule)
+
+        rows   = data["yearly_loan_id"] == loan_id
+        yearly = [{"year": int(y), "interest": i, "principal": p, "balance": b}
+                  for y, i, p, b in zip(*(data[f"yearly_{c}"][rows].tolist()
+                                          for c in ("year", "interest", "principal", "balance")))]
+        assert yearly == generate_yearly_summary(schedule)
+
+
+def test_empty_book(tmp_path):
+    path = str(tmp_path / "empty.npz")
+    assert write_npz(path, [])["rows"] == 0
+    assert len(read_npz(path)["schedule_period"]) == 0
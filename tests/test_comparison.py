@@ -0,0 +1,52 @@
+import heapq
+
+import pytest
+
+from amortization import generate_schedule
+from comparison import CRITERIA, compare_loans, print_comparison, rank_offers
+
+
+def random_offers(rng, n: int) -> list[tuple]:
+    offers = [(round(rng.uniform(0, 3e7), 2),
+               rng.choice([0, 6.5, round(rng.uniform(0.01, 15), 2)]),
+               rng.randint(1, 30))
+              for _ in range(n)]
+    # Duplicates and zero principals force ties on every criterion
+    offers += [(1_000_000, 8.5, 20)] * 20 + [(0.0, 8.0, 10)] * 3
+    rng.shuffle(offers)
+    return offers
+
+
+def test_compare_loans_matches_schedule(rng, random_loan):
+    loans = [random_loan(rng) for _ in range(20)]
+    for res, loan in zip(compare_loans([(m.principal, m.annual_rate, m.years) for m in loans]),
+                         loans):
+        schedule = generate_schedule(loan)
+        assert res["months"] == len(schedule)
+        assert res["interest"] == pytest.approx(schedule.total_interest(), abs=0.01 * len(schedule))
+
+
+@pytest.mark.parametrize("top_k", [1, 10, 40])
+def test_rank_offers_matches_compare_loans(rng, top_k):
+    pytest.importorskip("numpy")
+    offers   = random_offers(rng, 3000)
+    results  = compare_loans(offers)
+    expected = {name: heapq.nsmallest(top_k, results, key=key) for name, key in CRITERIA.items()}
+
+    assert rank_offers(offers, top_k=top_k, workers=1) == expected
+    assert rank_offers(offers, top_k=top_k, workers=2,
+                       parallel_threshold=100, chunk_size=700) == expected
+
+
+def test_zero_principal_ranks_last_on_ratio(capsys):
+    pytest.importorskip("numpy")
+    ranked = rank_offers([(0.0, 8.0, 10), (100_000, 8.0, 10)], top_k=2, criteria=("ratio",))
+    assert [r["id"] for r in ranked["ratio"]] == [2, 1]
+
+    print_comparison(compare_loans([(0.0, 8.0, 10), (100_000, 8.0, 10)]))
+    assert "Best option: Loan 2" in capsys.readouterr().out
+
+
+def test_rank_offers_rejects_unknown_criteria():
+    with pytest.raises(ValueError):
+        rank_offers([(100_000, 8.0, 10)], criteria=("cheapest",))
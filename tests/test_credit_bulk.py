@@ -0,0 +1,106 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from credit_bulk import (INDIA_BANDS, US_BANDS, _classify, card_matrix, check_cards,
+                         luhn_valid, mask_numbers, read_cards, score_csv, score_customers)
+from credit_tool import (calculate_credit_score, classify_score, combine_cards,
+                         luhn_check, mask_number)
+
+
+def random_cards(rng, customers: int) -> list[dict]:
+    cards = []
+    for c in range(customers):
+        for _ in range(rng.choice([1, 1, 2, 3, 4, 6])):
+            cards.append({
+                "customer": f"C{c:04d}",
+                "limit":    rng.choice([0.0, round(rng.uniform(1e4, 5e5), 2)]),
+                "balance":  round(rng.uniform(0, 6e5), 2),
+                "late":     rng.choice([0, 0, 1, rng.randint(0, 60)]),
+                "age":      rng.randint(0, 30),
+                "default":  rng.random() < 0.1,
+            })
+    rng.shuffle(cards)      # customers interleaved, as in a bureau file
+    return cards
+
+
+def expected_scores(cards: list[dict]) -> dict[str, tuple]:
+    by_customer: dict[str, list[dict]] = {}
+    for card in cards:
+        by_customer.setdefault(card["customer"], []).append(card)
+    out = {}
+    for customer, own in by_customer.items():
+        score = calculate_credit_score(combine_cards(own))
+        out[customer] = (len(own), score, *classify_score(score))
+    return out
+
+
+def test_score_customers_matches_scalar(rng):
+    cards = random_cards(rng, 300)
+    res   = score_customers(*([c[k] for c in cards]
+                              for k in ("customer", "limit", "balance", "late", "age", "default")))
+    got   = dict(zip(res["customer"].tolist(),
+                     zip(res["cards"].tolist(), res["score"].tolist(),
+                         res["india"].tolist(), res["us"].tolist())))
+    assert got == expected_scores(cards)
+
+
+def test_score_csv_round_trip(tmp_path, rng):
+    cards = random_cards(rng, 50)
+    src   = tmp_path / "cards.csv"
+    src.write_text("customer,limit,balance,late,age,default\n" + "".join(
+        f"{c['customer']},{c['limit']},{c['balance']},{c['late']},{c['age']},"
+        f"{'yes' if c['default'] else 'no'}\n" for c in cards), encoding="utf-8")
+
+    assert read_cards(str(src))["default"].tolist() == [c["default"] for c in cards]
+    assert score_csv(str(src), str(tmp_path / "scores.csv")) == len(expected_scores(cards))
+
+
+@pytest.mark.parametrize("score", [300, 549, 550, 579, 580, 649, 650, 669, 670,
+                                   749, 750, 799, 800, 900])
+def test_bands_match_classify_score(score):
+    scores = np.array([score])
+    assert (str(_classify(scores, INDIA_BANDS)[0]),
+            str(_classify(scores, US_BANDS)[0])) == classify_score(score)
+
+
+# ── Card numbers ─────────────────────────────────────────────────────────────
+
+def random_pans(rng, n: int) -> list[str]:
+    pans = []
+    for _ in range(n):
+        pan = "".join(rng.choice("0123456789") for _ in range(rng.choice([3, 13, 15, 16, 19])))
+        pans.append(rng.choice([pan, " ".join(pan[i:i + 4] for i in range(0, len(pan), 4)),
+                                "-".join(pan[i:i + 4] for i in range(0, len(pan), 4))]))
+    return pans
+
+
+def expected_cards(pans: list[str]) -> tuple[list, list]:
+    return [luhn_check(p) for p in pans], [mask_number(p) for p in pans]
+
+
+def as_lists(valid, masked) -> tuple[list, list]:
+    return valid.tolist(), [m.decode() for m in masked.tolist()]
+
+
+def test_check_cards_mixed_formats(rng):
+    pans = random_pans(rng, 500)
+    assert as_lists(*check_cards(("\n".join(pans) + "\n").encode())) == expected_cards(pans)
+    assert as_lists(*check_cards(pans)) == expected_cards(pans)
+
+
+def test_fixed_width_digits(rng):
+    pans  = ["".join(rng.choice("0123456789") for _ in range(16)) for _ in range(500)]
+    chars = card_matrix("\n".join(pans).encode())
+    assert chars.base is not None                       # reshaped, not copied
+    assert as_lists(luhn_valid(chars), mask_numbers(chars)) == expected_cards(pans)
+
+
+def test_non_ascii_numbers():
+    pans = ["4111 1111 1111 1111", "٤١١١١١١١١١١١١١١١", "4111–1111–1111–1111", "12é"]
+    valid, masked = as_lists(*check_cards(pans))
+    ref_valid, ref_masked = expected_cards(pans)
+    assert valid == ref_valid
+    # mask_number keeps the original digit characters; the bulk mask is ASCII
+    assert masked == ["".join(str(int(ch)) if ch.isdecimal() else ch for ch in m)
+                      for m in ref_masked]
@@ -0,0 +1,41 @@
+import csv
+import gzip
+import os
+
+import pytest
+
+from amortization import generate_schedule
+from export import export_portfolio_csv
+from mortgage import Mortgage
+
+
+def _read(path: str) -> list[dict]:
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+@pytest.mark.parametrize("compression, shard_size", [(None, None), ("gzip", 2)])
+def test_portfolio_schedule_matches_engine(tmp_path, rng, random_loan, random_plan,
+                                           compression, shard_size):
+    loans = [random_loan(rng) for _ in range(5)]
+    plans = [random_plan(rng, m) for m in loans]
+    out   = export_portfolio_csv(str(tmp_path), [(m.principal, m.annual_rate, m.years, *p)
+                                                 for m, p in zip(loans, plans)],
+                                 compression=compression, shard_size=shard_size,
+                                 buffer_rows=7)
+
+    rows = [r for path in out["files"] if os.path.basename(path).startswith("schedule")
+            for r in _read(path)]
+    expected = [
+        (str(i), str(row["period"]), f"{row['payment']:.2f}", f"{row['balance']:.2f}")
+        for i, (m, p) in enumerate(zip(loans, plans), start=1)
+        for row in generate_schedule(m, *p)
+    ]
+    assert [(r["loan_id"], r["month"], r["payment"], r["balance"]) for r in rows] == expected
+    assert out["loans"] == len(loans)
+
+
+def test_unknown_compression(tmp_path):
+    with pytest.raises(ValueError):
+        export_portfolio_csv(str(tmp_path), [(1_000_000, 8.5, 5)], compression="lz4")
@@ -0,0 +1,86 @@
+import pytest
+
+from floating import (MODES, _annuity, _periods_needed, floating_payoff, floating_payoff_paths,
+                      rate_segments)
+from mortgage import Mortgage
+
+
+def stepped(mortgage, resets, mode: str, max_years: int = 40) -> tuple[int, float]:
+    """(months, total interest) stepping every period with the engine's rules."""
+    ppy, end = mortgage.payments_per_year, mortgage.total_payments()
+    limit    = max_years * ppy
+    changes  = dict(rate_segments(mortgage.annual_rate, resets))
+    balance, emi, r = mortgage.principal, None, 0.0
+    period, interest_paid = 0, 0.0
+    while balance > 0 and period < end:
+        period += 1
+        if period in changes:
+            r = changes[period] / 100 / ppy
+            if mode == "emi" or emi is None:
+                emi = _annuity(balance, r, end - period + 1)
+            elif period - 1 + _periods_needed(balance, r, emi) > limit:
+                end, emi = limit, _annuity(balance, r, limit - period + 1)
+            else:
+                end = period - 1 + _periods_needed(balance, r, emi)
+        interest = balance * r
+        interest_paid += interest
+        balance = 0.0 if emi - interest >= balance else balance - (emi - interest)
+    return period, interest_paid
+
+
+def random_paths(rng, loan: Mortgage, n: int, every: int) -> tuple[list[int], list[list[float]]]:
+    """Shared reset periods and a random walk of rates for each path, 0% to 18%."""
+    periods = list(range(1 + every, loan.total_payments(), every))
+    paths   = []
+    for _ in range(n):
+        rate, path = loan.annual_rate, []
+        for _ in periods:
+            rate = min(max(rate + rng.gauss(0, 0.6), 0.0), 18.0)
+            path.append(round(rate, 2))
+        paths.append(path)
+    return periods, paths
+
+
+LOANS = [Mortgage(5_000_000, 8.5, 20), Mortgage(800_000, 0, 5), Mortgage(3_000_000, 12.0, 30)]
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("every", [3, 12, 61])
+@pytest.mark.parametrize("loan", LOANS, ids=["20y", "zero-rate", "30y"])
+def test_floating_payoff_matches_stepping(rng, loan, mode, every):
+    periods, paths = random_paths(rng, loan, 8, every)
+    for rates in paths:
+        months, interest = stepped(loan, list(zip(periods, rates)), mode)
+        fast = floating_payoff(loan, list(zip(periods, rates)), mode)
+        assert fast["months"] == months
+        assert fast["total_interest"] == pytest.approx(interest, rel=1e-6, abs=1e-6)
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("every", [3, 12])
+@pytest.mark.parametrize("loan", LOANS, ids=["20y", "zero-rate", "30y"])
+def test_paths_match_floating_payoff(rng, loan, mode, every):
+    pytest.importorskip("numpy")
+    periods, paths = random_paths(rng, loan, 40, every)
+    many = floating_payoff_paths(loan, periods, paths, mode)
+    for i, rates in enumerate(paths):
+        one = floating_payoff(loan, list(zip(periods, rates)), mode, detail=False)
+        assert many["months"][i] == one["months"]
+        assert many["total_interest"][i] == pytest.approx(one["total_interest"], rel=1e-9, abs=1e-6)
+        assert many["max_emi"][i] == pytest.approx(one["max_emi"], rel=1e-9)
+
+
+def test_tenure_mode_caps_the_term():
+    loan = Mortgage(5_000_000, 6.0, 20)
+    res  = floating_payoff(loan, [(13, 14.0)], "tenure", max_years=25)
+    assert res["months"] == 25 * 12 == stepped(loan, [(13, 14.0)], "tenure", 25)[0]
+    assert res["max_emi"] > loan.emi()
+
+
+def test_unsorted_and_opening_resets():
+    loan = Mortgage(2_000_000, 8.0, 10)
+    assert (floating_payoff(loan, [(25, 9.0), (1, 7.5), (13, 8.25)], detail=False)
+            == floating_payoff(Mortgage(2_000_000, 7.5, 10), [(13, 8.25), (25, 9.0)],
+                               detail=False))
+    with pytest.raises(ValueError):
+        floating_payoff(loan, [], mode="fixed")
@@ -0,0 +1,76 @@
+import csv
+import json
+
+import headless
+import progress
+
+GOOD = {"score": 780, "principal": 5_000_000, "years": 20, "income": 200_000}
+
+
+def _run(tmp_path, lines: list[str]) -> tuple[dict, list[dict]]:
+    src = tmp_path / "loans.jsonl"
+    src.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    out   = tmp_path / "results.jsonl"
+    stats = headless.run_batch(str(src), str(out))
+    return stats, [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+
+
+def test_bad_rows_become_error_rows(tmp_path):
+    rows = [
+        {**GOOD, "id": "ok"},
+        {**GOOD, "id": "long", "years": 20_000},
+        {**GOOD, "id": "inf", "principal": "inf"},
+        {**GOOD, "id": "no-income", "income": 0},
+        {**GOOD, "id": "neg-lump", "lump": -5},
+        {**GOOD, "id": "denied", "score": 400},
+    ]
+    stats, results = _run(tmp_path, [json.dumps(r) for r in rows] + ["{not json", "[1, 2]"])
+
+    assert [r["status"] for r in results] == (
+        ["APPROVED", "ERROR", "ERROR", "ERROR", "ERROR", "DENIED", "ERROR", "ERROR"])
+    assert results[1]["error"] == "ValueError: years must be between 1 and 50"
+    assert [r["id"] for r in results[-2:]] == ["row 7", "row 8"]
+    assert (stats["rows"], stats["errors"]) == (8, 6)
+
+
+def test_arithmetic_errors_do_not_stop_the_run(tmp_path, monkeypatch):
+    evaluate = headless.evaluate
+
+    def overflow_on_boom(row):
+        if row["id"] == "boom":
+            raise OverflowError("(34, 'Numerical result out of range')")
+        return evaluate(row)
+
+    monkeypatch.setattr(headless, "evaluate", overflow_on_boom)
+    _, results = _run(tmp_path, [json.dumps({**GOOD, "id": i}) for i in ("a", "boom", "b")])
+    assert [r["status"] for r in results] == ["APPROVED", "ERROR", "APPROVED"]
+    assert results[1]["error"].startswith("OverflowError")
+
+
+def test_csv_output_columns(tmp_path):
+    src = tmp_path / "loans.csv"
+    with open(src, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=["id", *GOOD])
+        w.writeheader()
+        w.writerow({"id": "c1", **GOOD})
+    out = tmp_path / "out.csv"
+    headless.run_batch(str(src), str(out))
+    with open(out, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        assert tuple(reader.fieldnames) == headless.OUTPUT_FIELDS
+        assert next(reader)["status"] == "APPROVED"
+
+
+def test_timings_flag_turns_recording_on(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(progress, "_record", False)
+    progress.clear_timings()
+    src = tmp_path / "loans.jsonl"
+    src.write_text(json.dumps(GOOD) + "\n", encoding="utf-8")
+
+    headless.cli([str(src), "-o", str(tmp_path / "plain.jsonl")])
+    assert progress.timings() == []
+
+    headless.cli([str(src), "-o", str(tmp_path / "timed.jsonl"), "--timings"])
+    assert progress.timings()
+    assert "wall" in capsys.readouterr().err
+    progress.clear_timings()
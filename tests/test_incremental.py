@@ -0,0 +1,25 @@
+from amortization import generate_schedule
+from incremental import IncrementalSchedule
+from mortgage import Mortgage
+
+
+def test_matches_generate_schedule(rng, random_loan, random_plan):
+    loan   = random_loan(rng)
+    engine = IncrementalSchedule(loan, keep=4)
+    extra, lump, month = random_plan(rng, loan)
+    plans  = [(extra, lump, month), (extra, lump, month + 6), (extra, lump / 2, month),
+              (extra, 0.0, 0), random_plan(rng, loan), (extra, lump, month)]
+    plans += [random_plan(rng, loan) for _ in range(10)]
+
+    for plan in plans:
+        assert list(engine.schedule(*plan)) == list(generate_schedule(loan, *plan))
+
+
+def test_reuses_prefix_when_only_the_lump_moves():
+    loan   = Mortgage(2_000_000, 8.5, 20)
+    engine = IncrementalSchedule(loan)
+    engine.schedule(0.0, 100_000, 60)
+    moved  = engine.schedule(0.0, 100_000, 72)
+
+    assert engine.reused == 59             # months before the earlier lump
+    assert list(moved) == list(generate_schedule(loan, 0.0, 100_000, 72))
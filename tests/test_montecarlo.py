@@ -0,0 +1,45 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from montecarlo import METRICS, simulate
+from mortgage import Mortgage
+
+LOAN = Mortgage(5_000_000, 8.5, 20)
+
+
+@pytest.mark.parametrize("mode", ["emi", "tenure"])
+def test_seed_gives_same_result_for_any_worker_count(mode):
+    kwargs = dict(paths=2_500, mode=mode, seed=7, chunk_size=600, keep_samples=True)
+    one    = simulate(LOAN, workers=1, **kwargs)
+    two    = simulate(LOAN, workers=2, **kwargs)
+
+    for metric in METRICS:
+        assert np.array_equal(one["samples"][metric], two["samples"][metric])
+    assert {k: v for k, v in one.items() if k != "samples"} == \
+           {k: v for k, v in two.items() if k != "samples"}
+
+
+def test_seeds_differ_and_repeat():
+    first  = simulate(LOAN, paths=500, seed=1, workers=1, keep_samples=True)["samples"]
+    again  = simulate(LOAN, paths=500, seed=1, workers=1, keep_samples=True)["samples"]
+    other  = simulate(LOAN, paths=500, seed=2, workers=1, keep_samples=True)["samples"]
+    assert np.array_equal(first["total_interest"], again["total_interest"])
+    assert not np.array_equal(first["total_interest"], other["total_interest"])
+
+
+def test_zero_volatility_is_the_fixed_rate_loan():
+    res = simulate(LOAN, paths=50, vol=0.0, workers=1)
+    assert res["months"]["mean"] == LOAN.total_payments()
+    assert res["emi"]["mean"] == pytest.approx(LOAN.emi())
+
+
+@pytest.mark.parametrize("resets", [0, -4, 13])
+def test_resets_per_year_must_fit_the_payment_frequency(resets):
+    with pytest.raises(ValueError):
+        simulate(LOAN, paths=10, resets_per_year=resets, workers=1)
+
+
+@pytest.mark.parametrize("resets", [1, 12])
+def test_resets_per_year_bounds_are_accepted(resets):
+    assert simulate(LOAN, paths=10, resets_per_year=resets, workers=1)["paths"] == 10
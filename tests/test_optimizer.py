@@ -0,0 +1,31 @@
+import pytest
+
+from mortgage import Mortgage
+from optimizer import optimize_prepayment
+from prepayment import solve_payoff
+
+
+def test_every_lump_is_paid_before_payoff():
+    loan   = Mortgage(2_000_000, 9.0, 5)
+    result = optimize_prepayment(loan, cash_now=500_000, monthly_budget=60_000, steps=4)
+    for s in result["pareto"]:
+        if s["lump"]:
+            assert s["lump_month"] <= solve_payoff(loan, s["extra"])["months"]
+            assert s["lump_month"] <= s["months"]
+
+
+def test_best_saves_the_most_interest():
+    loan   = Mortgage(3_000_000, 8.5, 10)
+    result = optimize_prepayment(loan, cash_now=300_000, monthly_budget=10_000, steps=3)
+    best   = result["best"]
+    assert best == result["pareto"][0]
+    assert best["interest_saved"] == pytest.approx(
+        result["baseline"]["total_interest"] - solve_payoff(
+            loan, best["extra"], best["lump"], best["lump_month"])["total_interest"])
+    liquidity = [s["liquidity_kept"] for s in result["pareto"]]
+    assert liquidity == sorted(liquidity)
+
+
+def test_steps_must_be_positive():
+    with pytest.raises(ValueError):
+        optimize_prepayment(Mortgage(1_000_000, 8.0, 5), 100_000, 5_000, steps=0)
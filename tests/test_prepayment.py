@@ -0,0 +1,24 @@
+import pytest
+
+from amortization import generate_schedule
+from prepayment import prepayment_savings, solve_payoff
+
+
+def test_solve_payoff_matches_schedule(rng, random_loan, random_plan):
+    for _ in range(200):
+        loan = random_loan(rng)
+        plan = random_plan(rng, loan)
+        schedule = generate_schedule(loan, *plan)
+        solved   = solve_payoff(loan, *plan)
+        assert solved["months"] == len(schedule), (loan, plan)
+        # The schedule rounds every row to the paisa; the solver does not
+        assert solved["total_interest"] == pytest.approx(
+            schedule.total_interest(), abs=0.01 * len(schedule)), (loan, plan)
+
+
+def test_savings_are_never_negative(rng, random_loan, random_plan):
+    for _ in range(100):
+        loan    = random_loan(rng)
+        savings = prepayment_savings(loan, *random_plan(rng, loan))
+        assert savings["months_saved"] >= 0
+        assert savings["interest_saved"] >= -1e-6
@@ -0,0 +1,31 @@
+import pytest
+
+import progress
+
+
+@pytest.fixture(autouse=True)
+def fresh(monkeypatch):
+    monkeypatch.setattr(progress, "_display", False)
+    monkeypatch.setattr(progress, "_record",  False)
+    progress.clear_timings()
+    yield
+    progress.clear_timings()
+
+
+def test_stages_are_no_ops_by_default():
+    with progress.stage("quiet", 3) as st:
+        st.advance(3)
+    assert st is progress.NULL_STAGE
+    assert progress.timings() == []
+
+
+def test_recording_keeps_units_and_times(capsys):
+    progress.configure(record=True)
+    with progress.stage("counted", 5, "loans") as st:
+        st.advance(2)
+        st.advance(3)
+
+    [t] = progress.timings()
+    assert (t["stage"], t["units"], t["unit"]) == ("counted", 5, "loans")
+    assert t["wall"] >= 0 and t["cpu"] >= 0
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,121 @@
+import asyncio
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+
+from amortization import generate_schedule
+from mortgage import Mortgage
+from server import MAX_BODY, MAX_CARDS, MAX_LOANS, QuoteServer
+from yearly_summary import generate_summary
+
+LOAN     = {"principal": 2_500_000, "rate": 8.5, "years": 15}
+MORTGAGE = Mortgage(2_500_000, 8.5, 15)
+
+
+@pytest.fixture(scope="module")
+def port():
+    quotes = QuoteServer(workers=1)
+    loop   = asyncio.new_event_loop()
+    server = loop.run_until_complete(asyncio.start_server(quotes.handle, "127.0.0.1", 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield server.sockets[0].getsockname()[1]
+
+    async def shutdown():
+        server.close()
+        await server.wait_closed()
+        handlers = asyncio.all_tasks() - {asyncio.current_task()}
+        for task in handlers:
+            task.cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+
+    asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+    quotes.pool.shutdown()
+
+
+def _post(port: int, path: str, payload) -> tuple[int, str]:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    try:
+        conn.request("POST", path, body=json.dumps(payload),
+                     headers={"Content-Type": "application/json"})
+        res = conn.getresponse()
+        return res.status, res.read().decode()
+    finally:
+        conn.close()
+
+
+def _raw(port: int, data: bytes) -> bytes:
+    with socket.create_connection(("127.0.0.1", port), timeout=10) as sock:
+        sock.sendall(data)
+        chunks = []
+        while chunk := sock.recv(65536):
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def test_emi_and_keep_alive(port):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    for _ in range(3):                                    # same connection each time
+        conn.request("GET", "/emi?principal=2500000&rate=8.5&years=15")
+        res = conn.getresponse()
+        assert res.status == 200
+        assert json.loads(res.read()) == {"emi": round(MORTGAGE.emi(), 2), "months": 180}
+    conn.close()
+
+
+def test_schedule_streams_engine_rows(port):
+    plan = {"extra": 5000, "lump": 200_000, "lump_month": 24}
+    status, body = _post(port, "/schedule", {**LOAN, **plan})
+    assert status == 200
+    rows = [json.loads(line) for line in body.splitlines()]
+    assert rows == list(generate_schedule(MORTGAGE, 5000, 200_000, 24))
+
+
+def test_yearly_has_one_source(port):
+    _, plain = _post(port, "/yearly", LOAN)
+    _, zero  = _post(port, "/yearly", {**LOAN, "extra": 0})
+    assert json.loads(plain) == json.loads(zero) == generate_summary(
+        generate_schedule(MORTGAGE))
+
+
+@pytest.mark.parametrize("path, payload", [
+    ("/emi",          {**LOAN, "rate": "inf"}),
+    ("/emi",          {**LOAN, "principal": "nan"}),
+    ("/emi",          {**LOAN, "years": 51}),
+    ("/schedule",     {**LOAN, "extra": -1}),
+    ("/schedule",     {**LOAN, "lump": "inf"}),
+    ("/yearly",       {**LOAN, "bucket": "decade"}),
+    ("/compare",      {"loans": [[1_000_000, 8.5, 10]] * (MAX_LOANS + 1)}),
+    ("/compare",      {"loans": [[1_000_000, 8.5]]}),
+    ("/credit-score", {"cards": [{}] * (MAX_CARDS + 1)}),
+    ("/credit-score", {"cards": "visa"}),
+    ("/emi",          [1, 2, 3]),
+])
+def test_bad_input_is_400(port, path, payload):
+    status, body = _post(port, path, payload)
+    assert status == 400, body
+
+
+@pytest.mark.parametrize("request_bytes", [
+    b"NONSENSE\r\n\r\n",
+    b"GET /emi HTTP/1.1\r\nContent-Length: abc\r\n\r\n",
+    b"POST /emi HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % (MAX_BODY + 1),
+    b"GET /" + b"x" * 100_000 + b" HTTP/1.1\r\n\r\n",
+])
+def test_malformed_requests_get_400_and_close(port, request_bytes):
+    reply = _raw(port, request_bytes)
+    assert reply.startswith(b"HTTP/1.1 400 ")
+    assert b"Connection: close" in reply
+
+
+def test_credit_score_and_unknown_path(port):
+    card = {"limit": 100_000, "balance": 20_000, "late": 0, "age": 8, "default": False}
+    status, body = _post(port, "/credit-score", {"cards": [card, card]})
+    assert status == 200 and json.loads(body)["tier"].startswith("TIER")
+    assert _post(port, "/nowhere", {})[0] == 404
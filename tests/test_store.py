@@ -0,0 +1,29 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from amortization import generate_schedule
+from store import ScheduleStore, build_store
+
+
+def test_store_matches_engine(tmp_path, rng, random_loan, random_plan):
+    loans = [random_loan(rng) for _ in range(15)]
+    plans = [random_plan(rng, m) for m in loans]
+    terms = [(m.principal, m.annual_rate, m.years, *p) for m, p in zip(loans, plans)]
+
+    build_store(str(tmp_path), terms[:10], chunk_size=4)
+    build_store(str(tmp_path), terms[10:], chunk_size=4)   # appends to the same store
+    store = ScheduleStore(str(tmp_path))
+
+    expected = [generate_schedule(m, *p) for m, p in zip(loans, plans)]
+    assert len(store) == len(loans)
+    assert store.rows == sum(len(s) for s in expected)
+    assert [list(s) for s in store] == [list(s) for s in expected]
+    assert store.column("interest").sum() == pytest.approx(sum(s.total_interest() for s in expected))
+
+
+def test_empty_store_and_bounds(tmp_path):
+    store = ScheduleStore(str(tmp_path))
+    assert len(store) == 0 and store.rows == 0
+    with pytest.raises(IndexError):
+        store.schedule(0)
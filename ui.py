@@ -11,9 +11,10 @@ Design language (from mockups):
 """
 
 import os
-import time
 from datetime import date, timedelta
 
+from schedule import Schedule
+
 W = 76   # display width
 
 
@@ -179,7 +180,8 @@ def bordered_table(headers: list[str], rows: list[list[str]],
 
 # ── Amortization schedule table ───────────────────────────────────────────────
 
-def amort_table(schedule: list[dict], limit: int | None = None) -> None:
+def amort_table(schedule: Schedule | list[dict], limit: int | None = None) -> None:
+    """schedule: Schedule or list[dict] of amortization rows."""
     total  = len(schedule)
     limit  = min(limit or total, total)
 
@@ -375,17 +377,6 @@ def notice(icon: str, msg: str) -> None:
     print(f"  {icon}  {msg}")
 
 
-# ── Processing bar ────────────────────────────────────────────────────────────
-
-def processing_bar(msg: str, steps: int = 20, delay: float = 0.04) -> None:
-    print(f"\n  [!] {msg}...")
-    print("  [", end="", flush=True)
-    for _ in range(steps):
-        time.sleep(delay)
-        print("█", end="", flush=True)
-    print("] 100% Complete.")
-
-
 # ── Prepayment impact block ───────────────────────────────────────────────────
 
 def prepayment_impact(months_saved: int, interest_saved: float,
@@ -1,21 +1,171 @@
-def generate_yearly_summary(
-    schedule: list[dict],
-    payments_per_year: int = 12,
-) -> list[dict]:
-    summary = []
+from typing import Iterable
+
+from mortgage import Mortgage
+from schedule import Schedule
+
+# Bucket name → buckets per year; the name is also the row key
+BUCKETS = {"year": 1, "quarter": 4, "month": 12}
+
+
+def _bucket_end(b: int, payments_per_year: int, bucket: str) -> int:
+    """
+    Payments made by the end of bucket b (1-based), before capping at the
+    term: payment k falls due at k / payments_per_year years, so it lands
+    in the first bucket ending at or after that time.
+    """
+    return b * payments_per_year // BUCKETS[bucket]
+
+
+def bucket_bounds(periods: int, payments_per_year: int = 12,
+                  bucket: str = "year") -> list[tuple[int, int, int]]:
+    """
+    (bucket number, first period index, end period index) for every
+    bucket of a `periods`-long schedule that holds at least one payment.
 
-    for year_start in range(0, len(schedule), payments_per_year):
-        year_slice = schedule[year_start : year_start + payments_per_year]
-        year_num   = year_start // payments_per_year + 1
+    Indices are 0-based and end-exclusive; the last bucket may be partial.
+    Buckets need not hold a whole number of payments (e.g. quarterly
+    buckets of a fortnightly loan).
+    """
+    bounds, start, b = [], 0, 0
+    while start < periods:
+        b  += 1
+        end = min(_bucket_end(b, payments_per_year, bucket), periods)
+        if end > start:
+            bounds.append((b, start, end))
+            start = end
+    return bounds
 
-        summary.append({
-            "year":      year_num,
-            "interest":  round(sum(p["interest"]  for p in year_slice), 2),
-            "principal": round(sum(p["principal"] for p in year_slice), 2),
-            "balance":   year_slice[-1]["balance"],
+
+class YearlyAccumulator:
+    """
+    Builds the yearly (or quarterly / monthly) summary one schedule row at
+    a time.
+
+    Lets a single pass over a schedule (or a stream from iter_schedule)
+    produce the rollup without keeping the rows around.
+    """
+    __slots__ = ("payments_per_year", "bucket", "summary", "_interest",
+                 "_principal", "_balance", "_count", "_start", "_bucket", "_end")
+
+    def __init__(self, payments_per_year: int = 12, bucket: str = "year") -> None:
+        self.payments_per_year = payments_per_year
+        self.bucket = bucket
+        self.summary: list[dict] = []
+        self._interest  = 0
+        self._principal = 0
+        self._balance   = 0.0
+        self._count     = 0
+        self._start     = 0
+        self._bucket    = 0
+        self._end       = 0
+        self._next_bucket()
+
+    def add(self, row: dict) -> None:
+        self._interest  += row["interest"]
+        self._principal += row["principal"]
+        self._balance    = row["balance"]
+        self._count     += 1
+        if self._count == self._end:
+            self._close_bucket()
+
+    def finish(self) -> list[dict]:
+        """Close any partial final bucket and return the summary."""
+        if self._count > self._start:
+            self._close_bucket()
+        return self.summary
+
+    def _next_bucket(self) -> None:
+        """Move on to the next bucket that holds at least one payment."""
+        while self._end <= self._count:
+            self._bucket += 1
+            self._end = _bucket_end(self._bucket, self.payments_per_year, self.bucket)
+
+    def _close_bucket(self) -> None:
+        self.summary.append({
+            self.bucket: self._bucket,
+            "interest":  round(self._interest,  2),
+            "principal": round(self._principal, 2),
+            "balance":   self._balance,
         })
+        self._interest  = 0
+        self._principal = 0
+        self._start     = self._count
+        self._next_bucket()
+
 
-    return summary
+def _from_columns(schedule: Schedule, payments_per_year: int, bucket: str) -> list[dict]:
+    """Segment sums over the Schedule's columns: one C-level sum per bucket."""
+    interest, principal, balance = schedule.interest, schedule.principal, schedule.balance
+    return [
+        {
+            bucket:      b,
+            "interest":  round(sum(interest[start:end]),  2),
+            "principal": round(sum(principal[start:end]), 2),
+            "balance":   balance[end - 1],
+        }
+        for b, start, end in bucket_bounds(len(schedule), payments_per_year, bucket)
+    ]
+
+
+def _closed_form(mortgage: Mortgage, bucket: str) -> list[dict]:
+    """Bucket totals from annuity balances at each bucket end; no periods built."""
+    emi          = mortgage.emi()
+    rows, before = [], mortgage.principal
+    for b, start, end in bucket_bounds(mortgage.total_payments(),
+                                       mortgage.payments_per_year, bucket):
+        balance   = mortgage.balance_at(end)
+        principal = before - balance
+        rows.append({
+            bucket:      b,
+            "interest":  round(emi * (end - start) - principal, 2),
+            "principal": round(principal, 2),
+            "balance":   round(balance, 2),
+        })
+        before = balance
+    return rows
+
+
+def generate_summary(
+    source: Schedule | Iterable[dict] | Mortgage,
+    payments_per_year: int | None = None,
+    bucket: str = "year",
+) -> list[dict]:
+    """
+    Roll a schedule up into "year", "quarter" or "month" buckets.
+
+    A Schedule is reduced column by column; a list or stream of row dicts
+    goes through YearlyAccumulator.  A Mortgage (no prepayment) is
+    summarized in closed form without generating periods, using its own
+    payments_per_year; its figures are the unrounded annuity and can
+    differ from the rounded engine schedule by a few paise.
+
+    payments_per_year defaults to 12 for schedules; for a Mortgage it may
+    be omitted but must match the loan's own if given.
+    """
+    if bucket not in BUCKETS:
+        raise ValueError(f"bucket must be one of: {', '.join(BUCKETS)}")
+    if isinstance(source, Mortgage):
+        if payments_per_year not in (None, source.payments_per_year):
+            raise ValueError(f"payments_per_year={payments_per_year} does not match "
+                             f"the mortgage's {source.payments_per_year}")
+        return _closed_form(source, bucket)
+    if payments_per_year is None:
+        payments_per_year = 12
+    if isinstance(source, Schedule):
+        return _from_columns(source, payments_per_year, bucket)
+
+    acc = YearlyAccumulator(payments_per_year, bucket)
+    for row in source:
+        acc.add(row)
+    return acc.finish()
+
+
+def generate_yearly_summary(
+    schedule: Schedule | Iterable[dict] | Mortgage,
+    payments_per_year: int | None = None,
+) -> list[dict]:
+    """Roll a schedule, list of rows, row stream or Mortgage up into yearly totals."""
+    return generate_summary(schedule, payments_per_year, "year")
 
 
 def print_yearly_summary(summary: list[dict]) -> None:
@@ -29,7 +179,10 @@ def print_yearly_summary(summary: list[dict]) -> None:
     )
     print("-" * 70)
 
+    total_interest = total_principal = 0
     for row in summary:
+        total_interest  += row["interest"]
+        total_principal += row["principal"]
         print(
             f"{row['year']:<6}"
             f"{row['interest']:>18.2f}"
@@ -38,12 +191,9 @@ def print_yearly_summary(summary: list[dict]) -> None:
         )
 
     print("-" * 70)
-
-    total_interest  = sum(r["interest"]  for r in summary)
-    total_principal = sum(r["principal"] for r in summary)
     print(
         f"{'TOTAL':<6}"
         f"{total_interest:>18.2f}"
         f"{total_principal:>18.2f}"
     )
-    print("-" * 70)
\ No newline at end of file
+    print("-" * 70)